@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""benchmark.py
+
+Timing measurements for the Diffie-Hellman group generation and key
+exchange within this folder.
+"""
+
+from __future__ import absolute_import
+from asyncio import run
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count, remove
+from random import getrandbits
+from tempfile import gettempdir
+from time import perf_counter
+from dh_groups import generate_group, safe_prime
+from discrete_log import (
+    audit_group,
+    baby_step_giant_step,
+    discrete_log,
+    pollard_rho_log,
+)
+from dh_service import HandshakeServer, load
+from diffie_hellman import DiffieHellman
+from fixed_base import FixedBase
+from primality_test import is_prime, random_prime, seeded_generator
+
+
+def naive_safe_prime(bits, gen):
+    """
+    Draws primes `q` until `2q + 1` is also prime.
+
+    Args:
+        bits:   bit length of the safe prime.
+        gen:    generator with a `random_bytes` method.
+
+    Returns:
+        The safe prime.
+    """
+    while True:
+        p = 2 * random_prime(bits - 1, gen=gen) + 1
+        if is_prime(p):
+            return p
+
+
+def bench_safe_prime(sizes=(256, 512, 768), count=3):
+    """
+    Compares drawing primes until one of them is a Sophie Germain prime
+    with sieving both `q` and `2q + 1` at once.
+    """
+    gen = seeded_generator()
+    for bits in sizes:
+        start = perf_counter()
+        for _ in range(count):
+            naive_safe_prime(bits, gen)
+        before = (perf_counter() - start) / count
+        start = perf_counter()
+        for _ in range(count):
+            safe_prime(bits, 1, gen)
+        after = (perf_counter() - start) / count
+        print(
+            "{} bits\tprime then 2q + 1: {:.2f} s\tdouble sieve: {:.2f} s"
+            "\tspeedup: {:.1f}x".format(bits, before, after, before / after)
+        )
+
+
+def bench_public_key(sizes=(1024, 2048, 3072), count=200):
+    """
+    Compares computing public keys with `pow` with the comb tables shared
+    by every key of a group, including the time to build them once.
+    """
+    for bits in sizes:
+        p, g = random_prime(bits), 4
+        privates = [getrandbits(bits) for _ in range(count)]
+        start = perf_counter()
+        for x in privates:
+            DiffieHellman(x, p, g, precompute=False).gen_public_key()
+        before = (perf_counter() - start) / count
+
+        start = perf_counter()
+        FixedBase(p, g)
+        tables = perf_counter() - start
+        start = perf_counter()
+        for x in privates:
+            DiffieHellman(x, p, g).gen_public_key()
+        after = (perf_counter() - start) / count
+        print(
+            "{} bits\tpow: {:.2f} ms\tcomb: {:.2f} ms\tspeedup: {:.1f}x"
+            "\ttables built in {:.0f} ms".format(
+                bits, before * 1e3, after * 1e3, before / after, tables * 1e3
+            )
+        )
+
+
+async def handshake_load(p, g, concurrency, handshakes, unix):
+    """
+    Starts a server and a load generator in the current event loop, each
+    with its own process pool.
+
+    Args:
+        p, g:           group of the server.
+        concurrency:    as described in `dh_service.load`.
+        handshakes:     as described in `dh_service.load`.
+        unix:           whether to use a Unix socket instead of TCP.
+
+    Returns:
+        A `LoadReport` tuple.
+    """
+    workers = max(1, (cpu_count() or 1) // 2)
+    path = "{}/dh_service_benchmark.sock".format(gettempdir())
+    with ProcessPoolExecutor(workers) as server_pool, ProcessPoolExecutor(
+        workers
+    ) as client_pool:
+        server = HandshakeServer(p, g, server_pool)
+        address = await server.start(path=path if unix else None)
+        # warms up the workers and their comb tables
+        await load(address, 2 * workers, workers, client_pool)
+        report = await load(address, handshakes, concurrency, client_pool)
+        await server.close()
+    if unix:
+        remove(path)
+    return report
+
+
+def bench_handshake(sizes=(1024, 2048), levels=(1, 8, 64), handshakes=200):
+    """
+    Measures throughput and latency of handshakes with `dh_service.py`,
+    over TCP and Unix sockets, for several group sizes and numbers of
+    concurrent clients.
+    """
+    for bits in sizes:
+        p, g = random_prime(bits), 4
+        for unix in [False, True]:
+            for concurrency in levels:
+                report = run(
+                    handshake_load(p, g, concurrency, handshakes, unix)
+                )
+                print(
+                    "{} bits\t{}\t{:>3} clients\t{:>7.1f} handshakes/s"
+                    "\tp50: {:>7.1f} ms\tp99: {:>7.1f} ms".format(
+                        bits,
+                        "unix" if unix else "tcp",
+                        concurrency,
+                        report.handshakes / report.seconds,
+                        report.p50 * 1e3,
+                        report.p99 * 1e3,
+                    )
+                )
+
+
+def subgroup(order_bits, bits=256):
+    """
+    Args:
+        order_bits: bit length of the prime order `q`.
+        bits:       bit length of the modulus.
+
+    Returns:
+        A prime `p = kq + 1` and an element `g` of order `q` modulo `p`,
+        and `q` itself.
+    """
+    q = random_prime(order_bits)
+    while True:
+        p = q * 2 * getrandbits(bits - order_bits - 1) + 1
+        if p.bit_length() == bits and is_prime(p):
+            g = pow(3, (p - 1) // q, p)
+            if g != 1:
+                return p, g, q
+
+
+def bench_subgroup_log(sizes=(16, 24, 32, 40)):
+    """
+    Measures baby-step giant-step and Pollard's rho in subgroups of prime
+    order of increasing size, modulo 256-bit primes.
+    """
+    for order_bits in sizes:
+        p, g, q = subgroup(order_bits)
+        h = pow(g, getrandbits(order_bits) % q, p)
+        start = perf_counter()
+        baby_step_giant_step(g, h, p, q)
+        bsgs = perf_counter() - start
+        start = perf_counter()
+        pollard_rho_log(g, h, p, q)
+        rho = perf_counter() - start
+        print(
+            "order of {} bits\tbaby-step giant-step: {:>7.3f} s"
+            "\tPollard rho: {:>7.3f} s".format(order_bits, bsgs, rho)
+        )
+
+
+def bench_audit():
+    """
+    Audits the groups of `key_exchange.py`, a generated group and a
+    DSA-style group with a 160-bit subgroup (with and without its claimed
+    order), and solves a logarithm in each of the weak ones, comparing the
+    estimated cost with the time taken.
+    """
+    group = generate_group(512, workers=1)
+    p, g, q = subgroup(160, 1024)
+    for p, g, q in [
+        (
+            589_559_306_225_789_680_238_449,
+            99_848_060_646_461_381_236_408,
+            None,
+        ),
+        (
+            1_076_504_068_900_685_093_590_721,
+            594_761_277_746_183_138_644_459,
+            None,
+        ),
+        (group.p, group.g, group.q),
+        (p, g, q),
+        (p, g, None),
+    ]:
+        start = perf_counter()
+        audit = audit_group(p, g, q)
+        audited = perf_counter() - start
+        if audit.bits < 40 and not audit.inconclusive:
+            start = perf_counter()
+            discrete_log(pow(g, getrandbits(p.bit_length()), p), g, p)
+            solved = "{:.1f} s".format(perf_counter() - start)
+        else:
+            solved = "-"
+        print(
+            "{} bits\torder {}\tsecurity: {}\taudited in {:.0f} ms"
+            "\tsolved in {}".format(
+                p.bit_length(),
+                "claimed" if q else "factored",
+                (
+                    "inconclusive"
+                    if audit.inconclusive
+                    else "{:.1f} bits".format(audit.bits)
+                ),
+                audited * 1e3,
+                solved,
+            )
+        )
+
+
+if __name__ == "__main__":
+    bench_safe_prime()
+    bench_public_key()
+    bench_handshake()
+    bench_subgroup_log()
+    bench_audit()
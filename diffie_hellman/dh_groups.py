@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103,C0413
+
+"""dh_groups.py
+
+Generation of Diffie-Hellman groups modulo safe primes `p = 2q + 1`, where
+`q` is also prime. The multiplicative group modulo such a `p` has only the
+subgroups of order 1, 2, `q` and `2q`, so the generator of the subgroup of
+order `q` is simply the square of any number other than `1` and `p - 1`,
+without having to factor `p - 1` or search for a primitive root.
+
+Candidates for `q` are sieved against the small primes of
+`../mersenne_twister/primality_test.py`, crossing out both those divisible
+by a small prime and those for which `2q + 1` is; only the survivors are
+tested with modular exponentiations.
+"""
+
+from __future__ import absolute_import
+from collections import namedtuple
+from itertools import compress
+from os.path import abspath, dirname, join
+import sys
+
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "mersenne_twister"))
+from primality_test import (
+    SMALL_PRIMES,
+    find_prime,
+    is_prime,
+    random_odd,
+    residues,
+    seeded_generator,
+    strong_probable_prime,
+)
+
+# prime modulus `p`, prime order `q = (p - 1) / 2` of the subgroup and its
+# generator `g`
+DHGroup = namedtuple("DHGroup", ["p", "q", "g"])
+
+
+def safe_prime_candidates(bits, gen, window=None):
+    """
+    Yields odd numbers `q` such that `p = 2q + 1` has exactly `bits` bits and
+    neither `q` nor `p` has a factor among `SMALL_PRIMES`. Each window of
+    `window` consecutive odd numbers, starting at a random one, is sieved at
+    once: for every small prime `r`, the candidates with `q = 0 (mod r)` and
+    those with `q = -1/2 (mod r)` are crossed out.
+
+    Args:
+        bits:   bit length of `p`, at least 16.
+        gen:    generator with a `random_bytes` method, such as `MT19937`.
+        window: number of odd numbers sieved at once; defaults to
+                `16 * bits`, since safe primes are much sparser than primes.
+
+    Yields:
+        The values of `q` that survive the sieve.
+    """
+    assert bits >= 16
+    window = window or 16 * bits
+    while True:
+        start = random_odd(bits - 1, gen)
+        if (start + 2 * window) >> (bits - 1):
+            continue
+
+        flags = bytearray([1]) * window
+        for r, residue in zip(SMALL_PRIMES[1:], residues(start)):
+            if r >= start:
+                break
+            # start + 2k = target (mod r), dividing by 2 modulo r
+            for target in (0, (r - 1) // 2):
+                k = (target - residue) * ((r + 1) // 2) % r
+                flags[k::r] = bytes(len(range(k, window, r)))
+
+        for k in compress(range(window), flags):
+            yield start + 2 * k
+
+
+def search_safe_prime(bits, gen, found=None):
+    """
+    Tests the candidates of `safe_prime_candidates` until `p = 2q + 1` is a
+    safe prime. Most candidates are rejected by a single exponentiation: a
+    strong probable prime test of `q` to base 2, and then a Fermat test of
+    `p` to base 2. Only then `q` is fully tested with `is_prime`; if it is
+    prime, the Fermat test already proves that `p` is prime as well (by
+    Pocklington's criterion, since `q > sqrt(p)` and `p` is not a multiple
+    of 3).
+
+    Args:
+        bits:   as described in `safe_prime_candidates`.
+        gen:    as described in `safe_prime_candidates`.
+        found:  optional event, checked before each candidate and set once a
+                safe prime is found.
+
+    Returns:
+        The safe prime `p`, or `None` if the search was cancelled, and the
+        number of candidates tested.
+    """
+    tested = 0
+    for q in safe_prime_candidates(bits, gen):
+        if found is not None and found.is_set():
+            return None, tested
+        tested += 1
+        p = 2 * q + 1
+        if not strong_probable_prime(q, [2]) or pow(2, p - 1, p) != 1:
+            continue
+        if is_prime(q):
+            if found is not None:
+                found.set()
+            return p, tested
+    return None, tested
+
+
+def safe_prime(bits, workers=None, gen=None):
+    """
+    Finds a random safe prime with exactly `bits` bits, with the parallel
+    search of `find_prime`.
+
+    Args:
+        bits:       as described in `safe_prime_candidates`.
+        workers:    as described in `find_prime`.
+        gen:        as described in `find_prime`.
+
+    Returns:
+        A `PrimeSearch` tuple.
+    """
+    return find_prime(bits, workers, gen, search_safe_prime)
+
+
+def subgroup_generator(p, gen=None):
+    """
+    Picks a generator of the subgroup of order `q` modulo a safe prime
+    `p = 2q + 1`, by squaring a random number `h` in [2, p - 2]: the square
+    is a quadratic residue other than 1, and every such residue generates
+    the whole subgroup.
+
+    Args:
+        p:      safe prime.
+        gen:    as described in `safe_prime_candidates`; defaults to a fresh
+                `seeded_generator`.
+
+    Returns:
+        The generator `g = h^2 mod p`.
+    """
+    gen = gen or seeded_generator()
+    size = (p.bit_length() + 71) // 8
+    h = 2 + int.from_bytes(gen.random_bytes(size), "little") % (p - 3)
+    return pow(h, 2, p)
+
+
+def is_subgroup_generator(p, g):
+    """
+    Checks whether `g` generates the subgroup of order `q` modulo a safe
+    prime `p = 2q + 1`, e.g. for a group received from the other party.
+
+    Args:
+        p:  safe prime.
+        g:  candidate generator.
+
+    Returns:
+        True if `g` has order `q`.
+    """
+    return 1 < g < p - 1 and pow(g, (p - 1) // 2, p) == 1
+
+
+def generate_group(bits, workers=None, gen=None):
+    """
+    Generates a Diffie-Hellman group of prime order modulo a safe prime.
+
+    Args:
+        bits:       bit length of the modulus.
+        workers:    as described in `find_prime`.
+        gen:        as described in `find_prime`.
+
+    Returns:
+        A `DHGroup` tuple.
+    """
+    gen = gen or seeded_generator()
+    # the search draws from streams after `gen`, which picks the generator
+    p = safe_prime(bits, workers, gen.jumped()).prime
+    return DHGroup(p, (p - 1) // 2, subgroup_generator(p, gen))
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""dh_service.py
+
+Diffie-Hellman key exchange between an asyncio server and its clients, over
+TCP or Unix sockets. Every message is a sequence of frames, each prefixed by
+its length in two big-endian bytes; integers are sent in big-endian order.
+A handshake takes one connection:
+
+    server -> client:   p, g
+    client -> server:   A = g^a mod p
+    server -> client:   B = g^b mod p, SHA-256(g^ab mod p)
+
+and the client checks the hash against its own shared secret. Both sides
+run their exponentiations in a process pool, so the event loop only moves
+bytes around; a load generator measures handshakes per second and their
+latency percentiles. Every read gives up after `HANDSHAKE_TIMEOUT` seconds,
+so that a stalled peer does not hold a connection forever.
+"""
+
+from __future__ import absolute_import
+from asyncio import TimeoutError as ReadTimeout
+from asyncio import (
+    IncompleteReadError,
+    gather,
+    get_running_loop,
+    open_connection,
+    open_unix_connection,
+    start_server,
+    start_unix_server,
+    wait_for,
+)
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from secrets import randbelow
+from struct import Struct
+from time import perf_counter
+from diffie_hellman import DiffieHellman
+
+LENGTH = Struct(">H")
+HANDSHAKE_TIMEOUT = 10.0
+
+# number of handshakes, seconds taken by all of them, and the median and
+# 99th percentile of their latency in seconds
+LoadReport = namedtuple("LoadReport", ["handshakes", "seconds", "p50", "p99"])
+
+
+def frame(data):
+    """
+    Args:
+        data: bytes, at most 65535 of them.
+
+    Returns:
+        The data prefixed by its length.
+    """
+    return LENGTH.pack(len(data)) + data
+
+
+def int_frame(value):
+    """
+    Args:
+        value: non-negative integer.
+
+    Returns:
+        The integer in big-endian order, as a frame.
+    """
+    return frame(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+async def read_frame(reader, timeout=HANDSHAKE_TIMEOUT):
+    """
+    Args:
+        reader:     `asyncio.StreamReader`.
+        timeout:    seconds to wait for each part of the frame.
+
+    Returns:
+        The contents of the next frame.
+    """
+    header = await wait_for(reader.readexactly(LENGTH.size), timeout)
+    (size,) = LENGTH.unpack(header)
+    return await wait_for(reader.readexactly(size), timeout)
+
+
+async def read_int(reader, timeout=HANDSHAKE_TIMEOUT):
+    """
+    Args:
+        reader, timeout: as described in `read_frame`.
+
+    Returns:
+        The integer in the next frame.
+    """
+    return int.from_bytes(await read_frame(reader, timeout), "big")
+
+
+async def close_writer(writer):
+    """
+    Closes a connection and waits until it is closed, ignoring a peer that
+    has already gone away.
+
+    Args:
+        writer: `asyncio.StreamWriter`.
+    """
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except ConnectionError:
+        pass
+
+
+def confirmation(secret):
+    """
+    Args:
+        secret: shared secret.
+
+    Returns:
+        Hash of the secret, which proves its knowledge without revealing it.
+    """
+    return sha256(
+        secret.to_bytes((secret.bit_length() + 7) // 8, "big")
+    ).digest()
+
+
+def new_party(p, g):
+    """
+    Args:
+        p, g: as described in `DiffieHellman`.
+
+    Returns:
+        A `DiffieHellman` object with a random private key, and its public
+        key.
+    """
+    party = DiffieHellman(2 + randbelow(p - 3), p, g)
+    return party, party.gen_public_key()
+
+
+def respond(p, g, public):
+    """
+    Server side of a handshake, run in a worker process.
+
+    Args:
+        p, g:   as described in `DiffieHellman`.
+        public: public key of the client.
+
+    Returns:
+        The public key of the server, and the shared secret.
+    """
+    party, key = new_party(p, g)
+    return key, party.gen_shared_secret(public)
+
+
+def valid_public_key(p, public):
+    """
+    Args:
+        p:      modulus of the group.
+        public: public key received from the other party.
+
+    Returns:
+        False if the key is outside [2, p - 2], which would make the shared
+        secret predictable.
+    """
+    return 1 < public < p - 1
+
+
+class HandshakeServer:
+    """Server answering Diffie-Hellman handshakes in a fixed group."""
+
+    def __init__(self, p, g, executor=None, timeout=HANDSHAKE_TIMEOUT):
+        """
+        Initializes the server with the following attributes:
+
+            p, g:       as described in `DiffieHellman`.
+            executor:   `concurrent.futures.Executor` running `respond`;
+                        defaults to a process pool with a process per CPU.
+            timeout:    seconds to wait for the client on each read.
+            _server:    the `asyncio.Server`, once started.
+
+        Args:
+            p, g, executor, timeout: as described above.
+        """
+        self.p, self.g = p, g
+        self.executor = executor or ProcessPoolExecutor()
+        self.timeout = timeout
+        self._server = None
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+        Starts listening, on a Unix socket if `path` is given, or on TCP.
+
+        Args:
+            host, port: TCP address; port 0 picks a free one.
+            path:       path of the Unix socket.
+
+        Returns:
+            The address to be given to `exchange`: `(host, port)`, or
+            `path`.
+        """
+        if path is not None:
+            self._server = await start_unix_server(self._handle, path)
+            return path
+        self._server = await start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        """Stops listening and waits for the connections to be closed."""
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        """
+        Carries out a handshake with a client.
+
+        Args:
+            reader, writer: streams of the connection.
+        """
+        try:
+            writer.write(int_frame(self.p) + int_frame(self.g))
+            await writer.drain()
+            public = await read_int(reader, self.timeout)
+            if not valid_public_key(self.p, public):
+                return
+            key, secret = await get_running_loop().run_in_executor(
+                self.executor, respond, self.p, self.g, public
+            )
+            writer.write(int_frame(key) + frame(confirmation(secret)))
+            await writer.drain()
+        except (ConnectionError, IncompleteReadError, ReadTimeout):
+            pass
+        finally:
+            await close_writer(writer)
+
+
+async def exchange(address, executor=None, timeout=HANDSHAKE_TIMEOUT):
+    """
+    Client side of a handshake.
+
+    Args:
+        address:    `(host, port)` of a TCP server, or path of a Unix socket.
+        executor:   `concurrent.futures.Executor` for the exponentiations;
+                    `None` uses the default executor of the loop.
+        timeout:    seconds to wait for the server on each read.
+
+    Returns:
+        The shared secret.
+    """
+    if isinstance(address, str):
+        reader, writer = await open_unix_connection(address)
+    else:
+        reader, writer = await open_connection(*address)
+    loop = get_running_loop()
+    try:
+        p, g = await read_int(reader, timeout), await read_int(reader, timeout)
+        party, key = await loop.run_in_executor(executor, new_party, p, g)
+        writer.write(int_frame(key))
+        await writer.drain()
+        public = await read_int(reader, timeout)
+        digest = await read_frame(reader, timeout)
+        if not valid_public_key(p, public):
+            raise ValueError("Invalid public key.")
+        secret = await loop.run_in_executor(
+            executor, party.gen_shared_secret, public
+        )
+    finally:
+        await close_writer(writer)
+    if digest != confirmation(secret):
+        raise ValueError("Key confirmation failed.")
+    return secret
+
+
+async def load(address, handshakes, concurrency, executor=None):
+    """
+    Runs handshakes against a server, keeping `concurrency` of them in
+    progress at any time.
+
+    Args:
+        address:        as described in `exchange`.
+        handshakes:     total number of handshakes, at least 1.
+        concurrency:    number of clients running at once.
+        executor:       as described in `exchange`.
+
+    Returns:
+        A `LoadReport` tuple.
+    """
+    if handshakes < 1:
+        raise ValueError("At least one handshake is needed.")
+    latencies, remaining = [], iter(range(handshakes))
+
+    async def client():
+        """Carries out handshakes until none are left."""
+        for _ in remaining:
+            start = perf_counter()
+            await exchange(address, executor)
+            latencies.append(perf_counter() - start)
+
+    start = perf_counter()
+    await gather(*(client() for _ in range(concurrency)))
+    seconds = perf_counter() - start
+
+    latencies.sort()
+    return LoadReport(
+        handshakes,
+        seconds,
+        latencies[len(latencies) // 2],
+        latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)],
+    )
@@ -6,6 +6,9 @@
 Simple class implementation for the Diffie-Hellman key exchange.
 """
 
+from __future__ import absolute_import
+from fixed_base import fixed_base
+
 
 class DiffieHellman:
     """
@@ -20,7 +23,7 @@ class DiffieHellman:
     A simple explanation for DH: http://security.stackexchange.com/a/45971
     """
 
-    def __init__(self, private, p, g):
+    def __init__(self, private, p, g, precompute=True):
         """
         Initializes the DiffieHellman object with the following attributes:
 
@@ -29,10 +32,27 @@ class DiffieHellman:
                      perhaps by the program itself.
             p: a prime number, called the modulus.
             g: a primitive root modulo p, called the base.
+            precompute: whether the public key is computed with the tables
+                        of `fixed_base.py`, shared by every object with the
+                        same p and g; worthwhile for more than a couple of
+                        keys per group.
+            _public: the public key, once computed.
         """
         self.private = private
         self._p = p
         self._g = g
+        self.precompute = precompute
+        self._public = None
+
+    @property
+    def p(self):
+        """The modulus."""
+        return self._p
+
+    @property
+    def g(self):
+        """The base."""
+        return self._g
 
     def __str__(self):
         """Pretty-prints the attributes from the Diffie-Hellman object."""
@@ -41,7 +61,7 @@ class DiffieHellman:
             "Prime number:   {}\n"
             "Primitive root: {}\n"
             "Public key:     {}".format(
-                self._p, self._g, self.private, self.gen_public_key()
+                self.private, self._p, self._g, self.gen_public_key()
             )
         )
 
@@ -52,10 +72,17 @@ class DiffieHellman:
         the private key); solving this equation would imply solving the
         discrete logarithm problem efficiently.
 
+        The key is computed on the first call only.
+
         Returns:
             g**a mod p -- the public key for this party.
         """
-        return pow(self._g, self.private, self._p)
+        if self._public is None:
+            if self.precompute:
+                self._public = fixed_base(self._p, self._g).pow(self.private)
+            else:
+                self._public = pow(self._g, self.private, self._p)
+        return self._public
 
     def gen_shared_secret(self, key):
         """
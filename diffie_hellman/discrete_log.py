@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103,C0413
+
+"""discrete_log.py
+
+Discrete logarithms modulo a prime `p`, to measure how weak a group is.
+The Pohlig-Hellman algorithm [1] reduces a logarithm to the base `g` to one
+logarithm in a subgroup of prime order `q` for each factor `q` of the order
+of `g`; each of those is found with baby-step giant-step, with a table of
+at most `BSGS_TABLE_LIMIT` entries, or with Pollard's rho method for
+logarithms [2] when the table would not fit. The cost of a logarithm is
+thus dominated by `sqrt(q)` for the largest factor `q` of the order of `g`,
+which `audit_group` estimates without solving anything, from the claimed
+prime order of `g` or from a factorization of `p - 1` with the engine of
+`../primitive_root/factorization.py`.
+
+[1] https://doi.org/10.1109/TIT.1978.1055817
+[2] https://doi.org/10.1090/S0025-5718-1978-0491431-9
+"""
+
+from __future__ import absolute_import
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from math import isqrt, log2
+from os import cpu_count
+from os.path import abspath, dirname, join
+from random import randrange
+import sys
+
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "primitive_root"))
+from dh_groups import DHGroup
+from factorization import factorize, partial_factorize
+from primality_test import is_prime
+
+BSGS_TABLE_LIMIT = 1 << 16
+AUDIT_RHO_STEPS = 1 << 16
+
+# modulus and base; order of the base and its factorization as `(prime,
+# exponent)` pairs; composite part of `p - 1` that could not be split (1 if
+# none); whether the audit is inconclusive, because that part divides the
+# order of the base; estimated number of group operations for a logarithm,
+# over the known factors only, and its base-2 logarithm
+GroupAudit = namedtuple(
+    "GroupAudit",
+    [
+        "p",
+        "g",
+        "order",
+        "factors",
+        "cofactor",
+        "inconclusive",
+        "operations",
+        "bits",
+    ],
+)
+
+
+def element_order(g, p, factors):
+    """
+    Removes from `p - 1` each prime factor `q` for as long as `g` raised to
+    the remaining order over `q` is still 1.
+
+    Args:
+        g:          element of the multiplicative group modulo `p`.
+        p:          prime modulus.
+        factors:    `(prime, exponent)` pairs of prime powers dividing
+                    `p - 1`, usually its whole factorization.
+
+    Returns:
+        The order of `g` (or a multiple of it, if `factors` is partial), and
+        the pairs of the prime powers of `factors` that still divide it.
+    """
+    order, remaining = p - 1, []
+    for q, e in factors:
+        while e and pow(g, order // q, p) == 1:
+            order, e = order // q, e - 1
+        if e:
+            remaining.append((q, e))
+    return order, tuple(remaining)
+
+
+def baby_step_giant_step(g, h, p, order, table_limit=BSGS_TABLE_LIMIT):
+    """
+    Shanks' algorithm: stores `g^j` for `j < m` (the baby steps), then
+    multiplies `h` by `g^-m` until it lands on one of them (the giant
+    steps). With `m` capped at `table_limit`, memory stays bounded and the
+    number of giant steps grows to `order / m` instead.
+
+    Args:
+        g:              element of order `order` modulo `p`.
+        h:              element whose logarithm is wanted.
+        p:              prime modulus.
+        order:          order of `g`.
+        table_limit:    maximum number of baby steps.
+
+    Returns:
+        `x` in [0, order) with `g^x = h mod p`, or `None` if there is none.
+    """
+    m = min(isqrt(order - 1) + 1, table_limit)
+    table, power = {}, 1
+    for j in range(m):
+        table.setdefault(power, j)
+        power = power * g % p
+
+    giant, gamma = pow(g, -m, p), h % p
+    for i in range(-(-order // m)):
+        j = table.get(gamma)
+        if j is not None:
+            return i * m + j
+        gamma = gamma * giant % p
+    return None
+
+
+def pollard_rho_log(g, h, p, q):
+    """
+    Pollard's rho method for logarithms: a pseudorandom walk over elements
+    `g^a * h^b`, split in three classes by the element modulo 3, until
+    Floyd's cycle detection finds a collision `g^a h^b = g^A h^B`, which
+    gives `x = (A - a) / (b - B) mod q`. Memory is constant.
+
+    Args:
+        g:  element of prime order `q` modulo `p`.
+        h:  element of the subgroup generated by `g`.
+        p:  prime modulus.
+        q:  prime order of `g`.
+
+    Returns:
+        `x` in [0, q) with `g^x = h mod p`.
+    """
+
+    def step(x, a, b):
+        """Moves the walk one element forward."""
+        s = x % 3
+        if s == 0:
+            return x * x % p, 2 * a % q, 2 * b % q
+        if s == 1:
+            return x * g % p, (a + 1) % q, b
+        return x * h % p, a, (b + 1) % q
+
+    while True:
+        a, b = randrange(q), randrange(q)
+        slow = (pow(g, a, p) * pow(h, b, p) % p, a, b)
+        fast = step(*slow)
+        while slow[0] != fast[0]:
+            slow = step(*slow)
+            fast = step(*step(*fast))
+        r = (slow[2] - fast[2]) % q
+        if r:
+            x = (fast[1] - slow[1]) * pow(r, -1, q) % q
+            if pow(g, x, p) == h % p:
+                return x
+
+
+def prime_order_log(g, h, p, q):
+    """
+    Args:
+        g, h, p:    as described in `baby_step_giant_step`.
+        q:          prime order of `g`.
+
+    Returns:
+        `x` in [0, q) with `g^x = h mod p`, or `None` if there is none.
+    """
+    if isqrt(q) < BSGS_TABLE_LIMIT:
+        return baby_step_giant_step(g, h, p, q)
+    if pow(h, q, p) != 1:
+        return None
+    return pollard_rho_log(g, h, p, q)
+
+
+def discrete_log(h, g, p, factors=None):
+    """
+    Pohlig-Hellman algorithm: for each prime power `q^e` dividing the order
+    `n` of `g`, the digits of `x mod q^e` in base `q` are found one at a
+    time in the subgroup of order `q`, and the results are combined with
+    the Chinese remainder theorem.
+
+    Args:
+        h:          element whose logarithm is wanted.
+        g:          base.
+        p:          prime modulus.
+        factors:    factorization of `p - 1`; computed if not given.
+
+    Returns:
+        The smallest `x` with `g^x = h mod p`.
+    """
+    n, order_factors = element_order(g, p, factors or factorize(p - 1))
+    x, modulus = 0, 1
+    for q, e in order_factors:
+        gamma = pow(g, n // q, p)
+        digits = 0
+        for k in range(e):
+            target = pow(pow(g, -digits, p) * h, n // q ** (k + 1), p)
+            d = prime_order_log(gamma, target, p, q)
+            if d is None:
+                raise ValueError("{} is not a power of {}.".format(h, g))
+            digits += d * q**k
+        # x = digits mod q^e, combined with the previous congruences
+        t = (digits - x) * pow(modulus, -1, q**e) % q**e
+        x, modulus = x + modulus * t, modulus * q**e
+    if pow(g, x, p) != h % p:
+        raise ValueError("{} is not a power of {}.".format(h, g))
+    return x
+
+
+def audit_group(p, g, q=None, steps=AUDIT_RHO_STEPS):
+    """
+    Estimates the cost of a logarithm to the base `g` modulo `p`, as the
+    number of group operations of Pohlig-Hellman with a square-root method
+    for each prime `q` dividing the order of `g`: about `e * sqrt(q)` for
+    each `q^e`.
+
+    If the order of `g` is claimed to be a prime `q`, as in a `DHGroup` or
+    DSA parameters, the claim is checked and the cost is `sqrt(q)`, without
+    factoring `p - 1`. Otherwise `p - 1` is factored; if a composite part of
+    it cannot be split by `pollard_brent` within `steps` iterations and it
+    divides the order of `g`, the audit is marked inconclusive, since the
+    cost of that part is unknown.
+
+    Args:
+        p:      prime modulus.
+        g:      base.
+        q:      optional prime order of `g`.
+        steps:  as described in `partial_factorize`.
+
+    Returns:
+        A `GroupAudit` tuple.
+    """
+    if q is not None:
+        if not (1 < g < p and (p - 1) % q == 0 and pow(g, q, p) == 1):
+            raise ValueError("{} is not the order of {}.".format(q, g))
+        if not is_prime(q):
+            raise ValueError("The order {} is not prime.".format(q))
+        order, factors, cofactor = q, ((q, 1),), 1
+    else:
+        factors, cofactor = partial_factorize(p - 1, steps)
+        order, factors = element_order(g, p, factors)
+        if cofactor > 1 and pow(g, order // cofactor, p) == 1:
+            order, cofactor = order // cofactor, 1
+
+    operations = sum(e * (isqrt(r) + 1) for r, e in factors)
+    return GroupAudit(
+        p,
+        g,
+        order,
+        factors,
+        cofactor,
+        cofactor > 1,
+        operations,
+        log2(max(operations, 1)),
+    )
+
+
+def _audit_chunk(groups):
+    """Applies `audit_group` to a list of groups inside a worker process."""
+    return [audit_group(*group) for group in groups]
+
+
+def audit_many(groups, workers=None):
+    """
+    Audits many groups, e.g. every set of parameters received from
+    partners, across a process pool.
+
+    Args:
+        groups:     iterable of `(p, g)` pairs, `(p, g, q)` triples with the
+                    claimed prime order `q` of `g`, or `DHGroup` tuples.
+        workers:    number of processes; `None` uses every CPU, whereas 1
+                    audits everything in the current process.
+
+    Returns:
+        List of `GroupAudit` tuples, in order.
+    """
+    groups = [
+        (group.p, group.g, group.q) if isinstance(group, DHGroup) else group
+        for group in groups
+    ]
+    workers = min(workers or cpu_count() or 1, len(groups))
+    if workers <= 1:
+        audits = _audit_chunk(groups)
+    else:
+        size = -(-len(groups) // workers)
+        chunks = [groups[i : i + size] for i in range(0, len(groups), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            audits = [a for c in executor.map(_audit_chunk, chunks) for a in c]
+    return audits
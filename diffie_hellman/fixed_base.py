@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""fixed_base.py
+
+Exponentiation with a fixed base, for groups in which many parties compute
+`g^x mod p` with the same `p` and `g`. Tables of powers of `g` are built
+once per group with the comb method of Lim and Lee [1]: the exponent is
+written as a matrix of `rows` rows, and each of its `blocks` blocks of
+columns is looked up in a table of products of the row bases. An exponent
+of `n` bits then costs about `n / (rows * blocks)` squarings and
+`n / rows` multiplications, instead of the `n` squarings and about `n / 5`
+multiplications of `pow`. Tables are kept in a bounded LRU cache keyed by
+`(p, g)`.
+
+[1] https://doi.org/10.1007/3-540-48658-5_11
+"""
+
+from __future__ import absolute_import
+from functools import lru_cache
+
+COMB_ROWS = 8
+COMB_BLOCKS = 4
+CACHE_SIZE = 16
+
+
+class FixedBase:
+    """Precomputed comb tables for powers of a fixed base."""
+
+    def __init__(self, p, g, bits=None, rows=COMB_ROWS, blocks=COMB_BLOCKS):
+        """
+        Builds the tables with the following attributes:
+
+            p:          the modulus.
+            g:          the base.
+            bits:       maximum bit length of the exponents handled by the
+                        tables; longer ones fall back to `pow`.
+            _width:     number of columns of the exponent matrix.
+            _depth:     number of columns in each block.
+            _tables:    for each block `j`, the products of every subset of
+                        the row bases `g^(2^(r * _width + j * _depth))`,
+                        indexed by the bit mask of the subset.
+
+        Args:
+            p, g:   as described above.
+            bits:   as described above; defaults to the length of `p`.
+            rows:   number of rows of the exponent matrix; each table has
+                    `2^rows` entries.
+            blocks: number of tables.
+        """
+        self.p, self.g = p, g
+        self._depth = -(-(bits or p.bit_length()) // (rows * blocks))
+        self._width = self._depth * blocks
+        self.bits = rows * self._width
+
+        powers, power = [], g % p
+        for i in range(self.bits):
+            if i % self._depth == 0:
+                powers.append(power)
+            power = power * power % p
+
+        self._tables = []
+        for j in range(blocks):
+            table = [1]
+            for base in powers[j::blocks]:
+                table += [entry * base % p for entry in table]
+            self._tables.append(table)
+
+    def pow(self, exponent):
+        """
+        Args:
+            exponent: non-negative integer.
+
+        Returns:
+            g^exponent mod p.
+        """
+        if exponent < 0 or exponent.bit_length() > self.bits:
+            return pow(self.g, exponent, self.p)
+        # bit `i` of the exponent is character `i` of the string
+        digits = format(exponent, "0{}b".format(self.bits))[::-1]
+        columns = [
+            int(digits[c :: self._width][::-1], 2) for c in range(self._width)
+        ]
+
+        p, result = self.p, 1
+        for k in reversed(range(self._depth)):
+            result = result * result % p
+            for table, column in zip(self._tables, columns[k :: self._depth]):
+                if column:
+                    result = result * table[column] % p
+        return result
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fixed_base(p, g):
+    """
+    Args:
+        p:  the modulus.
+        g:  the base.
+
+    Returns:
+        The `FixedBase` tables of the group, built on its first use.
+    """
+    return FixedBase(p, g)
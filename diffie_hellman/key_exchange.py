@@ -10,12 +10,15 @@ Test script for Diffie-Hellman implemented within this folder.
 from __future__ import absolute_import
 from random import getrandbits
 from diffie_hellman import DiffieHellman
+from dh_groups import generate_group
 
 XA, XB = getrandbits(512), getrandbits(512)
+group = generate_group(512, workers=1)
 
 for i in [
     (589_559_306_225_789_680_238_449, 99_848_060_646_461_381_236_408),
     (1_076_504_068_900_685_093_590_721, 594_761_277_746_183_138_644_459),
+    (group.p, group.g),
 ]:
 
     alice = DiffieHellman(XA, *i)
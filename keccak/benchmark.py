@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""benchmark.py
+
+Throughput measurements for the Keccak implementations within this folder.
+"""
+
+from __future__ import absolute_import
+from os import cpu_count, urandom
+from time import perf_counter
+from keccakf1600 import Keccak, PermutationTracer, SHA3, set_tracer
+from keccak_batch import sha3_many
+from sp800_185 import KMAC128
+from tree_hash import KangarooTwelve, ParallelHash128
+
+
+def throughput(function, data, repeat=3):
+    """
+    Measures how fast a hash function consumes its input.
+
+    Args:
+        function:   callable receiving `data` as its only argument.
+        data:       message to be hashed, or list of messages.
+        repeat:     number of runs, of which the fastest one is kept.
+
+    Returns:
+        Processed bytes (or messages, for a list) per second.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        function(data)
+        best = min(best, perf_counter() - start)
+    return len(data) / best
+
+
+def bench_sha3():
+    """Compares the byte-oriented reference sponge with `SHA3`."""
+    for size in [1 << 10, 1 << 14, 1 << 17]:
+        data = urandom(size)
+        before = throughput(lambda m: Keccak(1088, 512, m, 0x06, 32), data)
+        after = throughput(lambda m: SHA3(256, m), data)
+        print(
+            "SHA3-256 {:>7} B\tbefore: {:>10.0f} B/s\tafter: {:>10.0f} B/s"
+            "\tspeedup: {:.1f}x".format(size, before, after, after / before)
+        )
+
+
+def bench_batch():
+    """Compares one call to `SHA3` per record with `sha3_many`."""
+    for count in [100, 1000, 10000]:
+        records = [urandom(32) for _ in range(count)]
+        before = throughput(lambda b: [SHA3(256, m) for m in b], records)
+        after = throughput(lambda b: sha3_many(256, b), records)
+        print(
+            "SHA3-256 {:>7} records\tbefore: {:>9.0f} rec/s\t"
+            "after: {:>9.0f} rec/s\tspeedup: {:.1f}x".format(
+                count, before, after, after / before
+            )
+        )
+
+
+def bench_tree(size=1 << 22):
+    """Measures how tree hashing scales with the number of processes."""
+    data = urandom(size)
+    for workers in sorted({1, 2, cpu_count() or 1}):
+        k12 = throughput(lambda m: KangarooTwelve(m, workers=workers), data, 1)
+        phash = throughput(
+            lambda m: ParallelHash128(m, 8192, 256, workers=workers), data, 1
+        )
+        print(
+            "{} worker(s)\tKangarooTwelve: {:>10.0f} B/s\t"
+            "ParallelHash128: {:>10.0f} B/s".format(workers, k12, phash)
+        )
+
+
+def bench_kmac(count=200):
+    """Compares MACs of short messages with and without cached key states."""
+    messages = [urandom(64) for _ in range(count)]
+    for key_size in [32, 1 << 10, 1 << 13]:
+        key = urandom(key_size)
+        before = throughput(
+            lambda b: [KMAC128(key, m, 256, cache=None) for m in b], messages
+        )
+        after = throughput(
+            lambda b: [KMAC128(key, m, 256) for m in b], messages
+        )
+        print(
+            "KMAC128 {:>5} B key\tbefore: {:>7.0f} MAC/s\t"
+            "after: {:>7.0f} MAC/s".format(key_size, before, after)
+        )
+
+
+def bench_tracing(size=1 << 16):
+    """
+    Shows that the sponge objects run at the same speed before a tracer is
+    registered and after it is removed, and how much tracing costs.
+    """
+    data = urandom(size)
+    before = throughput(lambda m: SHA3(256, m), data)
+    tracer = PermutationTracer()
+    set_tracer(tracer)
+    traced = throughput(lambda m: SHA3(256, m), data)
+    set_tracer(None)
+    after = throughput(lambda m: SHA3(256, m), data)
+    print(
+        "SHA3-256 untraced: {:>8.0f} B/s\ttraced: {:>8.0f} B/s\t"
+        "disabled again: {:>8.0f} B/s".format(before, traced, after)
+    )
+    print(
+        "{} permutations, {} rounds; seconds per step: {}".format(
+            tracer.permutations,
+            tracer.rounds,
+            ", ".join(
+                "{} {:.3f}".format(k, v) for k, v in tracer.step_time.items()
+            ),
+        )
+    )
+
+
+if __name__ == "__main__":
+    bench_sha3()
+    bench_batch()
+    bench_tree()
+    bench_kmac()
+    bench_tracing()
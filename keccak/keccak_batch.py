@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""keccak_batch.py
+
+Batched versions of the SHA-3 and SHAKE functions, which hash many messages
+at once. The states of all messages are kept as the rows of a `(N, 25)` NumPy
+array, and each step of the permutation is computed as an array operation
+over a whole column of lanes, so the interpreter overhead of a call to the
+permutation is paid once per batch instead of once per message.
+
+Messages of different lengths are sorted by their number of blocks, so the
+states that are still absorbing are always the first rows of the array and
+the finished ones are left out of the permutation by slicing.
+
+If NumPy is absent, the scalar functions are called for each message.
+"""
+
+from __future__ import absolute_import
+from functools import reduce
+from operator import xor
+from keccakf1600 import (
+    PI_TARGETS,
+    ROTATION_OFFSETS,
+    ROUND_CONSTANTS,
+    SHA3,
+    SHAKE,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def keccak_f_1600_many(A, rounds=24):
+    """
+    Keccak-f[1600] applied to every row of an array of states, following
+    the same steps as `keccak_f_1600_lanes`.
+
+    Args:
+        A:      `(N, 25)` uint64 array of states, permuted in place. Lanes are
+                indexed by `x + 5 * y`; a column-major array avoids strided
+                access to each column.
+        rounds: number of rounds, as in `keccak_f_1600_lanes`.
+
+    Returns:
+        A:      states permuted by Keccak-f[1600].
+    """
+
+    def rotate(a, n):
+        """
+        Bitwise cyclic shift of a column of lanes.
+
+        Args:
+            a:  column of 64-bit lanes.
+            n:  offset for rotation.
+
+        Returns:
+            The rotated lanes.
+        """
+        if n == 0:
+            return a
+        return (a << np.uint64(n)) | (a >> np.uint64(64 - n))
+
+    lanes = [A[:, i] for i in range(25)]
+    for rc in ROUND_CONSTANTS[24 - rounds :]:
+        C = [reduce(xor, lanes[x::5]) for x in range(5)]
+        D = [C[(x - 1) % 5] ^ rotate(C[(x + 1) % 5], 1) for x in range(5)]
+
+        B = [None] * 25
+        for i in range(25):
+            B[PI_TARGETS[i]] = rotate(lanes[i] ^ D[i % 5], ROTATION_OFFSETS[i])
+
+        lanes = [
+            B[i] ^ (~B[(i + 1) % 5 + i - i % 5] & B[(i + 2) % 5 + i - i % 5])
+            for i in range(25)
+        ]
+        lanes[0] ^= np.uint64(rc)
+
+    for i in range(25):
+        A[:, i] = lanes[i]
+    return A
+
+
+def keccak_many(r, c, messages, suffix, output_len):
+    """
+    The sponge function of `Keccak`, applied to a batch of messages.
+
+    Args:
+        r, c, suffix, output_len:   as described in `Keccak`; the rate must
+                                    be a multiple of the lane size.
+        messages:                   list of bytes-like objects.
+
+    Returns:
+        List with the hash of each message, in the same order.
+    """
+    assert r % 64 == 0 and r + c == 1600
+    messages = [bytes(m) for m in messages]
+    if not messages or not output_len:
+        return [b"" for _ in messages]
+
+    rate, extra = r // 8, int(bool(suffix & 0x80))
+    blocks = [(len(m) + extra) // rate + 1 for m in messages]
+    order = sorted(range(len(messages)), key=lambda i: -blocks[i])
+    width = blocks[order[0]]
+
+    padded = np.zeros((len(messages), width * rate), dtype=np.uint8)
+    for row, i in enumerate(order):
+        size = len(messages[i])
+        padded[row, :size] = np.frombuffer(messages[i], dtype=np.uint8)
+        padded[row, size] ^= suffix
+        padded[row, blocks[i] * rate - 1] ^= 0x80
+    words = padded.view("<u8").reshape(len(messages), width, rate // 8)
+
+    remaining = np.array([blocks[i] for i in order])
+    states = np.zeros((len(messages), 25), dtype=np.uint64, order="F")
+    for j in range(width):
+        active = int(np.count_nonzero(remaining > j))
+        states[:active, : rate // 8] ^= words[:active, j]
+        keccak_f_1600_many(states[:active])
+
+    squeezed = []
+    for _ in range(-(-output_len // rate)):
+        if squeezed:
+            keccak_f_1600_many(states)
+        lanes = states[:, : rate // 8].astype("<u8", order="C")
+        squeezed.append(lanes.view(np.uint8))
+    output = np.concatenate(squeezed, axis=1)
+
+    digests = [None] * len(messages)
+    for row, i in enumerate(order):
+        digests[i] = output[row, :output_len].tobytes()
+    return digests
+
+
+def sha3_many(size, messages):
+    """
+    FIPS 202 SHA-3 hash function over a batch of messages.
+
+    Args:
+        size:       instance of desired SHA3 algorithm.
+        messages:   list of bytes-like objects to compute hashes from.
+
+    Returns:
+        List with the hash of each message, identical to the output of
+        `SHA3` for that message.
+    """
+    assert size in [224, 256, 384, 512]
+    if np is None:
+        return [bytes(SHA3(size, m)) for m in messages]
+    return keccak_many(1600 - size * 2, size * 2, messages, 0x06, size // 8)
+
+
+def shake_many(size, messages, d):
+    """
+    FIPS 202 SHAKE function over a batch of messages.
+
+    Args:
+        size:       instance of desired SHAKE algorithm.
+        messages:   list of bytes-like objects to compute hashes from.
+        d:          length of each hash output.
+
+    Returns:
+        List with the hash of each message, identical to the output of
+        `SHAKE` for that message.
+    """
+    assert size in [128, 256]
+    if np is None:
+        return [bytes(SHAKE(size, m, d)) for m in messages]
+    return keccak_many(1600 - size * 2, size * 2, messages, 0x1F, d)
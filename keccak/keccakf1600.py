@@ -12,13 +12,66 @@ found on the official site [1]. Original implementation [2] by the Keccak Team.
 Some caveats about the implementation:
     * width `b` of permutation is fixed as 1600 (5 * 5 * 64), which means
     the number of rounds is 24 (12 + 2ℓ, ℓ = log_2(b / 25))
-    * ρ step could have its offsets pre-computed as the array `r`.
-    * ι step could have its round constants pre-computed as the array `RC`.
+    * `keccak_f_1600` is a straightforward reference for the permutation,
+    recomputing the ρ offsets and the ι round constants on every call.
+    * `keccak_f_1600_lanes` works instead on a flat list of 25 lanes, with
+    ρ, π and ι taken from the pre-computed arrays `ROTATION_OFFSETS`,
+    `PI_TARGETS` and `ROUND_CONSTANTS`, and the steps of a round unrolled.
+    The sponge objects below keep their state as lanes between calls, so
+    there is no conversion from and to bytes for every block.
 
 [1] http://keccak.noekeon.org/
 [2] https://git.io/vKfkb
 """
 
+from __future__ import absolute_import
+from operator import xor
+from struct import Struct
+from time import perf_counter
+
+MASK = (1 << 64) - 1
+
+
+def _rho_pi_tables():
+    """
+    Walks the (x, y) -> (y, 2x + 3y) cycle used by the ρ and π steps once.
+
+    Returns:
+        offsets: rotation offset of each lane, indexed by `x + 5 * y`.
+        targets: position of each lane after the π step.
+    """
+    offsets, targets = [0] * 25, [0] * 25
+    x, y = 1, 0
+    for t in range(24):
+        offsets[x + 5 * y] = ((t + 1) * (t + 2) // 2) % 64
+        x, y = y, (2 * x + 3 * y) % 5
+    for x in range(5):
+        for y in range(5):
+            targets[x + 5 * y] = y + 5 * ((2 * x + 3 * y) % 5)
+    return offsets, targets
+
+
+def _round_constants():
+    """
+    Runs the LFSR of the ι step through all twenty-four rounds.
+
+    Returns:
+        The list of constants XORed into the first lane on each round.
+    """
+    constants, R = [], 1
+    for _ in range(24):
+        rc = 0
+        for j in range(7):
+            R = ((R << 1) ^ ((R >> 7) * 0x71)) % 256
+            if R & 2:
+                rc ^= 1 << ((1 << j) - 1)
+        constants.append(rc)
+    return constants
+
+
+ROTATION_OFFSETS, PI_TARGETS = _rho_pi_tables()
+ROUND_CONSTANTS = _round_constants()
+
 
 def keccak_f_1600(state):
     """The inner permutation for the Keccak sponge function.
@@ -129,6 +182,123 @@ def keccak_f_1600(state):
     return state
 
 
+def keccak_f_1600_lanes(A, rounds=24):
+    """
+    Lane-oriented version of `keccak_f_1600`. The state is a flat list of 25
+    64-bit lanes, where lane (x, y) is found at index `x + 5 * y`, i.e. the
+    order in which lanes are laid out in the byte stream. Every step of the
+    round is unrolled over local variables, with the ρ offsets and π targets
+    written as literals (see `ROTATION_OFFSETS` and `PI_TARGETS`).
+
+    Args:
+        A:      list of 25 lanes, permuted in place.
+        rounds: number of rounds; the last ones are used if lower than 24,
+                as in Keccak-p[1600, n_r].
+
+    Returns:
+        A:      lanes permuted by Keccak-f[1600].
+    """
+    a0, a1, a2, a3, a4 = A[0:5]
+    a5, a6, a7, a8, a9 = A[5:10]
+    a10, a11, a12, a13, a14 = A[10:15]
+    a15, a16, a17, a18, a19 = A[15:20]
+    a20, a21, a22, a23, a24 = A[20:25]
+
+    for rc in ROUND_CONSTANTS[24 - rounds :]:
+        c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+        c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+        c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+        c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+        c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+        d0 = c4 ^ (((c1 << 1) & MASK) | (c1 >> 63))
+        d1 = c0 ^ (((c2 << 1) & MASK) | (c2 >> 63))
+        d2 = c1 ^ (((c3 << 1) & MASK) | (c3 >> 63))
+        d3 = c2 ^ (((c4 << 1) & MASK) | (c4 >> 63))
+        d4 = c3 ^ (((c0 << 1) & MASK) | (c0 >> 63))
+        b0 = a0 ^ d0
+        b1 = a6 ^ d1
+        b1 = ((b1 << 44) & MASK) | (b1 >> 20)
+        b2 = a12 ^ d2
+        b2 = ((b2 << 43) & MASK) | (b2 >> 21)
+        b3 = a18 ^ d3
+        b3 = ((b3 << 21) & MASK) | (b3 >> 43)
+        b4 = a24 ^ d4
+        b4 = ((b4 << 14) & MASK) | (b4 >> 50)
+        b5 = a3 ^ d3
+        b5 = ((b5 << 28) & MASK) | (b5 >> 36)
+        b6 = a9 ^ d4
+        b6 = ((b6 << 20) & MASK) | (b6 >> 44)
+        b7 = a10 ^ d0
+        b7 = ((b7 << 3) & MASK) | (b7 >> 61)
+        b8 = a16 ^ d1
+        b8 = ((b8 << 45) & MASK) | (b8 >> 19)
+        b9 = a22 ^ d2
+        b9 = ((b9 << 61) & MASK) | (b9 >> 3)
+        b10 = a1 ^ d1
+        b10 = ((b10 << 1) & MASK) | (b10 >> 63)
+        b11 = a7 ^ d2
+        b11 = ((b11 << 6) & MASK) | (b11 >> 58)
+        b12 = a13 ^ d3
+        b12 = ((b12 << 25) & MASK) | (b12 >> 39)
+        b13 = a19 ^ d4
+        b13 = ((b13 << 8) & MASK) | (b13 >> 56)
+        b14 = a20 ^ d0
+        b14 = ((b14 << 18) & MASK) | (b14 >> 46)
+        b15 = a4 ^ d4
+        b15 = ((b15 << 27) & MASK) | (b15 >> 37)
+        b16 = a5 ^ d0
+        b16 = ((b16 << 36) & MASK) | (b16 >> 28)
+        b17 = a11 ^ d1
+        b17 = ((b17 << 10) & MASK) | (b17 >> 54)
+        b18 = a17 ^ d2
+        b18 = ((b18 << 15) & MASK) | (b18 >> 49)
+        b19 = a23 ^ d3
+        b19 = ((b19 << 56) & MASK) | (b19 >> 8)
+        b20 = a2 ^ d2
+        b20 = ((b20 << 62) & MASK) | (b20 >> 2)
+        b21 = a8 ^ d3
+        b21 = ((b21 << 55) & MASK) | (b21 >> 9)
+        b22 = a14 ^ d4
+        b22 = ((b22 << 39) & MASK) | (b22 >> 25)
+        b23 = a15 ^ d0
+        b23 = ((b23 << 41) & MASK) | (b23 >> 23)
+        b24 = a21 ^ d1
+        b24 = ((b24 << 2) & MASK) | (b24 >> 62)
+        a0 = b0 ^ (~b1 & b2)
+        a1 = b1 ^ (~b2 & b3)
+        a2 = b2 ^ (~b3 & b4)
+        a3 = b3 ^ (~b4 & b0)
+        a4 = b4 ^ (~b0 & b1)
+        a5 = b5 ^ (~b6 & b7)
+        a6 = b6 ^ (~b7 & b8)
+        a7 = b7 ^ (~b8 & b9)
+        a8 = b8 ^ (~b9 & b5)
+        a9 = b9 ^ (~b5 & b6)
+        a10 = b10 ^ (~b11 & b12)
+        a11 = b11 ^ (~b12 & b13)
+        a12 = b12 ^ (~b13 & b14)
+        a13 = b13 ^ (~b14 & b10)
+        a14 = b14 ^ (~b10 & b11)
+        a15 = b15 ^ (~b16 & b17)
+        a16 = b16 ^ (~b17 & b18)
+        a17 = b17 ^ (~b18 & b19)
+        a18 = b18 ^ (~b19 & b15)
+        a19 = b19 ^ (~b15 & b16)
+        a20 = b20 ^ (~b21 & b22)
+        a21 = b21 ^ (~b22 & b23)
+        a22 = b22 ^ (~b23 & b24)
+        a23 = b23 ^ (~b24 & b20)
+        a24 = b24 ^ (~b20 & b21)
+        a0 ^= rc
+
+    A[0:5] = a0, a1, a2, a3, a4
+    A[5:10] = a5, a6, a7, a8, a9
+    A[10:15] = a10, a11, a12, a13, a14
+    A[15:20] = a15, a16, a17, a18, a19
+    A[20:25] = a20, a21, a22, a23, a24
+    return A
+
+
 def Keccak(r, c, _input, suffix, output_len):
     """
     The general sponge function, consisting of the inner permutation and a
@@ -140,6 +310,9 @@ def Keccak(r, c, _input, suffix, output_len):
         * squeezing, where the output's blocks will be permuted more times
             until they are concatenated to the desired size.
 
+    This is the byte-oriented reference built on `keccak_f_1600`; `SHA3` and
+    `SHAKE` use the lane-oriented `KeccakHash` instead.
+
     Args:
         r:          rate, or the number of input bits processed or output bits
                     generated per invocation of the underlying function
@@ -193,7 +366,8 @@ def SHA3(size, _input):
         Instance of the Keccak permutation that calculates the hash.
     """
     assert size in [224, 256, 384, 512]
-    return Keccak(1600 - size * 2, size * 2, _input, 0x06, size // 8)
+    sponge = KeccakHash(1600 - size * 2, size * 2, 0x06, size // 8, _input)
+    return bytearray(sponge.digest())
 
 
 def SHAKE(size, _input, d):
@@ -209,4 +383,469 @@ def SHAKE(size, _input, d):
         Instance of the Keccak permutation that calculates the hash.
     """
     assert size in [128, 256]
-    return Keccak(1600 - size * 2, size * 2, _input, 0x1F, d)
+    sponge = KeccakHash(1600 - size * 2, size * 2, 0x1F, d, _input)
+    output = bytearray(d)
+    sponge.reader().readinto(output)
+    return output
+
+
+STEPS = ("θ", "ρ + π", "χ", "ι")
+
+
+class PermutationTracer:
+    """
+    Instrumented version of `keccak_f_1600_lanes`, computing the steps of
+    each round one at a time. While registered with `set_tracer`, the sponge
+    objects permute their state through `permute` below, which counts calls
+    and rounds, accumulates the time spent on each step and passes a
+    snapshot of the state after every step to an optional callback.
+
+    When no tracer is registered, the sponge objects call the unrolled
+    permutation directly, so tracing has no cost unless it is enabled.
+    """
+
+    def __init__(self, callback=None):
+        """
+        Initializes the tracer with the following attributes:
+
+            callback:       function receiving the round number (starting
+                            from 1), the name of the step (one of `STEPS`)
+                            and a tuple of 25 lanes after every step.
+            permutations:   number of calls to the permutation.
+            rounds:         number of rounds computed.
+            step_time:      seconds spent on each step, excluding the time
+                            spent on the callback.
+
+        Args:
+            callback: as described above.
+        """
+        self.callback = callback
+        self.permutations = 0
+        self.rounds = 0
+        self.step_time = dict.fromkeys(STEPS, 0.0)
+
+    def _step(self, number, name, started, A):
+        """
+        Accounts for the time of a step and emits its snapshot.
+
+        Args:
+            number:     round number.
+            name:       name of the step.
+            started:    value of `perf_counter` when the step started.
+            A:          list of lanes after the step.
+
+        Returns:
+            Value of `perf_counter` for the start of the next step.
+        """
+        self.step_time[name] += perf_counter() - started
+        if self.callback is not None:
+            self.callback(number, name, tuple(A))
+        return perf_counter()
+
+    def permute(self, A, rounds=24):
+        """
+        Args:
+            A, rounds: as described in `keccak_f_1600_lanes`.
+
+        Returns:
+            A:  lanes permuted by Keccak-f[1600].
+        """
+        self.permutations += 1
+        for number in range(25 - rounds, 25):
+            self.rounds += 1
+            started = perf_counter()
+
+            C = [
+                A[x] ^ A[x + 5] ^ A[x + 10] ^ A[x + 15] ^ A[x + 20]
+                for x in range(5)
+            ]
+            D = [C[(x - 1) % 5] ^ _rotate(C[(x + 1) % 5], 1) for x in range(5)]
+            A[:] = [A[i] ^ D[i % 5] for i in range(25)]
+            started = self._step(number, STEPS[0], started, A)
+
+            B = [0] * 25
+            for i in range(25):
+                B[PI_TARGETS[i]] = _rotate(A[i], ROTATION_OFFSETS[i])
+            A[:] = B
+            started = self._step(number, STEPS[1], started, A)
+
+            A[:] = [
+                B[i]
+                ^ (~B[i - i % 5 + (i + 1) % 5] & B[i - i % 5 + (i + 2) % 5])
+                for i in range(25)
+            ]
+            started = self._step(number, STEPS[2], started, A)
+
+            A[0] ^= ROUND_CONSTANTS[number - 1]
+            self._step(number, STEPS[3], started, A)
+
+        return A
+
+
+def _rotate(a, n):
+    """
+    Bitwise cyclic shift of a lane, as in `keccak_f_1600`.
+
+    Args:
+        a:  64-bit lane.
+        n:  offset for rotation.
+
+    Returns:
+        The rotated lane.
+    """
+    return ((a << n) & MASK) | (a >> (64 - n))
+
+
+_permute = keccak_f_1600_lanes
+
+
+def set_tracer(tracer):
+    """
+    Registers a tracer for every permutation made by the sponge objects.
+
+    Args:
+        tracer: a `PermutationTracer`, or `None` to go back to the untraced
+                permutation.
+    """
+    global _permute  # pylint: disable=W0603
+    _permute = keccak_f_1600_lanes if tracer is None else tracer.permute
+
+
+def trace_writer(stream):
+    """
+    Creates a tracer callback that writes every step in the layout used by
+    `shodan.out`, i.e. each row of the state as the hexadecimal bytes of
+    five lanes.
+
+    Args:
+        stream: file-like object opened for writing text.
+
+    Returns:
+        A callback for `PermutationTracer`.
+    """
+
+    def write(number, name, A):
+        """
+        Writes a snapshot of the state.
+
+        Args:
+            number, name, A: as described in `PermutationTracer`.
+        """
+        if name == STEPS[0]:
+            stream.write("Rodada {}\n".format(number))
+        stream.write("Após {}\n".format(name))
+        for y in range(5):
+            row = b"".join(
+                a.to_bytes(8, "little") for a in A[5 * y : 5 * y + 5]
+            )
+            stream.write(row.hex() + "\n")
+        stream.write("\n")
+
+    return write
+
+
+class KeccakHash:
+    """
+    Incremental version of the sponge function, modelled after the objects
+    found in `hashlib`. Input may be fed in any number of calls to `update`,
+    so only one block of the state is kept in memory regardless of the size
+    of the message. Since `digest` pads and squeezes a copy of the state, the
+    object can still be updated afterwards, and `copy` allows a common prefix
+    to be absorbed only once and reused for many messages.
+
+    The state is kept as 25 lanes, to be permuted by `keccak_f_1600_lanes`.
+    Whole blocks are unpacked from the input straight into lanes, and only a
+    trailing partial block is buffered as bytes.
+    """
+
+    name = "keccak"
+
+    def __init__(self, r, c, suffix, digest_size, data=None, rounds=24):
+        """
+        Initializes the hash object with the following attributes:
+
+            block_size:  rate of the sponge in bytes.
+            digest_size: length of the output in bytes.
+            _suffix:     domain separation bits appended before padding.
+            _lanes:      state array as a list of 25 lanes.
+            _buffer:     bytes of a block that has not been filled yet.
+            _offset:     number of bytes absorbed into the current block.
+            _words:      packs and unpacks the lanes covered by the rate.
+            _rounds:     number of rounds of the permutation.
+
+        Args:
+            r, c, suffix:   as described in `Keccak`; the rate must be a
+                            multiple of the lane size.
+            digest_size:    length of hash output.
+            data:           optional list of bytes to be absorbed right away.
+            rounds:         as described in `keccak_f_1600_lanes`.
+        """
+        assert r % 64 == 0 and r + c == 1600
+        self.block_size = r // 8
+        self.digest_size = digest_size
+        self._suffix = suffix
+        self._lanes = [0] * 25
+        self._buffer = bytearray(self.block_size)
+        self._offset = 0
+        self._words = Struct("<{}Q".format(r // 64))
+        self._rounds = rounds
+        if data is not None:
+            self.update(data)
+
+    def update(self, data):
+        """
+        Absorbs more bytes into the state, permuting it every time a block
+        of `block_size` bytes is filled.
+
+        Args:
+            data:   list of bytes, or any bytes-like object.
+        """
+        if isinstance(data, list):
+            data = bytes(data)
+        view = memoryview(data).cast("B")
+        rate, buffer, offset = self.block_size, self._buffer, self._offset
+        position, length = 0, len(view)
+
+        if offset:
+            position = min(length, rate - offset)
+            buffer[offset : offset + position] = view[:position]
+            offset += position
+            if offset < rate:
+                self._offset = offset
+                return
+            self._absorb(buffer, 0)
+
+        while length - position >= rate:
+            self._absorb(view, position)
+            position += rate
+
+        self._offset = length - position
+        buffer[: self._offset] = view[position:]
+
+    def _absorb(self, block, position):
+        """
+        XORs a whole block into the lanes covered by the rate and permutes
+        the state.
+
+        Args:
+            block:      bytes-like object holding the block.
+            position:   offset of the block inside `block`.
+        """
+        lanes, words = self._lanes, self._words.unpack_from(block, position)
+        lanes[: len(words)] = map(xor, lanes, words)
+        _permute(lanes, self._rounds)
+
+    def copy(self):
+        """
+        Clones the hash object, so that a shared prefix does not need to be
+        absorbed again.
+
+        Returns:
+            A new object with the same partially absorbed state.
+        """
+        other = self.__class__.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        other._lanes = list(self._lanes)
+        other._buffer = bytearray(self._buffer)
+        return other
+
+    def reader(self):
+        """
+        Pads and permutes a copy of the state, so that the output can be
+        squeezed out of it on demand. The object itself is left untouched.
+
+        Returns:
+            A `KeccakReader` positioned at the start of the output.
+        """
+        other, rate = self.copy(), self.block_size
+        block = other._buffer
+        block[self._offset :] = bytes(rate - self._offset)
+
+        block[self._offset] ^= self._suffix
+        if (self._suffix & 0x80) and (self._offset == (rate - 1)):
+            other._absorb(block, 0)
+            block = bytearray(rate)
+        block[rate - 1] ^= 0x80
+        other._absorb(block, 0)
+
+        return KeccakReader(other._lanes, other._words, self._rounds)
+
+    def _squeeze(self, output_len):
+        """
+        Args:
+            output_len: length of hash output.
+
+        Returns:
+            Hash of the bytes absorbed so far.
+        """
+        return self.reader().read(output_len)
+
+    def digest(self):
+        """
+        Returns:
+            Hash of the bytes absorbed so far.
+        """
+        return self._squeeze(self.digest_size)
+
+    def hexdigest(self):
+        """
+        Returns:
+            Hash of the bytes absorbed so far, as a hexadecimal string.
+        """
+        return self.digest().hex()
+
+
+class KeccakReader:
+    """
+    Squeezing phase of the sponge, read as a stream. Blocks are only
+    permuted when the output reaches them, so an extendable-output function
+    such as SHAKE can be used as a keystream of any length without knowing
+    it beforehand, and whole blocks are written straight into the buffers
+    given by the caller.
+    """
+
+    def __init__(self, lanes, words, rounds=24):
+        """
+        Initializes the reader with the following attributes:
+
+            _lanes:     padded and permuted state array, holding the first
+                        block of output.
+            _words:     packs the lanes covered by the rate into bytes.
+            _rounds:    number of rounds of the permutation.
+            _block:     bytes of the current output block.
+            _position:  number of bytes of `_block` already read.
+
+        Args:
+            lanes, words, rounds:   as described above.
+        """
+        self._lanes = lanes
+        self._words = words
+        self._rounds = rounds
+        self._block = words.pack(*lanes[: words.size // 8])
+        self._position = 0
+
+    def readinto(self, buffer):
+        """
+        Fills a buffer with the next bytes of output.
+
+        Args:
+            buffer: writable bytes-like object, such as a `bytearray`.
+
+        Returns:
+            Number of bytes written, which is always the size of `buffer`.
+        """
+        view = memoryview(buffer).cast("B")
+        lanes, words = self._lanes, self._words
+        rate, count = words.size, words.size // 8
+        length = len(view)
+
+        written = min(length, rate - self._position)
+        view[:written] = self._block[self._position : self._position + written]
+        self._position += written
+
+        while length - written >= rate:
+            _permute(lanes, self._rounds)
+            words.pack_into(view, written, *lanes[:count])
+            written += rate
+
+        if written < length:
+            _permute(lanes, self._rounds)
+            self._block = words.pack(*lanes[:count])
+            self._position = length - written
+            view[written:] = self._block[: self._position]
+
+        return length
+
+    def read(self, n):
+        """
+        Args:
+            n:  number of bytes to be read.
+
+        Returns:
+            The next `n` bytes of output.
+        """
+        output = bytearray(n)
+        self.readinto(output)
+        return bytes(output)
+
+
+class SHA3Hash(KeccakHash):
+    """Incremental FIPS 202 SHA-3 hash function, see `SHA3`."""
+
+    size = None
+
+    def __init__(self, data=None):
+        assert self.size in [224, 256, 384, 512]
+        c = self.size * 2
+        KeccakHash.__init__(self, 1600 - c, c, 0x06, self.size // 8, data)
+
+
+class SHAKEHash(KeccakHash):
+    """
+    Incremental FIPS 202 SHAKE function, see `SHAKE`. As with `hashlib`, the
+    length of the output must be given to `digest`; `reader` returns a stream
+    of output of unbounded length instead.
+    """
+
+    size = None
+
+    def __init__(self, data=None):
+        assert self.size in [128, 256]
+        c = self.size * 2
+        KeccakHash.__init__(self, 1600 - c, c, 0x1F, 0, data)
+
+    def digest(self, length):
+        """
+        Args:
+            length: length of hash output.
+
+        Returns:
+            Hash of the bytes absorbed so far.
+        """
+        return self._squeeze(length)
+
+    def hexdigest(self, length):
+        """
+        Args:
+            length: length of hash output.
+
+        Returns:
+            Hash of the bytes absorbed so far, as a hexadecimal string.
+        """
+        return self.digest(length).hex()
+
+
+class SHA3_224(SHA3Hash):
+    """SHA3-224 hash object."""
+
+    name, size = "sha3_224", 224
+
+
+class SHA3_256(SHA3Hash):
+    """SHA3-256 hash object."""
+
+    name, size = "sha3_256", 256
+
+
+class SHA3_384(SHA3Hash):
+    """SHA3-384 hash object."""
+
+    name, size = "sha3_384", 384
+
+
+class SHA3_512(SHA3Hash):
+    """SHA3-512 hash object."""
+
+    name, size = "sha3_512", 512
+
+
+class SHAKE128(SHAKEHash):
+    """SHAKE128 extendable-output hash object."""
+
+    name, size = "shake_128", 128
+
+
+class SHAKE256(SHAKEHash):
+    """SHAKE256 extendable-output hash object."""
+
+    name, size = "shake_256", 256
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""sha3sum.py
+
+Command-line tool that prints or checks SHA-3/SHAKE checksums, in the same
+format as `sha3sum` and `sha256sum`. Each file is memory-mapped and absorbed
+straight from the mapped buffer, and many files are spread across a process
+pool. Usage:
+
+    python sha3sum.py [-a ALGO] [-l BITS] [-j N] [-c] [-r] [--hashlib] FILE...
+"""
+
+from __future__ import absolute_import
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import new as hashlib_new
+from mmap import ACCESS_READ, mmap
+from os import cpu_count
+from string import hexdigits
+from sys import stderr, stdin
+from time import perf_counter
+from keccakf1600 import SHA3_224, SHA3_256, SHA3_384, SHA3_512
+from keccakf1600 import SHAKE128, SHAKE256
+
+ALGORITHMS = {
+    "sha3-224": SHA3_224,
+    "sha3-256": SHA3_256,
+    "sha3-384": SHA3_384,
+    "sha3-512": SHA3_512,
+    "shake128": SHAKE128,
+    "shake256": SHAKE256,
+}
+
+CHUNK = 1 << 20
+
+
+def hash_file(path, algo, bits, use_hashlib=False):
+    """
+    Computes the checksum of a single file.
+
+    Args:
+        path:           path to the file, or "-" for the standard input.
+        algo:           key of `ALGORITHMS`.
+        bits:           output length for SHAKE, ignored for SHA-3.
+        use_hashlib:    whether `hashlib` should be used instead, so both
+                        implementations can be compared.
+
+    Returns:
+        The hexadecimal digest and the number of bytes hashed.
+    """
+    cls = ALGORITHMS[algo]
+    sponge = hashlib_new(cls.name) if use_hashlib else cls()
+
+    if path == "-":
+        size = 0
+        for chunk in iter(lambda: stdin.buffer.read(CHUNK), b""):
+            sponge.update(chunk)
+            size += len(chunk)
+    else:
+        with open(path, "rb") as raw:
+            raw.seek(0, 2)
+            size = raw.tell()
+            if size:
+                with mmap(raw.fileno(), 0, access=ACCESS_READ) as mapped:
+                    sponge.update(mapped)
+
+    if algo.startswith("shake"):
+        return sponge.hexdigest(bits // 8), size
+    return sponge.hexdigest(), size
+
+
+def _hash_job(args):
+    """Unpacks the arguments of `hash_file` inside a worker process."""
+    path, algo, bits, use_hashlib = args
+    try:
+        return hash_file(path, algo, bits, use_hashlib)
+    except OSError as error:
+        return error, 0
+
+
+def hash_files(paths, algo, bits, workers, use_hashlib=False):
+    """
+    Computes the checksums of many files, in worker processes if there is
+    more than one of them.
+
+    Args:
+        paths:          list of paths.
+        algo:           as described in `hash_file`.
+        bits:           as described in `hash_file`.
+        workers:        number of processes; `None` uses every CPU.
+        use_hashlib:    as described in `hash_file`.
+
+    Yields:
+        Tuples of path, digest (or the `OSError` raised) and size, in the
+        same order as `paths`.
+    """
+    jobs = [(path, algo, bits, use_hashlib) for path in paths]
+    workers = min(workers or cpu_count() or 1, len(jobs))
+
+    if workers <= 1 or "-" in paths:
+        results = map(_hash_job, jobs)
+        for path, (digest, size) in zip(paths, results):
+            yield path, digest, size
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_hash_job, jobs)
+        for path, (digest, size) in zip(paths, results):
+            yield path, digest, size
+
+
+def parse_checklist(paths):
+    """
+    Reads the lines written by this tool (or `sha3sum`) from check files.
+    As `sha3sum -c` does, unreadable files and improperly formatted lines
+    are reported on the standard error and skipped.
+
+    Args:
+        paths:  list of check files.
+
+    Returns:
+        List of expected digests and paths of the files to be checked, and
+        the number of files and lines that were skipped.
+    """
+    entries, skipped = [], 0
+    for path in paths:
+        try:
+            with open(path) as raw:
+                lines = raw.read().splitlines()
+        except (OSError, UnicodeDecodeError) as error:
+            reason = getattr(error, "strerror", None) or "not a text file"
+            print("sha3sum: {}: {}".format(path, reason), file=stderr)
+            skipped += 1
+            continue
+        for number, line in enumerate(lines, 1):
+            if not line:
+                continue
+            digest, _, name = line.partition(" ")
+            name = name.lstrip(" *")
+            if not name or not is_hex(digest):
+                print(
+                    "sha3sum: {}: {}: improperly formatted checksum "
+                    "line".format(path, number),
+                    file=stderr,
+                )
+                skipped += 1
+                continue
+            entries.append((digest.lower(), name))
+    return entries, skipped
+
+
+def is_hex(digest):
+    """
+    Args:
+        digest: text read from a check file.
+
+    Returns:
+        Whether it is a non-empty hexadecimal string with whole bytes.
+    """
+    return (
+        len(digest) > 0
+        and len(digest) % 2 == 0
+        and all(c in hexdigits for c in digest)
+    )
+
+
+def main():
+    """Parses the command line and prints the checksums or check results."""
+    parser = ArgumentParser(description="Print or check SHA-3 checksums.")
+    parser.add_argument("files", nargs="*", default=["-"])
+    parser.add_argument(
+        "-a", "--algo", choices=sorted(ALGORITHMS), default="sha3-256"
+    )
+    parser.add_argument(
+        "-l", "--length", type=int, default=None, help="SHAKE output bits"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("-c", "--check", action="store_true")
+    parser.add_argument(
+        "-r", "--rate", action="store_true", help="report bytes per second"
+    )
+    parser.add_argument(
+        "--hashlib", action="store_true", help="use hashlib, for comparison"
+    )
+    args = parser.parse_args()
+
+    paths, bits = args.files, args.length or 2 * ALGORITHMS[args.algo].size
+    skipped = 0
+    if args.check:
+        entries, skipped = parse_checklist(args.files)
+        paths = [name for _, name in entries]
+        if entries and not args.length:
+            bits = 4 * len(entries[0][0])
+    if bits % 8:
+        parser.error("the output length must be a multiple of 8")
+
+    start, total, failures = perf_counter(), 0, skipped
+    results = hash_files(paths, args.algo, bits, args.jobs, args.hashlib)
+    for i, (path, digest, size) in enumerate(results):
+        total += size
+        if isinstance(digest, OSError):
+            print("sha3sum: {}: {}".format(path, digest.strerror), file=stderr)
+            failures += 1
+        elif args.check:
+            ok = digest == entries[i][0]
+            failures += not ok
+            print("{}: {}".format(path, "OK" if ok else "FAILED"))
+        else:
+            print("{}  {}".format(digest, path))
+
+    if skipped:
+        print(
+            "sha3sum: WARNING: {} check file(s) or line(s) skipped".format(
+                skipped
+            ),
+            file=stderr,
+        )
+    if args.rate:
+        elapsed = perf_counter() - start
+        print(
+            "{} bytes in {:.3f} s ({:.0f} B/s)".format(
+                total, elapsed, total / elapsed if elapsed else 0
+            ),
+            file=stderr,
+        )
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""sp800_185.py
+
+SHA-3 derived functions from NIST SP 800-185 [1], built on the sponge objects
+of `keccakf1600.py`. All output lengths `L` are given in bits, as in the
+standard, and must be multiples of eight.
+
+[1] https://doi.org/10.6028/NIST.SP.800-185
+"""
+
+from __future__ import absolute_import
+from collections import OrderedDict
+from keccakf1600 import SHAKEHash
+
+
+def left_encode(x):
+    """
+    Encodes an integer as a byte string, prefixed by its own length.
+
+    Args:
+        x:  non-negative integer smaller than 2^2040.
+
+    Returns:
+        Length of `x` in bytes, followed by `x` itself in big-endian order.
+    """
+    n = max(1, (x.bit_length() + 7) // 8)
+    return bytes([n]) + x.to_bytes(n, "big")
+
+
+def right_encode(x):
+    """
+    Encodes an integer as a byte string, suffixed by its own length.
+
+    Args:
+        x:  non-negative integer smaller than 2^2040.
+
+    Returns:
+        `x` in big-endian order, followed by its length in bytes.
+    """
+    n = max(1, (x.bit_length() + 7) // 8)
+    return x.to_bytes(n, "big") + bytes([n])
+
+
+def encode_string(S):
+    """
+    Encodes a byte string unambiguously, so it can be parsed back from the
+    beginning of a longer string.
+
+    Args:
+        S:  bytes-like object.
+
+    Returns:
+        Length of `S` in bits, left encoded, followed by `S`.
+    """
+    return left_encode(8 * len(S)) + bytes(S)
+
+
+def bytepad(X, w):
+    """
+    Prepends an encoding of `w` to `X` and pads the result with zeros until
+    its length is a multiple of `w`.
+
+    Args:
+        X:  bytes-like object.
+        w:  block size in bytes, usually the rate of the sponge.
+
+    Returns:
+        The padded byte string.
+    """
+    z = left_encode(w) + bytes(X)
+    return z + bytes(-len(z) % w)
+
+
+class CSHAKEHash(SHAKEHash):
+    """
+    Customizable SHAKE function. With both the function name `N` and the
+    customization string `S` empty, it is equivalent to SHAKE; otherwise,
+    their encoding is absorbed as a whole block before any data, so a copy of
+    the object can be reused for every message under the same `N` and `S`.
+    """
+
+    def __init__(self, data=None, N=b"", S=b""):
+        """
+        Args:
+            data:   optional bytes to be absorbed right away.
+            N:      function name, reserved for functions defined by NIST.
+            S:      customization string chosen by the user.
+        """
+        SHAKEHash.__init__(self)
+        if N or S:
+            prefix = encode_string(N) + encode_string(S)
+            self._suffix = 0x04
+            self.update(bytepad(prefix, self.block_size))
+        if data is not None:
+            self.update(data)
+
+
+class CSHAKE128(CSHAKEHash):
+    """cSHAKE128 extendable-output hash object."""
+
+    name, size = "cshake_128", 128
+
+
+class CSHAKE256(CSHAKEHash):
+    """cSHAKE256 extendable-output hash object."""
+
+    name, size = "cshake_256", 256
+
+
+def cSHAKE(size, X, L, N=b"", S=b""):
+    """
+    SP 800-185 generalized instance of the cSHAKE function.
+
+    Args:
+        size:   instance of desired cSHAKE algorithm.
+        X:      bytes to compute a hash from.
+        L:      length of hash output, in bits.
+        N, S:   as described in `CSHAKEHash`.
+
+    Returns:
+        Hash of the input bytes.
+    """
+    assert size in [128, 256] and L % 8 == 0
+    cls = CSHAKE128 if size == 128 else CSHAKE256
+    return cls(X, N, S).digest(L // 8)
+
+
+class KeyedStateCache:
+    """
+    Bounded LRU cache of sponge states that have already absorbed the key
+    material of a MAC. Each MAC then starts from a copy of the cached state,
+    so only the message itself is absorbed, and the cost per message does not
+    depend on the length of the key.
+
+    Note that the cached states (and the keys used to look them up) stay in
+    memory until evicted; `evict` should be called when a key is retired.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Initializes the cache with the following attributes:
+
+            maxsize:    maximum number of states kept; the least recently
+                        used one is dropped when it is exceeded.
+            _states:    ordered mapping of `(size, K, S)` to sponge objects.
+
+        Args:
+            maxsize: as described above.
+        """
+        self.maxsize = maxsize
+        self._states = OrderedDict()
+
+    def __len__(self):
+        """Number of states currently cached."""
+        return len(self._states)
+
+    def get(self, size, K, S):
+        """
+        Looks up (or computes and stores) the state after absorbing a key.
+
+        Args:
+            size:   instance of desired KMAC algorithm.
+            K:      key, as bytes.
+            S:      customization string.
+
+        Returns:
+            A copy of the cached `CSHAKEHash` object, ready for the message.
+        """
+        index = (size, bytes(K), bytes(S))
+        state = self._states.get(index)
+        if state is None:
+            state = (CSHAKE128 if size == 128 else CSHAKE256)(N=b"KMAC", S=S)
+            state.update(bytepad(encode_string(K), state.block_size))
+            self._states[index] = state
+            if len(self._states) > self.maxsize:
+                self._states.popitem(last=False)
+        else:
+            self._states.move_to_end(index)
+        return state.copy()
+
+    def evict(self, K, S=None):
+        """
+        Drops every cached state derived from a key.
+
+        Args:
+            K:  key, as bytes.
+            S:  customization string; if `None`, states for every string
+                are dropped.
+
+        Returns:
+            Number of states dropped.
+        """
+        K = bytes(K)
+        stale = [
+            index
+            for index in self._states
+            if index[1] == K and (S is None or index[2] == bytes(S))
+        ]
+        for index in stale:
+            del self._states[index]
+        return len(stale)
+
+    def clear(self):
+        """Drops every cached state."""
+        self._states.clear()
+
+
+KMAC_CACHE = KeyedStateCache()
+
+
+def KMAC(size, K, X, L, S=b"", cache=KMAC_CACHE):
+    """
+    SP 800-185 generalized instance of the KECCAK Message Authentication
+    Code.
+
+    Args:
+        size:   instance of desired KMAC algorithm.
+        K:      key, as bytes.
+        X:      bytes to compute a MAC from.
+        L:      length of MAC output, in bits.
+        S:      customization string.
+        cache:  `KeyedStateCache` holding post-key states, or `None` to
+                absorb the key from scratch.
+
+    Returns:
+        MAC of the input bytes under `K`.
+    """
+    assert size in [128, 256] and L % 8 == 0
+    if cache is None:
+        cache = KeyedStateCache(0)
+    state = cache.get(size, K, S)
+    state.update(X)
+    state.update(right_encode(L))
+    return state.digest(L // 8)
+
+
+def KMAC128(K, X, L, S=b"", cache=KMAC_CACHE):
+    """KMAC with 128-bit security, see `KMAC`."""
+    return KMAC(128, K, X, L, S, cache)
+
+
+def KMAC256(K, X, L, S=b"", cache=KMAC_CACHE):
+    """KMAC with 256-bit security, see `KMAC`."""
+    return KMAC(256, K, X, L, S, cache)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""tree_hash.py
+
+Tree hashing modes on top of the Keccak sponge: ParallelHash from NIST
+SP 800-185 [1] and KangarooTwelve [2]. Both split the input into chunks
+(leaves) that are hashed independently, and then absorb the resulting
+chaining values into a final node. The leaves are hashed in batches spread
+across a process pool; only a bounded number of batches is in flight at any
+time, so memory usage does not grow with the size of the input.
+
+[1] https://doi.org/10.6028/NIST.SP.800-185
+[2] https://keccak.team/kangarootwelve.html
+"""
+
+from __future__ import absolute_import
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from keccakf1600 import KeccakHash
+from sp800_185 import CSHAKE128, CSHAKE256, left_encode, right_encode
+
+LEAVES_PER_TASK = 64
+K12_CHUNK = 8192
+
+
+def map_leaves(function, data, leaf_size, workers):
+    """
+    Applies `function` to consecutive batches of leaves of the input, in
+    worker processes, yielding the results in order.
+
+    Args:
+        function:   top-level function receiving a batch of leaves as bytes
+                    and the leaf size, returning their chaining values.
+        data:       bytes-like object, e.g. a memory-mapped file.
+        leaf_size:  size of each leaf in bytes.
+        workers:    number of processes; `None` uses every CPU, whereas 1
+                    hashes all leaves in the current process.
+
+    Yields:
+        Result of `function` for each batch.
+    """
+    step = leaf_size * LEAVES_PER_TASK
+    batches = (bytes(data[i : i + step]) for i in range(0, len(data), step))
+    workers = workers or cpu_count() or 1
+
+    if workers == 1 or len(data) <= step:
+        for batch in batches:
+            yield function(batch, leaf_size)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(function, batch, leaf_size))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _parallelhash128_leaves(batch, leaf_size):
+    """Chaining values of a batch of ParallelHash128 leaves."""
+    return b"".join(
+        CSHAKE128(batch[i : i + leaf_size]).digest(32)
+        for i in range(0, len(batch), leaf_size)
+    )
+
+
+def _parallelhash256_leaves(batch, leaf_size):
+    """Chaining values of a batch of ParallelHash256 leaves."""
+    return b"".join(
+        CSHAKE256(batch[i : i + leaf_size]).digest(64)
+        for i in range(0, len(batch), leaf_size)
+    )
+
+
+def ParallelHash(size, X, B, L, S=b"", workers=None):
+    """
+    SP 800-185 generalized instance of the ParallelHash function.
+
+    Args:
+        size:       instance of desired ParallelHash algorithm.
+        X:          bytes-like object to compute a hash from.
+        B:          block (leaf) size in bytes.
+        L:          length of hash output, in bits.
+        S:          customization string.
+        workers:    as described in `map_leaves`.
+
+    Returns:
+        Hash of the input bytes.
+    """
+    assert size in [128, 256] and B > 0 and L % 8 == 0
+    leaves = (
+        _parallelhash128_leaves if size == 128 else _parallelhash256_leaves
+    )
+    final = (CSHAKE128 if size == 128 else CSHAKE256)(N=b"ParallelHash", S=S)
+
+    final.update(left_encode(B))
+    for values in map_leaves(leaves, X, B, workers):
+        final.update(values)
+    final.update(right_encode(-(-len(X) // B)) + right_encode(L))
+    return final.digest(L // 8)
+
+
+def ParallelHash128(X, B, L, S=b"", workers=None):
+    """ParallelHash with 128-bit security, see `ParallelHash`."""
+    return ParallelHash(128, X, B, L, S, workers)
+
+
+def ParallelHash256(X, B, L, S=b"", workers=None):
+    """ParallelHash with 256-bit security, see `ParallelHash`."""
+    return ParallelHash(256, X, B, L, S, workers)
+
+
+def length_encode(x):
+    """
+    Encodes an integer as used by KangarooTwelve.
+
+    Args:
+        x:  non-negative integer.
+
+    Returns:
+        `x` in big-endian order without leading zeros, followed by its
+        length in bytes.
+    """
+    n = (x.bit_length() + 7) // 8
+    return x.to_bytes(n, "big") + bytes([n])
+
+
+def _turboshake(suffix, data=None):
+    """
+    The sponge used by KangarooTwelve: SHAKE128 reduced to 12 rounds.
+
+    Args:
+        suffix: domain separation byte.
+        data:   optional bytes to be absorbed right away.
+
+    Returns:
+        A `KeccakHash` object.
+    """
+    return KeccakHash(1344, 256, suffix, 32, data, rounds=12)
+
+
+def _k12_leaves(batch, leaf_size):
+    """Chaining values of a batch of KangarooTwelve leaves."""
+    return b"".join(
+        _turboshake(0x0B, batch[i : i + leaf_size]).digest()
+        for i in range(0, len(batch), leaf_size)
+    )
+
+
+def KangarooTwelve(M, C=b"", L=32, workers=None):
+    """
+    The KangarooTwelve extendable-output function. Inputs of up to 8 KiB
+    (including the customization string) are hashed by a single sponge;
+    longer ones use the first chunk as the final node, followed by the
+    chaining values of every other chunk.
+
+    Args:
+        M:          bytes-like object to compute a hash from.
+        C:          customization string.
+        L:          length of hash output, in bytes.
+        workers:    as described in `map_leaves`.
+
+    Returns:
+        Hash of the input bytes.
+    """
+    tail = bytes(C) + length_encode(len(C))
+    if len(M) + len(tail) <= K12_CHUNK:
+        return _turboshake(0x07, bytes(M) + tail).reader().read(L)
+
+    if len(M) < K12_CHUNK:
+        M, tail = bytes(M) + tail, b""
+    first, rest = M[:K12_CHUNK], memoryview(M)[K12_CHUNK:]
+    whole = len(rest) - len(rest) % K12_CHUNK
+
+    final, leaves = _turboshake(0x06, first), 0
+    final.update(b"\x03" + bytes(7))
+    for values in map_leaves(_k12_leaves, rest[:whole], K12_CHUNK, workers):
+        final.update(values)
+        leaves += len(values) // 32
+
+    tail = bytes(rest[whole:]) + tail
+    final.update(_k12_leaves(tail, K12_CHUNK))
+    leaves += -(-len(tail) // K12_CHUNK)
+
+    final.update(length_encode(leaves) + b"\xff\xff")
+    return final.reader().read(L)
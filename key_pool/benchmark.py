@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""benchmark.py
+
+Latency measurements for the key pool within this folder.
+"""
+
+from __future__ import absolute_import
+from os import remove
+from os.path import exists
+from tempfile import gettempdir
+from time import perf_counter
+from key_pool import KeyPool, _generate_rsa, decode_key
+
+
+def bench_take(bits=1024, count=8):
+    """Compares generating an RSA key on request with taking it from a pool."""
+    path = "{}/key_pool_benchmark.bin".format(gettempdir())
+    if exists(path):
+        remove(path)
+
+    start = perf_counter()
+    for _ in range(count):
+        decode_key(_generate_rsa(bits))
+    before = (perf_counter() - start) / count
+
+    with KeyPool(path, {"rsa": bits}, low=count, high=count) as pool:
+        pool.wait()
+    start = perf_counter()
+    with KeyPool(path, {"rsa": bits}, low=0, high=0) as pool:
+        opened = perf_counter() - start
+        start = perf_counter()
+        for _ in range(count):
+            pool.take_rsa()
+        after = (perf_counter() - start) / count
+    remove(path)
+
+    print(
+        "RSA-{}\tgenerated on request: {:.3f} s\topening the pool: {:.0f} us"
+        "\ttaken from the pool: {:.0f} us".format(
+            bits, before, opened * 1e6, after * 1e6
+        )
+    )
+
+
+if __name__ == "__main__":
+    bench_take()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103,C0413
+
+"""key_pool.py
+
+Pool of pre-generated RSA key pairs and Diffie-Hellman groups, so that
+handing out a key does not wait for a prime search. Keys are generated in
+worker processes and kept in an append-only file, which is memory-mapped
+when the pool is opened:
+
+    MAGIC | record | record | ...
+
+where each record is a header with its kind and payload length, followed by
+the payload. Keys are stored in the encoding of `../keystore/key_codec.py`,
+which includes the CRT parameters of RSA keys. Taking a key appends a
+record with the offset of the one taken, so the pool can be reopened after
+a restart without handing out a key twice; `compact` rewrites the file with
+the available keys only.
+
+Whenever fewer than `low` keys of a kind are available, jobs are submitted
+to a process pool until `high` keys are available or being generated;
+their results are appended to the file as they complete, without blocking
+callers of `take`.
+"""
+
+from __future__ import absolute_import
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import gcd
+from mmap import ACCESS_READ, mmap
+from os import fsync, replace
+from os.path import abspath, dirname, join
+from struct import Struct
+from threading import RLock
+import sys
+
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "mersenne_twister"))
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "diffie_hellman"))
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "rsa"))
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "keystore"))
+from dh_groups import generate_group
+from key_codec import decode_key, encode_key
+from primality_test import find_prime
+from rsa import RSA
+
+MAGIC = b"KEYPOOL2"
+HEADER = Struct("<BI")
+OFFSET = Struct("<Q")
+
+# exponent chosen by `RSA.__init__`
+PUBLIC_EXPONENT = 65537
+
+RSA_RECORD, DH_RECORD, TAKE_RECORD = 1, 2, 3
+KINDS = {"rsa": RSA_RECORD, "dh": DH_RECORD}
+
+
+def _generate_rsa(bits):
+    """
+    Encoded RSA key with a modulus of exactly `bits` bits. The product of
+    two primes of half the size is one bit short about half of the time, and
+    the public exponent must be invertible modulo the totient, so pairs are
+    drawn until both hold.
+    """
+    while True:
+        p = find_prime(bits // 2, workers=1).prime
+        q = find_prime(bits - bits // 2, workers=1).prime
+        if (
+            p != q
+            and (p * q).bit_length() == bits
+            and gcd(PUBLIC_EXPONENT, (p - 1) * (q - 1)) == 1
+        ):
+            return encode_key(RSA(p, q))
+
+
+def _generate_dh(bits):
+    """Encoded Diffie-Hellman group modulo a `bits`-bit prime."""
+    return encode_key(generate_group(bits, workers=1))
+
+
+GENERATORS = {RSA_RECORD: _generate_rsa, DH_RECORD: _generate_dh}
+
+
+class KeyPool:
+    """
+    Persistent pool of keys, refilled in the background. Every method may be
+    called from any thread.
+    """
+
+    def __init__(self, path, bits=None, low=4, high=16, workers=None):
+        """
+        Opens (or creates) the pool file and starts refilling it, with the
+        following attributes:
+
+            path:       path to the pool file.
+            bits:       mapping of kind ("rsa" or "dh") to the size of its
+                        keys in bits; only these kinds are generated.
+            low, high:  water marks; refilling starts when fewer than `low`
+                        keys of a kind are available, and stops at `high`.
+            workers:    number of generating processes; `None` uses every
+                        CPU.
+            _available: mapping of record kind to a queue of the offsets of
+                        its available records.
+            _pending:   mapping of record kind to the number of jobs running.
+            _error:     exception raised by the last failed job, until it is
+                        raised again by `take` or `wait`.
+            _map:       read-only memory map of the file.
+
+        Args:
+            path, bits, low, high, workers: as described above.
+        """
+        self.path = path
+        self.bits = bits or {"rsa": 2048, "dh": 2048}
+        self.low, self.high, self.workers = low, high, workers
+        self._sizes = {KINDS[kind]: size for kind, size in self.bits.items()}
+        self._available = {kind: deque() for kind in GENERATORS}
+        self._pending = {kind: 0 for kind in GENERATORS}
+        self._error = None
+        # reentrant, as a job that is already finished when `_refill` adds
+        # its callback runs `_done` right away, with the lock still held
+        self._lock = RLock()
+        self._executor = None
+        self._map = None
+
+        self._file = open(path, "a+b")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self._file.flush()
+        self._scan()
+        for record in self._sizes:
+            self._refill(record)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        """Number of available keys of every kind."""
+        return sum(map(len, self._available.values()))
+
+    def _remap(self):
+        """Maps the whole file again, after records were appended to it."""
+        self._file.flush()
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+
+    def _scan(self):
+        """
+        Rebuilds the queues of available records from the file, dropping a
+        truncated record at its end (e.g. from an interrupted write).
+        """
+        self._remap()
+        view, offset = self._map, len(MAGIC)
+        if view[:offset] != MAGIC:
+            raise ValueError("{} is not a key pool file.".format(self.path))
+
+        taken = set()
+        while offset + HEADER.size <= len(view):
+            kind, size = HEADER.unpack_from(view, offset)
+            if offset + HEADER.size + size > len(view):
+                break
+            if kind == TAKE_RECORD:
+                taken.update(OFFSET.unpack_from(view, offset + HEADER.size))
+            else:
+                self._available[kind].append(offset)
+            offset += HEADER.size + size
+
+        if offset < len(view):
+            self._map.close()
+            self._map = None
+            self._file.truncate(offset)
+            self._remap()
+        for kind, queue in self._available.items():
+            self._available[kind] = deque(i for i in queue if i not in taken)
+
+    def _append(self, kind, payload):
+        """
+        Appends a record to the file.
+
+        Args:
+            kind:       kind of the record.
+            payload:    bytes of the record.
+
+        Returns:
+            Offset of the new record.
+        """
+        self._file.seek(0, 2)
+        offset = self._file.tell()
+        self._file.write(HEADER.pack(kind, len(payload)) + payload)
+        self._file.flush()
+        return offset
+
+    def _read(self, offset):
+        """
+        Args:
+            offset: offset of a record.
+
+        Returns:
+            Kind and payload of the record.
+        """
+        if offset + HEADER.size > len(self._map):
+            self._remap()
+        kind, size = HEADER.unpack_from(self._map, offset)
+        start = offset + HEADER.size
+        if start + size > len(self._map):
+            self._remap()
+        return kind, self._map[start : start + size]
+
+    def available(self, kind):
+        """
+        Args:
+            kind: "rsa" or "dh".
+
+        Returns:
+            Number of keys of that kind ready to be taken.
+        """
+        return len(self._available[KINDS[kind]])
+
+    def take(self, kind):
+        """
+        Hands out a key, which is never handed out again. If the pool is
+        empty, a key is generated right away in the current process. If a
+        generation job failed since the last call to `take` or `wait`, its
+        exception is raised instead.
+
+        Args:
+            kind: "rsa" or "dh".
+
+        Returns:
+            An `RSA` object, or a `DHGroup` tuple.
+        """
+        record = KINDS[kind]
+        with self._lock:
+            self._raise_error()
+            if self._available[record]:
+                offset = self._available[record].popleft()
+                _, payload = self._read(offset)
+                self._append(TAKE_RECORD, OFFSET.pack(offset))
+            else:
+                payload = None
+            self._refill(record)
+        if payload is None:
+            payload = GENERATORS[record](self._sizes[record])
+        return decode_key(payload)
+
+    def take_rsa(self):
+        """Hands out an RSA key pair, see `take`."""
+        return self.take("rsa")
+
+    def take_dh(self):
+        """Hands out a Diffie-Hellman group, see `take`."""
+        return self.take("dh")
+
+    def _refill(self, record):
+        """
+        Submits generation jobs if fewer than `low` keys of a kind are
+        available, until `high` keys are either available or being
+        generated. Must be called with the lock held, or during `__init__`.
+
+        Args:
+            record: kind of record.
+        """
+        if record not in self._sizes or self._executor is False:
+            return
+        count = len(self._available[record]) + self._pending[record]
+        if len(self._available[record]) >= self.low or count >= self.high:
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        for _ in range(self.high - count):
+            job = self._executor.submit(
+                GENERATORS[record], self._sizes[record]
+            )
+            self._pending[record] += 1
+            job.add_done_callback(partial(self._done, record))
+
+    def _done(self, record, job):
+        """
+        Stores the result of a generation job, in the thread which
+        completed it.
+
+        Args:
+            record: kind of record.
+            job:    the finished future.
+        """
+        with self._lock:
+            self._pending[record] -= 1
+            if self._file.closed or job.cancelled():
+                return
+            if job.exception() is not None:
+                self._error = job.exception()
+                return
+            offset = self._append(record, job.result())
+            self._available[record].append(offset)
+
+    def _raise_error(self):
+        """
+        Raises the exception of the last failed generation job, if any, and
+        forgets it. Must be called with the lock held.
+        """
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def wait(self):
+        """
+        Blocks until every generation job submitted so far is finished, then
+        raises the exception of a failed one, as `take` does.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True)
+        with self._lock:
+            self._raise_error()
+
+    def compact(self):
+        """
+        Rewrites the file with the available keys only, dropping taken keys
+        and the records of their removal.
+        """
+        with self._lock:
+            temporary = self.path + ".tmp"
+            with open(temporary, "wb") as compacted:
+                compacted.write(MAGIC)
+                for queue in self._available.values():
+                    for offset in queue:
+                        kind, payload = self._read(offset)
+                        compacted.write(HEADER.pack(kind, len(payload)))
+                        compacted.write(payload)
+                compacted.flush()
+                fsync(compacted.fileno())
+            self._map.close()
+            self._file.close()
+            replace(temporary, self.path)
+
+            self._file = open(self.path, "a+b")
+            self._map = None
+            for queue in self._available.values():
+                queue.clear()
+            self._scan()
+
+    def close(self):
+        """Stops refilling, without waiting for jobs, and closes the file."""
+        with self._lock:
+            executor, self._executor = self._executor, False
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103,C0413
+
+"""benchmark.py
+
+Loading time measurements for the key store within this folder.
+"""
+
+from __future__ import absolute_import
+from os import remove
+from os.path import abspath, dirname, join
+from tempfile import gettempdir
+from time import perf_counter
+import sys
+
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "mersenne_twister"))
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "rsa"))
+from keystore import KeyStore, write_keystore
+from primality_test import random_prime
+from rsa import RSA
+
+
+def bench_open(bits=2048, count=100000, distinct=16):
+    """
+    Compares rebuilding every RSA object from its primes, as done before
+    keys could be stored, with opening a store and using some of its keys.
+    The store repeats a few distinct keys, since only loading is measured.
+    """
+    primes = [
+        (random_prime(bits // 2), random_prime(bits - bits // 2))
+        for _ in range(distinct)
+    ]
+    keys = [RSA(p, q) for p, q in primes]
+    path = "{}/keystore_benchmark.bin".format(gettempdir())
+    write_keystore(path, (keys[i % distinct] for i in range(count)))
+
+    start = perf_counter()
+    _ = [RSA(*primes[i % distinct]) for i in range(count)]
+    before = perf_counter() - start
+
+    start = perf_counter()
+    with KeyStore(path) as store:
+        opened = perf_counter() - start
+        start = perf_counter()
+        for i in range(0, count, count // 100):
+            _ = store[i]
+        first = (perf_counter() - start) / 100
+        start = perf_counter()
+        _ = list(store)
+        every = perf_counter() - start
+    remove(path)
+
+    print(
+        "{} RSA-{} keys\trebuilt from primes: {:.2f} s\t"
+        "opening the store: {:.0f} us\tfirst access: {:.0f} us\t"
+        "decoding all: {:.2f} s".format(
+            count, bits, before, opened * 1e6, first * 1e6, every
+        )
+    )
+
+
+if __name__ == "__main__":
+    bench_open()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103,C0413
+
+"""key_codec.py
+
+Compact binary encoding of RSA keys and Diffie-Hellman parameters. An
+encoded key is a single byte with its type, followed by its parameters,
+each as a big-endian integer prefixed by its length in two bytes:
+
+    type | length | integer | length | integer | ...
+
+Private RSA keys store their CRT parameters as well, so loading them costs
+no inverse or exponentiation at all. The types and their parameters are:
+
+    RSA_PRIVATE:    e, p, q, d, dp, dq, qinv    (`RSA` object)
+    RSA_PUBLIC:     n, e                        (`RSAPublicKey` tuple)
+    DH_GROUP:       p, q, g                     (`DHGroup` tuple)
+    DH_PRIVATE:     p, g, private               (`DiffieHellman` object)
+
+Groups encoded before `q` was stored have `p, g` only, and are decoded with
+the order `(p - 1) / 2` of a safe-prime group.
+"""
+
+from __future__ import absolute_import
+from os.path import abspath, dirname, join
+from struct import Struct
+import sys
+
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "mersenne_twister"))
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "diffie_hellman"))
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "rsa"))
+from dh_groups import DHGroup
+from diffie_hellman import DiffieHellman
+from rsa import RSA, RSAPublicKey
+
+LENGTH = Struct(">H")
+
+RSA_PRIVATE, RSA_PUBLIC, DH_GROUP, DH_PRIVATE = 1, 2, 3, 4
+
+
+def pack_ints(*values):
+    """
+    Args:
+        values: non-negative integers.
+
+    Returns:
+        Each integer in big-endian order, prefixed by its length in bytes.
+    """
+    out = bytearray()
+    for value in values:
+        raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+        out += LENGTH.pack(len(raw)) + raw
+    return bytes(out)
+
+
+def unpack_ints(buffer, offset=0):
+    """
+    Args:
+        buffer: bytes-like object written by `pack_ints`.
+        offset: position of the first length prefix in `buffer`.
+
+    Returns:
+        List of the integers.
+    """
+    values = []
+    while offset < len(buffer):
+        (size,) = LENGTH.unpack_from(buffer, offset)
+        offset += LENGTH.size
+        values.append(int.from_bytes(buffer[offset : offset + size], "big"))
+        offset += size
+    return values
+
+
+def encode_key(key):
+    """
+    Args:
+        key:    `RSA` object, `RSAPublicKey` tuple, `DHGroup` tuple or
+                `DiffieHellman` object.
+
+    Returns:
+        The encoded key.
+    """
+    if isinstance(key, RSA):
+        kind = RSA_PRIVATE
+        values = key.e, key.p, key.q, key.d, key.dp, key.dq, key.qinv
+    elif isinstance(key, RSAPublicKey):
+        kind, values = RSA_PUBLIC, (key.n, key.e)
+    elif isinstance(key, DHGroup):
+        kind, values = DH_GROUP, (key.p, key.q, key.g)
+    elif isinstance(key, DiffieHellman):
+        kind, values = DH_PRIVATE, (key.p, key.g, key.private)
+    else:
+        raise TypeError("Cannot encode {!r}.".format(type(key).__name__))
+    return bytes([kind]) + pack_ints(*values)
+
+
+def decode_key(buffer):
+    """
+    Args:
+        buffer: bytes-like object written by `encode_key`.
+
+    Returns:
+        The key, of the same type given to `encode_key`.
+    """
+    kind, values = buffer[0], unpack_ints(buffer, 1)
+    if kind == RSA_PRIVATE:
+        e, p, q, d, dp, dq, qinv = values
+        return RSA.from_components(p, q, d, dp, dq, qinv, e)
+    if kind == RSA_PUBLIC:
+        return RSAPublicKey(*values)
+    if kind == DH_GROUP:
+        if len(values) == 2:
+            p, g = values
+            return DHGroup(p, (p - 1) // 2, g)
+        return DHGroup(*values)
+    if kind == DH_PRIVATE:
+        p, g, private = values
+        return DiffieHellman(private, p, g)
+    raise ValueError("Unknown key type {}.".format(kind))
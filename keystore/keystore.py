@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""keystore.py
+
+Read-only sets of keys stored in a single file, in the encoding of
+`key_codec.py`, behind an index of offsets:
+
+    MAGIC | count | offset[0] | ... | offset[count] | key | key | ...
+
+where key `i` spans from `offset[i]` to `offset[i + 1]`. Opening a store
+only maps the file into memory and reads `count`; each key is located
+through the index and decoded on its first access, so opening does not
+depend on the number of keys stored, and keys that are never used are
+never read from disk.
+"""
+
+from __future__ import absolute_import
+from mmap import ACCESS_READ, mmap
+from os import fsync, replace
+from struct import Struct
+from key_codec import decode_key, encode_key
+
+MAGIC = b"KEYSTOR1"
+OFFSET = Struct("<Q")
+
+
+def write_keystore(path, keys):
+    """
+    Writes a new store, replacing any file at `path` only once it is
+    complete.
+
+    Args:
+        path:   path to the store file.
+        keys:   iterable of keys accepted by `encode_key`.
+
+    Returns:
+        Number of keys written.
+    """
+    records = [encode_key(key) for key in keys]
+    offset = len(MAGIC) + OFFSET.size * (len(records) + 2)
+    index = [OFFSET.pack(len(records)), OFFSET.pack(offset)]
+    for record in records:
+        offset += len(record)
+        index.append(OFFSET.pack(offset))
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as store:
+        store.write(MAGIC)
+        store.write(b"".join(index))
+        store.write(b"".join(records))
+        store.flush()
+        fsync(store.fileno())
+    replace(temporary, path)
+    return len(records)
+
+
+class KeyStore:
+    """
+    Memory-mapped store of keys, decoded lazily. Supports `len`, indexing
+    and iteration, like a read-only list.
+    """
+
+    def __init__(self, path):
+        """
+        Opens the store file with the following attributes:
+
+            path:   path to the store file.
+            _map:   read-only memory map of the file.
+            _count: number of keys stored.
+            _keys:  mapping of position to the keys decoded so far.
+
+        Args:
+            path: as described above.
+        """
+        self.path = path
+        with open(path, "rb") as store:
+            self._map = mmap(store.fileno(), 0, access=ACCESS_READ)
+        if self._map[: len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError("{} is not a key store file.".format(path))
+        (self._count,) = OFFSET.unpack_from(self._map, len(MAGIC))
+        self._keys = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        """Number of keys stored."""
+        return self._count
+
+    def __iter__(self):
+        """Yields every key, in order."""
+        for i in range(self._count):
+            yield self[i]
+
+    def __getitem__(self, i):
+        """
+        Args:
+            i: position of a key, which may be negative.
+
+        Returns:
+            The key, decoded if this is its first access.
+        """
+        if i < 0:
+            i += self._count
+        key = self._keys.get(i)
+        if key is None:
+            key = self._keys[i] = decode_key(self.raw(i))
+        return key
+
+    def raw(self, i):
+        """
+        Args:
+            i: non-negative position of a key.
+
+        Returns:
+            The encoded key, as stored in the file.
+        """
+        if not 0 <= i < self._count:
+            raise IndexError("Key store index out of range.")
+        position = len(MAGIC) + OFFSET.size * (i + 1)
+        (start,) = OFFSET.unpack_from(self._map, position)
+        (end,) = OFFSET.unpack_from(self._map, position + OFFSET.size)
+        return self._map[start:end]
+
+    def close(self):
+        """Unmaps the file; keys already decoded remain usable."""
+        self._map.close()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""benchmark.py
+
+Throughput measurements for the Mersenne Twister implementation within this
+folder.
+"""
+
+from __future__ import absolute_import
+from os import cpu_count
+from time import perf_counter
+from mt19937 import JUMPABLE, MT19937, Preset, check_polynomials
+from primality_test import (
+    find_prime,
+    is_prime,
+    is_prime_many,
+    miller_rabin,
+    random_odd,
+    random_prime,
+    sieved_candidates,
+)
+
+
+def elapsed(function, repeat=3):
+    """
+    Measures how long a function takes to run.
+
+    Args:
+        function:   callable without arguments.
+        repeat:     number of runs, of which the fastest one is kept.
+
+    Returns:
+        Seconds taken by the fastest run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def bench_bulk(count=1 << 18):
+    """Compares repeated calls to `generate` with the bulk methods."""
+    gen = MT19937(5489, *Preset.MT19937)
+    before = elapsed(lambda: [gen.generate() for _ in range(count)])
+    after = elapsed(lambda: gen.generate_many(count))
+    raw = elapsed(lambda: gen.random_bytes(4 * count))
+    print(
+        "{} words\tgenerate: {:.0f} w/s\tgenerate_many: {:.0f} w/s ({:.1f}x)"
+        "\trandom_bytes: {:.0f} w/s ({:.1f}x)".format(
+            count,
+            count / before,
+            count / after,
+            before / after,
+            count / raw,
+            before / raw,
+        )
+    )
+
+
+def bench_jump(steps=1 << 20):
+    """Compares discarding outputs with jumping over them."""
+    gen = MT19937(5489, *Preset.MT19937)
+    before = elapsed(lambda: gen.skip(steps), 1)
+    first = elapsed(lambda: gen.jump(steps), 1)
+    after = elapsed(lambda: gen.jump(steps))
+    far = elapsed(gen.jumped)
+    print(
+        "{} steps	skip: {:.3f} s	first jump: {:.3f} s	jump: {:.3f} s"
+        "	jumped (2^128 steps): {:.3f} s".format(
+            steps, before, first, after, far
+        )
+    )
+    for params in sorted(JUMPABLE):
+        start = perf_counter()
+        assert check_polynomials(params)
+        print(
+            "w = {}\tpolynomials checked: {:.3f} s".format(
+                params[0], perf_counter() - start
+            )
+        )
+
+
+def bench_state(count=1000):
+    """Compares seeding a new generator with restoring a saved state."""
+    gen = MT19937(5489, *Preset.MT19937)
+    state = gen.getstate()
+    seeded = elapsed(lambda: MT19937(5489, *Preset.MT19937))
+    saved = elapsed(lambda: [gen.getstate() for _ in range(count)]) / count
+    restored = elapsed(
+        lambda: [MT19937.from_state(state) for _ in range(count)]
+    )
+    print(
+        "seeding: {:.1f} us	getstate: {:.1f} us	from_state: {:.1f} us".format(
+            seeded * 1e6, saved * 1e6, restored / count * 1e6
+        )
+    )
+
+
+def bench_primes(sizes=(512, 1024, 2048), count=3):
+    """
+    Compares testing random odd numbers with Miller-Rabin until one is prime
+    with testing only the candidates that survive the sieve.
+    """
+    gen = MT19937(5489, *Preset.MT19937_64)
+
+    def naive(bits):
+        """Number of candidates tested before finding a prime."""
+        tested = 1
+        while not miller_rabin(random_odd(bits, gen), 10):
+            tested += 1
+        return tested
+
+    def sieved(bits):
+        """Number of candidates tested before finding a prime."""
+        for tested, n in enumerate(sieved_candidates(bits, gen), 1):
+            if miller_rabin(n, 10):
+                return tested
+        return None
+
+    for bits in sizes:
+        before, after = [], []
+        time_before = elapsed(
+            lambda: [before.append(naive(bits)) for _ in range(count)], 1
+        )
+        time_after = elapsed(
+            lambda: [after.append(sieved(bits)) for _ in range(count)], 1
+        )
+        print(
+            "{} bits\tnaive: {:.1f} tests, {:.2f} s\t"
+            "sieved: {:.1f} tests, {:.2f} s".format(
+                bits,
+                sum(before) / count,
+                time_before / count,
+                sum(after) / count,
+                time_after / count,
+            )
+        )
+
+
+def bench_primality(sizes=(32, 64, 80, 512, 1024, 2048), count=20):
+    """
+    Compares `miller_rabin` with 10 random bases with `is_prime`, on primes
+    (which take every iteration) and on random odd numbers, and tests the
+    latter again in a single batch with `is_prime_many`.
+    """
+    gen = MT19937(5489, *Preset.MT19937_64)
+    for bits in sizes:
+        primes = [random_prime(bits, gen=gen) for _ in range(count)]
+        odds = [random_odd(bits, gen) for _ in range(50 * count)]
+        rates = []
+        for numbers in (primes, odds):
+            before = elapsed(lambda: [miller_rabin(n, 10) for n in numbers])
+            after = elapsed(lambda: [is_prime(n) for n in numbers])
+            rates.extend([len(numbers) / before, len(numbers) / after])
+        batch = elapsed(lambda: is_prime_many(odds), 1)
+        rates.append(len(odds) / batch)
+        print(
+            "{} bits\tprimes: {:.0f} -> {:.0f} n/s\t"
+            "odd numbers: {:.0f} -> {:.0f} n/s\t"
+            "is_prime_many: {:.0f} n/s".format(bits, *rates)
+        )
+
+
+def bench_find_prime(bits=1024, count=5):
+    """Measures how the time to find a prime scales with the processes."""
+    for workers in sorted({1, 2, cpu_count() or 1}):
+        results = [find_prime(bits, workers) for _ in range(count)]
+        seconds = sorted(result.seconds for result in results)
+        print(
+            "{} bits, {} worker(s)\tmean: {:.2f} s\tmedian: {:.2f} s\t"
+            "max: {:.2f} s\ttested: {:.1f}".format(
+                bits,
+                workers,
+                sum(seconds) / count,
+                seconds[count // 2],
+                seconds[-1],
+                sum(result.tested for result in results) / count,
+            )
+        )
+
+
+if __name__ == "__main__":
+    bench_bulk()
+    bench_jump()
+    bench_state()
+    bench_primes()
+    bench_primality()
+    bench_find_prime()
@@ -4,34 +4,24 @@
 
 """find_primes.py
 
-Naïve script to generate pseudorandom numbers and test their primality.
+Script to generate pseudorandom primes of increasing bit lengths, with the
+sieved search of `primality_test.py` running on every CPU.
 """
 
 from __future__ import absolute_import
-from datetime import datetime
-from mt19937 import MT19937
-from primality_test import miller_rabin
+from primality_test import find_prime
 
-mt19937_32 = (
-    624,
-    397,
-    31,
-    0x9908B0DF,
-    11,
-    0xFFFFFFFF,
-    7,
-    0x9D2C5680,
-    15,
-    0xEFC60000,
-    18,
-    1_812_433_253,
-)
-start = datetime.now()
 
-for i in range(100, 4000, 100):
-    for j in range(10000):
-        n = MT19937(datetime.now().microsecond, i, *mt19937_32).generate()
-        if miller_rabin(n, 10):
-            end = datetime.now()
-            print("Time: {}\tBits: {}\nNumber: {}".format(end - start, i, n))
-            break
+def main():
+    """Prints a probable prime for each bit length, as they are found."""
+    for bits in range(100, 4000, 100):
+        result = find_prime(bits)
+        print(
+            "Time: {:.3f} s\tBits: {}\tTested: {}\nNumber: {}".format(
+                result.seconds, bits, result.tested, result.prime
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
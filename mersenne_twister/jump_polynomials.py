@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""jump_polynomials.py
+
+Precomputed polynomials over GF(2) for the jump-ahead of `mt19937.py`,
+indexed by the `(w, n, m, r, a)` parameters of the standard 32- and 64-bit
+generators, with bit `i` of each integer holding the coefficient of x^i:
+the characteristic polynomial `P` of the recurrence, and x^(2^128) mod P,
+which `jumped` and `stream_pool` use for every stream. Both can be derived
+again, far more slowly, with `mt19937.check_polynomials`.
+"""
+
+CHARACTERISTIC_POLYNOMIALS = {
+    # MT19937, degree 19937
+    (32, 624, 397, 31, 0x9908B0DF): int(
+        "20000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000400000000000000000000000000000000000000000000000"
+        "00000000080000000000000000000000000000000000000000000000000000000100"
+        "00000000000000000000000000000000000000008000000000000020000000000000"
+        "00000000000000000000000000000000000000000004000000000000000000000000"
+        "00000000000000000200000000000000800000000000000000000000000100000000"
+        "00000000000000000000100000000000000000000000000020000000000000080000"
+        "00000000020000000000000000000000000000000000000000000000000000000040"
+        "00000000000200000000000000000000000000002000000000000008000000000000"
+        "00000000000000100000000000000000000000000001000000000000000000000000"
+        "00020000000000000080000000000004200000000000000000000000000000000000"
+        "00000000000000000000840000000000002000000000000000000000000000020000"
+        "00000000108000000000000000000000000001000000000000000000000000000210"
+        "00000000000000000000000000200000000000000800000000000002000000000000"
+        "00000000000000000000000000000000000000000000400000000000020000000000"
+        "00100000000000000020000000000000080000000000000000000000000210000000"
+        "00000000000000000000010000000000000000000000000002000000000000008000"
+        "00000000042000000000002000000000000000000000000000000000000000000084"
+        "00000000000020000000000000000000000000000200000000000010800000000000"
+        "00000000000000010000000000000000000000000002100000000000000000000000"
+        "00002000000000000008000000000000020000000000000000000000000000000000"
+        "00000000000000000000004000000000000200000000000010000000000000002000"
+        "00000000000800000000000000000000000002100000000000000000000000000001"
+        "00000000000000000000000000020000000000000080000000000004200000000000"
+        "20000000000000000000000000000000000000000000840000000000002000000000"
+        "00000000000000000002000000000000108000000000000020000000000001000000"
+        "00000000000000000000021000000000000000000000000000200000000000000800"
+        "00000000000200000000000000000000000000000000000000000000000000000000"
+        "00000000000002000000000000100000000000000020000000000400000000000000"
+        "00000000000000021000000000000000000000000080000000000000000000000000"
+        "00000200000000000000000000000010040000000000002000000000000000000000"
+        "00000800000000000002008000000000000020000000000000000000000000000000"
+        "00000000001000000000000000000000000000000000000000200000000000000002"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00001000000000000000000000000000000000000000200000000000000002000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000020000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000040000000000000000000000000000000000000000000000000000000080"
+        "00000000000000000000000000000000000000000000000000000010000000000000"
+        "00000000000000000000000000000800000000000002000000000002000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000020000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000002000000000000000000000000000000000000000000000000000000000"
+        "20000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000020000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000200000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000040000000000000000000000000000000000000000000000000"
+        "00000008000000000000000000000000000000000000000000000000000000010000"
+        "00000000000000000000000000000000000000000000000000002000000000000000"
+        "00000000000000000000000000000000000000000400000000000000000000000000"
+        "00000000000000000000000000000080000000000000000000000000000000000000"
+        "00000000000000000010000000000000000000000000000000000000000000000000"
+        "00000002000000000000000000000000000000000000000000000000000000000000"
+        "00000000020000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000400000000000000000000000000000000000000"
+        "00000000000000000080000000000000200000000000000000000000000000000000"
+        "00000010000000000000000000000000000000000000000000000000000000020000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "000000000000000000001",
+        16,
+    ),
+    # MT19937_64, degree 19937
+    (64, 312, 156, 31, 0xB5026F5AA96619E9): int(
+        "20000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000004000000000000000000000000000000000000004000000000000000000"
+        "00000000000000000000400000000000000000000000000000000000000400000000"
+        "00000000000000000000000000000040000000000000000000000000000000000000"
+        "04000000000000000000000000000000000000024000000000000000000000000000"
+        "00000000000400000000000000000000000000000000000000400000000000000000"
+        "00000000000000000000040000000000000000000000000000000000000a40000000"
+        "00000000000000000000000000000004000000000000000000000000000000000000"
+        "18400000000000000000000000000000000000010400000000000000000000000000"
+        "00000000002240000000000000000000000000000000000000040000000000000000"
+        "00000000000000000000404000000000000000000000000000000000000404000000"
+        "0000000000000000000000000000004a400000000000000000000000000000000000"
+        "04040000000000000000000000000000000000005840000000000000000000000000"
+        "00000000000504000000000000000000000000000000000002624000000000000000"
+        "00000000000000000000040400000000000000000000000000000000000400400000"
+        "00000000000000000000000000000040040000000000000000000000000000000000"
+        "060a4000000000000000000000000000000000004004000000000000000000000000"
+        "00000000000018400000000000000000000000000000000000010400000000000000"
+        "00000000000000000000002240000000000000000000000000000000000000040000"
+        "00000000000000000000000000000000404000000000000000000000000000000000"
+        "0004040000000000000000000000000000000000804a400000000000000000000000"
+        "00000000000004040000000000000000000000000000000001805840000000000000"
+        "00000000000000000000100504000000000000000000000000000000000082624000"
+        "00000000000000000000000000000000040400000000000000000000000000000000"
+        "01840040000000000000000000000000000000001040040000000000000000000000"
+        "000000000008860a4000000000000000000000000000000000004004000000000000"
+        "00000000000000000000198018400000000000000000000000000000000110010400"
+        "00000000000000000000000000000000802240000000000000000000000000000000"
+        "00000004000000000000000000000000000000004180404000000000000000000000"
+        "0000000000041004040000000000000000000000000000000048004a400000000000"
+        "00000000000000000000040004040000000000000000000000000000000058005840"
+        "00000000000000000000000000000005000504000000000000000000000000000000"
+        "02400262400000000000000000000000000000000400040400000000000000000000"
+        "00000000000000040040000000000000000000000000000000000040040000000000"
+        "000000000000000000000a00060a4000000000000000000000000000000000004004"
+        "00000000000000000000000000000008000018400000000000000000000000000000"
+        "00000001040000000000000000000000000000001000002260000000000000000000"
+        "00000000000000000004000000000000000000000000000000000000400000000000"
+        "0000000000000000000000000004000000000000000000000000000000001000804a"
+        "00000000000000000000000000000000000004000000000000000000000000000000"
+        "00100180580000000000000000000000000000000000100500000000000000000000"
+        "00000000000000008260000000000000000000000000000000000000040000000000"
+        "00000000000000000000000001840000000000000000000000000000000001001040"
+        "00000000000000000000000000000000100886000000000000000000000000000000"
+        "00010000400000000000000000000000000000000000198000000000000000000000"
+        "00000000000001011000000000000000000000000000000000000000800000000000"
+        "00000000000000000000000000000000000000000000000000000000000000104180"
+        "00000000000000000000000000000000000410000000000000000000000000000000"
+        "00001048000000000000000000000000000000000000040000000000000000000000"
+        "00000000000000105800000000000000000000000000000000000105000000000000"
+        "00000000000000000000000012400000000000000000000000000000000000010400"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "000000000000000000000000000000000000000000001a0000000000000000000000"
+        "00000000000000010000000000000000000000000000000000000008000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000001000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000010000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000001000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000100000000000000000000000000000000000000100"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000001000000000000000000000000000000000000001000000000000000000000"
+        "00000000000000000100000000000000000000000000000000000000100000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000010"
+        "00000000000000000000000000000000000001000000000000000000000000000000"
+        "00000000100000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000010000000000"
+        "00000000000000000000000000001000000000000000000000000000000000000001"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000010000000000000000000"
+        "00000000000000000001000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000000000000000000000000000000000"
+        "00000000000000000000000000000000000000010000000000000000000000000000"
+        "00000000001000000000000000000000000000000000000000000000000000000000"
+        "000000000000000000001",
+        16,
+    ),
+}
+
+JUMP_POLYNOMIALS = {
+    # MT19937
+    (32, 624, 397, 31, 0x9908B0DF): int(
+        "23eee45780a4a0ef151a52caeb6572d6738f420b962813b9a13d092973da60e43b22"
+        "07e883d145bcb0c92d3208722d7fa44c4ddf775c20d67ec1252819e1a74d639cb063"
+        "5eb360ec8cd6e865ff195e03dfa2861f950faac1a64ab733165795c2b82a2d07303a"
+        "cd045aa2b047b359bd5e29a3ee70764041aae79e435a8e53ff2549dec2f4edaedb37"
+        "12ce5fd487d31f390df2b622121005b9528c6a42b3d3d66f072d997b14b7f688ca67"
+        "e7feedc6266db35cc8f87c86232a553e33f7e479da34b97f2b0a72c5b57f38c8c85c"
+        "b63cd2f7e98d0a02aa7dfafd754a64ab3e6cc58a88cdfbf1816d7f42ebbbd878706d"
+        "24958e262d891f5e048a4b7c6a7b902ffd419579f8f8a2859c5285fdbe4878fb88aa"
+        "d3c2cd3e9cb66a13180db0e90e62955f1701dd8d63660519ed73ee326d9a7cbe635a"
+        "f9bd70308a34b078a23165606c0c3c850d3c6fe9593d40d9fdbe6eab7da885eea780"
+        "4f9ff10488b30f901eec4c73da36738d8405b4ae1057e025a84866303cf2a8381bba"
+        "fc54ccc15e472546326e932c038efc24a0a9095ffccb535172e392d0c3c5b4132090"
+        "232a35b20c31ec84113296f1b15987ed866519a21cdfa6bcdbfbeb93302c16410162"
+        "4325abd5ea2563ecd3b290327a265c02f47f535d71387d05b323ef645dd6f8cd68b0"
+        "87fe9735601e2c75b9f70031ccd9fa387d1886643796cf7006c40c25c7a1931a3c1e"
+        "511aea660549be8e76017a7b3bba7295647e63dfca073637050a3a1797d98a285c06"
+        "8b3fd2a6a19b67f210a7962041c394c85ccd36bdee48a9263e573194846a67338e51"
+        "0006e550fdba3b2d8ba23e5c217efa99231bb12ac825598f39cdfac8ffbc9b494ce1"
+        "465f2df8945682db06a2847883e7fe48a3d987b81f887dd15656cca45c2b540ad0cd"
+        "c82cc5907f19cd33873c012541cac738d24726578385a5a250e1350ac2dd9873c321"
+        "a3b7321f964f8501ba016830231f10e7d86bec7a7e037b6b5d2268d9054032407b25"
+        "68ec2bd704cf82c9bcf917b4d42cfc2fd4a62491156c39c6b81c3e3c85615e8d5619"
+        "6090566191555389151fd405548aa4e661466f51e9c04e893d087e22444d59d35db4"
+        "bc6b690735997f5ba7970adc18b68d763a8c7ac4a188b628043e05c862a846c714b9"
+        "409b507d86ada470ed46b93894e6ec8d36a851ddba657a589ce601a0f30c0ce9998c"
+        "4affedf8f12b8594145a8a944ef9d24757b42091ce44c99114de82d756d223875cf7"
+        "cb001892722f0317afde012b1dda74164e3d096ae51108ed0deb138c398b05806a06"
+        "b25c648c3570a283bdf6c495ebc179676e7ab1ed3e17d094591bc1597ea0de982175"
+        "4690364a446157f20eef81bfd18ccb5eaec289dfd8fe916f3c5cb955ae056412be2f"
+        "807487cbf3c965eb5539f9f41e41f850f7f644803a65e5fca3cd858ee284281901c6"
+        "e4c5d4fcfb2864e735c6ee0b65873b06e716500e6c9e785840f361bf34fe8179b726"
+        "1a5fb27e023bb4dd303282bfac225d6c254c86d3323bd99df507db3d2ac274b851e4"
+        "60854fb307d38d7f94b4340745746bc2e690d058c4be33dd2a73a1a1bb03335e166c"
+        "2c1b424e389cdfca6259bc47fcdf9065af4efd769663695ed01ff28b88663eed2af6"
+        "c51267e9de0761a6ea9ca5a30c62a756a0dbff9e47a3235e816f533c52c416679bc7"
+        "2523f866e2da9cd5ecaae4f20c9c11b59c560422260e61e0e6be82302b4784278164"
+        "c36fb83d2e8489f95eb5bb742e3006d1a911aaddbf6b3ad6af4049f028c4386f5608"
+        "27fe0071cb978be5750c7e77e0dadfcd487cf00a255a0ceac5c9f075b8b8ed84973c"
+        "cef1123e14ac952c48642afc8700b723753c1ca83c11056284e663c48e6c4f72609c"
+        "a0038ffb95ea210ad2bfc365017a2fba05edc0c864f8c5427e0885c39b207fc53690"
+        "7890addec4a3898c9805c7ad66158a1e06d90ac573370568a7cb0aa9b7d47c428045"
+        "23f1b23c2aedf5ebe7f3d14265d44c80bc42966c709ea4d7f84f529fee9d09884265"
+        "bdc8cfa2cfaf5a3ea53a92a400ccc442aa853838738dfc2ab9749667b575f8993a2c"
+        "282026061dc181670a57a350c0ee54384ad4b0b6f6624a9fa0426862af7bf8b8e16e"
+        "96004a47b601bb28048f776dab1d0c2581fe8f32080533c020f8f5e002b4c0959376"
+        "70c74d79a2e88f9503feac088c30a34ce0cb47d10e13142fdc5c72a6013755e311bb"
+        "b86346b536702e5fca688c0e0b2c56814d163861e7cf46b4891268a5bb8c4545f990"
+        "23e2e87994ba965118d4c235f16c893da4ee87c1a95f1b32eb97d777f03904f8ed86"
+        "13cffb2f716c1ae1ffeb55387d9820ac5d6940240bddc87dfd1a431becc5cb659526"
+        "948ed98ca57993461dcbad0ca5183ced6a5b1910bb3947b592cb7c49e7a451bd358f"
+        "49b8eb3126c6f9f4230e6cd9602a3a14efc68605c42a508e462cffbc33bb99291109"
+        "0e418c6ba748d91d5d335cc284d4bebb80a7ad5209045bc061743cddde5e897754d8"
+        "71b695928926e38f38308f58df141323635c75c7c30bee5b963a3612a9321adda254"
+        "e42db5c30ec996c47491dc80086d1441c9c3356eef7891c28b395475baceffab42fd"
+        "b71ca8b71f72b11a50fa780b721611004b0033800f2441cefcfb0ce2c627f9f2ad79"
+        "96285fe95113d708247fd90d6e1547dfd69ff4765b015c77677bcf20cf3bb7d36775"
+        "9f41164a95171796c9ca3bf6bcad693f834e8087527dc1a961e7aaf1283594724fa6"
+        "09f28992aefd3b60af74f1fa779a72b5583280b553586d6aafb6641eaedbccc48294"
+        "7f5ceab1f32b13f067eb90e30aa4c4c89b45b90349d78dc3bf49b815e190aa6f20c0"
+        "d09603a2436abe2833957cb78166cbdca6f23b702ed7ebfb61f3b34420d12c618d4e"
+        "9d6116bbc588f396f213a9b5ae4d8e96ce68ad39f2c72905d5c66fc3a4149d1ccfba"
+        "4997f53bdbeda7a585824a5840d9ba8bc89da4369751dfac7287becff8b2dd23ee6d"
+        "604168ae842731c72892ce4ca1cf0b40d6de80e9c8a082421d08f055974ac066a48c"
+        "7778a498c3ed878b32239b5e9a3a1f6aa87d2c4cdb891ba1158f3ee3d205d3f8525e"
+        "913b9a96140e87ef1330cc8567e751e8abcc80c242eee89795f0fb7b78a114c9264a"
+        "cc0403e73d28200570eb9819557fb4f26ca75288b589d6be8546192ddf99c8cacd44"
+        "7f8282d473b5ccd8cd43455c253c5486e75c95199e4642189d97aed5ca6ae0a21d85"
+        "98319438c481bf04b4001f91de14f43b956c56bcfcbc73cda5ed77683b94ce524851"
+        "9573a0de870ed96981c9e659ca3ee37db2bb3bfcf0f7d60e2c9b852860ddf78d585d"
+        "0ec08ea9cfab8e8442e947416177cf5f3e5bd61cfed320dfb761b39b8f42ef5c803b"
+        "d884703b5561fd58f0d3decab8334d099afef574e2a67de65147dcbf01bd8267febd"
+        "07bc893a7c83c1814c7b3354845609eaf2e8af6131d3e96d39ce3e928b830b4849aa"
+        "e4b0adb9bf2812d548b5e7568b521777e7fdbb15041f225926d83e59a823f8e58827"
+        "9bb6b5709ec472de3963",
+        16,
+    ),
+    # MT19937_64
+    (64, 312, 156, 31, 0xB5026F5AA96619E9): int(
+        "143ed6f2e7de2dae2aa415d2c94508c05dda26a0638fa314d5c46ab53fa9adc855e5"
+        "3297ccdf09ed99544069fd5fdc80d6fa8e6cd5ed834f955dcf6ab5e4bf21ca2b399c"
+        "289633b161fac757a2f2b5a6b0f30aff42f92b413a6fc6e34d8fc12c876b5dbb75ae"
+        "120669a844ab0030642baf1ad5022a9da4a52071752993366cd78201abced9f6bac4"
+        "6344f1a0fd6871e18b79ae3c1c02abfcbfe3e387a909f457dada714508b1b1aedefe"
+        "a9fed39cc58a7583f7227fbf82a6fa275a54635dd3e7a7a71c78067853f3d29182ec"
+        "1396a079f137ff14bdcc943ab2ec296da75f72adb5e7a7e4629a103e0c3b4dac8e9d"
+        "9083c635a2190f67cf6541cb66e52ad5c3023b061fdfbd2abaac1626e0b0c33e45b5"
+        "766ccb1a00199993c5a3d1db43a745f953d8e0c350f87420e87b9072632523f9ad82"
+        "e6693d187d7068a2cf90fd0ec7c6342d2b77ba880a8ff94b90ea85fe448493d8faf6"
+        "9036c05ba6abff5f3ae766a8b287a1565192f20a74dac06f04becd1a8a2280cdec08"
+        "8cc5189f8039936a484c938f0ae75465569ea0eb5cce4d5e9662b4586df7f21bc749"
+        "542f0651633f8218861f98b6854df6930e9ed43fbb59682265b7519ff9c4e62ab740"
+        "ce64586d2d629666cb05b99476d13103ffe3216de733adb8bb721e3dee3755b4da87"
+        "5ababd32a49398687db804fcdeb987bba7264692220716211bb2103c504392c9d805"
+        "8dc2783b02de3588b8af39ab91d8140b6ce9d50e92c049cd0b7f3a578e57f1dc1c6f"
+        "b5a01f32ae9940485ec80d5c0fbfa79ec2c0e1012630d39f922b4c0b484c4cbe45a9"
+        "b66a66e214523ae60b3349b0a401733299c57223011f816549f0e470fc344d01a2a6"
+        "9466396ce1ab8e93962e6e40f4ea19600af8023c107046243e5e7620ed6a4941b51d"
+        "535e6dc645e496d2101f3fc5307748c6c6a100dabdb5b520e94889837bcff9f5210d"
+        "f30acdeb93ea6fee532058e96a90ad927d025c16bc121dca3feef7800f7aecde21fc"
+        "2d977d7a536ddb2c4f33fff2174049069bfcbcba87c3e61bdbc8a5006596f191ebc6"
+        "1fef177e0b35a7f0ea0685fede0eec596007ed1eaeef5e20a988aa44564f85434d9c"
+        "189db413398c01bcea29dbd2c02be9bf390d119769362e4ccc8e3c2f0f70e7258bfd"
+        "6235930ea982b2fba1a9875a763b1522f4d50d88786d1f972fd4883d05eaa9ee186d"
+        "14a5406d8f649704939a3bcb3368c4e9ff5b6d0cb50a9f9aa8def9c21ed0e78f021f"
+        "9c571b09620d8271395db8535e0bd9122f4c7adbe75e15da0f5ed0edf665034c745c"
+        "32d7dc66b19ce7dfa56a6fb26180e40b0382287267aba55de1c87a2ebdf48d665902"
+        "48adf92f13544ff158026eb528903f6b282b67cab62b040005f9ce7bb7fb0a9674a5"
+        "3e792ffeb713807a1cea8370fdc4067326a6d9d0714b4db9ca29a0bcf75213e25994"
+        "6777cdc44554e6d74f85e5c5050ae7160f2a3d1ccbf871115afed1be46e7fd2bc60f"
+        "002c1dceda4ab883432a7379378202729dc334cacfd5b125adf6b4b59b2ef8e47ef0"
+        "542e8a51d6cbd4b5618cbab9b351580d27b75fe44cb3e21e3f8d7c9434cae0acf5d5"
+        "fa62de1eda2cd47aefd0f66c197a7e49dba0a5896ac2ecf36f9d2fa11c9bb843df4b"
+        "c52111589eb2a22e32b734dc8a46c3c615ef488076c7e957fdd8f2b1f26762fd1eda"
+        "c0dbb94e94f519cc12556c2228f86f352fe250d625a645424dbaa0b636a3cf7aeb81"
+        "f8fcd00c32704ce60eb8429a7d31e5bcde48672aff03e6fd6f7a416ddb24209a4ce9"
+        "f603b3640ae9dd0687b1aac7097215b43428004ff38722ad10a86eae8434e13f985e"
+        "d25f5bee656159d927360a3d0e0b68b89cb47955eeabe0890a0eb607ec4087775124"
+        "d7478a15025b282495aacd19eb9dc98ed520d71f49d1abdb108b0f8da213c90f630b"
+        "9e309715bd5be155bc2fc01de12d1da8ffbf3adb2098b4d302e16d6e9a6b7e94b15e"
+        "2287c9d37d9f4cb87c49227bb32afa1c6ef4ca2127d2ed81e4f897f4231e3d20e8e7"
+        "2ce343ee493cdec20bd42cb15a52cb2286e4611ad196a6ee3e8effc70541c07a5302"
+        "d8a7c49c4be6a99099376ea87be57924be2e465b09410ed005f00f37daa7bdf9b06e"
+        "f05db31dfbdac3abdd37e4dfc0c4a0fa46fac656af9f3d01c1f435b690bafb4d323d"
+        "0267740ab9e8ed67a4ad1468ce9a1a3874e1325dd75fc7492ba9d66d15aefa7a2432"
+        "19bd1449652cdca9c1353357d543368d097df0d14f64c01c7448ede02ea0783c550c"
+        "f62efc80a3c552bf15950b4660f9ddb6014c3a780c5611e933cde96a311157cf2e08"
+        "b288398faa3e935e2c81a4021ed09417ce0d73cdf0e8b6c7a77fd426a70ee2bd8d9e"
+        "6c2afa43604007e23fd8490e43b9536bc15abf556214ad63e2cd9369b29d7d285823"
+        "e389b1022de0ac7c923f3ef6e843c729c4e5da33944239d8b3a14980c9d4ccd9660c"
+        "4150013cc9412926f6f5f354266df764b57a0059aa71a6f418a04edb45e98a4bd2a9"
+        "dc69a1248ca52564f72f13f110734f6c962f86802e0a13a1dd5f852b538c7263c962"
+        "34239f35790a0978137d62c79aaa370d1bd4f57241af08978f3ecf261c3fcc82af14"
+        "17b1a3a92c401e93b4fb4ad962c328135471565b60a93d2e4954240070472311a27a"
+        "2d7161f6d06bd373e37dd051f8b868c8e419ca0529fc3691601338d2c7449273584a"
+        "42f1a795ddd3ffead4feec6e390231d57884a75447afcfbbe2acaa6841779384819c"
+        "a00e957191c72acfc509352d2779de93320d2ddb0f33f21e7d8dc43e558b7d62ae5d"
+        "7328933f006ce14be5464bb377a97f62ea4bf7f96e9684a894f5b739d5ba04851fe7"
+        "8f1e83bb936350123e0fc3cb90aea52db4d76a2c5546cac9ce650dccc5d619917718"
+        "e08ec24fabd2a4ef23956408974b6a8597100e69791bf46c93a4b852b808f8d33240"
+        "f6b902a6aefabcd19d4e9453cab967a470645bbb26eff4e2f6627698ca9a2304fa89"
+        "5e0384041dbd5eafd932fabc717b3114cbb83f1c03190e0fae447af77186447772b2"
+        "2d90027fdd747026c4476e255179994a47bf0b5d3869b0c16916696775659defc75a"
+        "7869c145c88ed61ba7dfc907582305413c76ba04acb930cdffd09ba8790d4af56420"
+        "a0a3d93b112035cf0e33db072d474e3f9602c4d58e6bed0739fe2e8859d7a5ac3264"
+        "cc415a0871ef1af4e950ff2c8bc8d9f30a4dda3ea5af247f8a19bf128091df64329b"
+        "a386f6309e7ddd0815eeb2e91aa055028a2a3d4ce28e6bb107cd0a9158cc0e40b4ac"
+        "61e14376c72a5fd7700e8c34f68374254d1f46885d2551d15c944f2182ad11e2d812"
+        "e15d27b051615bc10565964d191a00b3e362c4b58cc38b6123ed794f5c348a32ceca"
+        "c5cb79db1f77395f208d3565972568ea4bbea104c48ec8b8d6ff65677752268b714c"
+        "d564c40c9e3ae731b3bd3538eec464c65ef439f2dcb2a77500e62929d74d1a3f0199"
+        "2f879dc267fa5c8ab11a78ecf8e1b99d6ea32275404cc8df6bd5573e1b8d58a2efc1"
+        "cc7be153fbc23409b1e30",
+        16,
+    ),
+}
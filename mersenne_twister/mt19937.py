@@ -6,8 +6,122 @@
 
 Simple class implementation for the Mersenne Twister pseudorandom number
 generator.
+
+Bulk output (`generate_many`, `random_bytes` and `fill`) twists and tempers
+whole blocks of the state as NumPy arrays when the word size is 32 or 64
+bits. If NumPy is absent, for other word sizes, or for only a few words, it
+falls back to calling `generate` for each word.
+
+For the standard 32- and 64-bit generators, `jump` skips any number of
+outputs by a polynomial computation over GF(2), and `stream_pool` uses it to
+give every worker of a process pool a stream that does not overlap with the
+others. The polynomials it needs are precomputed in `jump_polynomials.py`,
+and `check_polynomials` derives them again.
+
+Named parameter sets are kept in `Preset`, so that a generator is created
+with `MT19937(seed, *Preset.MT19937)`. Its whole state can be saved with
+`getstate`, which packs it into an `array`, and restored with `setstate` or
+`MT19937.from_state`; both are single copies that do not go through the
+state word by word in Python. Seeding with a single integer still computes
+the state one word at a time, but only once per seed, as `seeded_state`
+keeps the most recent ones.
 """
 
+from array import array
+from functools import lru_cache
+from multiprocessing import Queue
+from concurrent.futures import ProcessPoolExecutor
+from jump_polynomials import CHARACTERISTIC_POLYNOMIALS, JUMP_POLYNOMIALS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Preset:
+    """
+    Parameter set of a Mersenne Twister, with one slot for each argument of
+    `MT19937` after the seed (see its documentation) and in the same order.
+    Iterating over a preset yields these values, so it can be unpacked into
+    the arguments of the constructor. The standard generators are available
+    as `Preset.MT19937` and `Preset.MT19937_64`.
+    """
+
+    __slots__ = tuple("w n m r a u d s b t c l f".split())
+
+    def __init__(self, w, n, m, r, a, u, d, s, b, t, c, l, f):
+        """
+        Args:
+            w, n, m, r, a, u, d, s, b, t, c, l, f: as described in `MT19937`.
+        """
+        values = (w, n, m, r, a, u, d, s, b, t, c, l, f)
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __iter__(self):
+        """Parameters in the order expected by `MT19937`."""
+        return (getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return "Preset({})".format(", ".join(map(hex, self)))
+
+
+Preset.MT19937 = Preset(
+    32,
+    624,
+    397,
+    31,
+    0x9908B0DF,
+    11,
+    0xFFFFFFFF,
+    7,
+    0x9D2C5680,
+    15,
+    0xEFC60000,
+    18,
+    1_812_433_253,
+)
+Preset.MT19937_64 = Preset(
+    64,
+    312,
+    156,
+    31,
+    0xB5026F5AA96619E9,
+    29,
+    0x5555555555555555,
+    17,
+    0x71D67FFFEDA60000,
+    37,
+    0xFFF7EEE000000000,
+    43,
+    6_364_136_223_846_793_005,
+)
+
+# (w, n, m, r, a) of the generators whose characteristic polynomial is known
+# to be primitive, so their state can be jumped ahead; see `jump`.
+JUMPABLE = {
+    tuple(preset)[:5] for preset in (Preset.MT19937, Preset.MT19937_64)
+}
+
+# multipliers used by `init_by_array` for each word size, along with the seed
+# given to `seed_init` beforehand
+ARRAY_SEEDING = {
+    32: (1_664_525, 1_566_083_941),
+    64: (3_935_559_000_370_003_845, 2_862_933_555_777_941_757),
+}
+ARRAY_SEED = 19_650_218
+
+# number of seeded state sequences kept by `seeded_state`
+SEED_CACHE_SIZE = 64
+
+# type code of `array` used by `getstate` for each word size
+STATE_TYPECODES = {32: "I", 64: "Q"}
+
+# below this number of words, bulk output calls `generate` for each of them,
+# which is faster than any NumPy operation
+SCALAR_WORDS = 8
+
 
 class MT19937:
     """
@@ -22,6 +136,9 @@ class MT19937:
     http://www.math.sci.hiroshima-u.ac.jp/~m-mat/MT/MT2002/CODES/mt19937ar.c
     """
 
+    __slots__ = ("mt", "index", "word_mask", "lower_mask", "upper_mask")
+    __slots__ += Preset.__slots__
+
     def __init__(self, seed, w, n, m, r, a, u, d, s, b, t, c, l, f):
         """
         Initializes the MT19937 object with the following attributes:
@@ -48,6 +165,7 @@ class MT19937:
         """
         self.mt = [None] * n
         self.index = n + 1
+        self.word_mask = (1 << w) - 1
         self.lower_mask = (1 << r) - 1
         self.upper_mask = lowest_n_bits(~(self.lower_mask), w)
         self.w = w
@@ -76,12 +194,96 @@ class MT19937:
                   be filled with other elements until its length reaches `n`.
         """
         self.index = self.n
-        self.mt[0] = seed
-        for i in range(1, self.n):
-            prev = self.mt[i - 1]
-            self.mt[i] = lowest_n_bits(
-                self.f * (prev ^ (prev >> (self.w - 2)) + i), self.w
+        self.mt = list(seeded_state(seed, self.w, self.n, self.f))
+
+    def init_by_array(self, key):
+        """
+        Seeds the state sequence with a list of integers, as `init_by_array`
+        in the reference code, so that seeds longer than a word can be used.
+        Only defined for 32- and 64-bit words.
+
+        Args:
+            key: non-empty list of integers lower than `1u << w`.
+        """
+        if self.w not in ARRAY_SEEDING:
+            raise ValueError("Array seeding is only defined for w = 32, 64.")
+        first, second = ARRAY_SEEDING[self.w]
+        self.seed_init(ARRAY_SEED)
+        mt, n, shift = self.mt, self.n, self.w - 2
+
+        i, j = 1, 0
+        for _ in range(max(n, len(key))):
+            prev = mt[i - 1]
+            mt[i] = (mt[i] ^ ((prev ^ (prev >> shift)) * first)) + key[j] + j
+            mt[i] &= self.word_mask
+            i, j = i + 1, (j + 1) % len(key)
+            if i >= n:
+                mt[0], i = mt[n - 1], 1
+        for _ in range(n - 1):
+            prev = mt[i - 1]
+            mt[i] = (mt[i] ^ ((prev ^ (prev >> shift)) * second)) - i
+            mt[i] &= self.word_mask
+            i += 1
+            if i >= n:
+                mt[0], i = mt[n - 1], 1
+
+        mt[0] = 1 << (self.w - 1)
+        self.index = n
+
+    def getstate(self):
+        """
+        Packs the state sequence and the current index into an array of
+        words, which supports the buffer protocol and can thus be written to
+        a file or shared memory as is. Only defined for 32- and 64-bit words.
+
+        Returns:
+            An `array` of `n + 1` words.
+        """
+        state = array(STATE_TYPECODES[self.w], self.mt)
+        state.append(self.index)
+        return state
+
+    def setstate(self, state):
+        """
+        Restores a state saved by `getstate`.
+
+        Args:
+            state: the array returned by `getstate`, or any bytes-like object
+                   with the same contents, such as a `memoryview` over shared
+                   memory.
+        """
+        typecode = STATE_TYPECODES[self.w]
+        view = memoryview(state)
+        if view.format != typecode:
+            view = view.cast("B").cast(typecode)
+        if len(view) != self.n + 1:
+            raise ValueError(
+                "Expected a state of {} words.".format(self.n + 1)
             )
+        self.mt = view[: self.n].tolist()
+        self.index = view[self.n]
+
+    @classmethod
+    def from_state(cls, state, preset=Preset.MT19937):
+        """
+        Creates a generator from a saved state, skipping the seeding.
+
+        Args:
+            state:  as described in `setstate`.
+            preset: `Preset` (or other iterable of parameters) with which
+                    the state was produced.
+
+        Returns:
+            The new generator.
+        """
+        gen = cls.__new__(cls)
+        for name, value in zip(Preset.__slots__, preset):
+            setattr(gen, name, value)
+        gen.word_mask = (1 << gen.w) - 1
+        gen.lower_mask = (1 << gen.r) - 1
+        gen.upper_mask = lowest_n_bits(~(gen.lower_mask), gen.w)
+        gen.setstate(state)
+        return gen
 
     def generate(self):
         """
@@ -102,7 +304,7 @@ class MT19937:
 
         self.index += 1
 
-        return lowest_n_bits(_y, self.w)
+        return _y & self.word_mask
 
     def twist(self):
         """
@@ -115,13 +317,233 @@ class MT19937:
             )
             xA = x >> 1
 
-            if (x % 2) == 0:
+            if x % 2:
                 xA ^= self.a
 
             self.mt[i] = self.mt[(i + self.m) % self.n] ^ xA
 
         self.index = 0
 
+    def _dtype(self):
+        """
+        Returns:
+            The NumPy type holding a word, or `None` if there is none (or if
+            NumPy is absent).
+        """
+        if np is None:
+            return None
+        return {32: np.uint32, 64: np.uint64}.get(self.w)
+
+    def _twist_array(self, mt):
+        """
+        Vectorized version of `twist` over a NumPy array. Words that depend
+        on values already updated during the same twist (those `m` elements
+        away, modulo `n`) are computed in segments of at most `n - m` words,
+        so every segment only reads words updated by previous ones.
+
+        Args:
+            mt: state sequence as an array, updated in place.
+        """
+        n, m, dtype = self.n, self.m, mt.dtype.type
+        upper, lower = dtype(self.upper_mask), dtype(self.lower_mask)
+        a, one, zero = dtype(self.a), dtype(1), dtype(0)
+
+        def update(lo, hi, following, shifted):
+            """
+            Computes the recurrence for words with indices in [lo, hi).
+
+            Args:
+                lo, hi:     bounds of the segment.
+                following:  words at indices [lo + 1, hi + 1), modulo `n`.
+                shifted:    words at indices [lo + m, hi + m), modulo `n`.
+            """
+            x = (mt[lo:hi] & upper) | (following & lower)
+            mt[lo:hi] = shifted ^ (x >> one) ^ ((zero - (x & one)) & a)
+
+        update(0, n - m, mt[1 : n - m + 1], mt[m:n])
+        for lo in range(n - m, n - 1, n - m):
+            hi = min(lo + n - m, n - 1)
+            update(lo, hi, mt[lo + 1 : hi + 1], mt[lo + m - n : hi + m - n])
+        update(n - 1, n, mt[0:1], mt[m - 1 : m])
+
+    def _temper_array(self, y):
+        """
+        Vectorized version of the tempering done by `generate`.
+
+        Args:
+            y: array of words taken from the state sequence, tempered in
+               place.
+
+        Returns:
+            Array of tempered words.
+        """
+        dtype = y.dtype.type
+        y ^= (y >> dtype(self.u)) & dtype(self.d)
+        y ^= (y << dtype(self.s)) & dtype(self.b)
+        y ^= (y << dtype(self.t)) & dtype(self.c)
+        y ^= y >> dtype(self.l)
+        return y
+
+    def _generate_array(self, k):
+        """
+        Generates `k` words at once, leaving the generator in the same state
+        as `k` calls to `generate` would. Unless a twist is needed, only the
+        words taken are converted to an array, so that short requests do not
+        copy the whole state back and forth.
+
+        Args:
+            k: number of words.
+
+        Returns:
+            Array with `k` tempered words.
+        """
+        dtype = self._dtype()
+        if k <= self.n - self.index:
+            words = self.mt[self.index : self.index + k]
+            self.index += k
+            output = np.fromiter((v & self.word_mask for v in words), dtype, k)
+            return self._temper_array(output)
+
+        mt = np.fromiter((v & self.word_mask for v in self.mt), dtype, self.n)
+        output = np.empty(k, dtype)
+
+        position = 0
+        while position < k:
+            if self.index >= self.n:
+                self._twist_array(mt)
+                self.index = 0
+            start, block = self.index, min(self.n - self.index, k - position)
+            output[position : position + block] = mt[start : start + block]
+            self.index += block
+            position += block
+
+        self.mt = mt.tolist()
+        return self._temper_array(output)
+
+    def generate_many(self, k):
+        """
+        Args:
+            k: number of words.
+
+        Returns:
+            List with the next `k` outputs of `generate`.
+        """
+        if self._dtype() is None or k < SCALAR_WORDS:
+            return [self.generate() for _ in range(k)]
+        return self._generate_array(k).tolist()
+
+    def random_bytes(self, k):
+        """
+        Concatenates the next outputs of `generate` as little-endian words.
+        The word size must be a multiple of 8 bits.
+
+        Args:
+            k: number of bytes.
+
+        Returns:
+            `k` pseudorandom bytes; any remaining bytes of the last word are
+            discarded.
+        """
+        assert self.w % 8 == 0
+        size = self.w // 8
+        count = -(-k // size)
+        if self._dtype() is None or count < SCALAR_WORDS:
+            return b"".join(
+                self.generate().to_bytes(size, "little") for _ in range(count)
+            )[:k]
+        words = self._generate_array(count)
+        return words.astype("<u{}".format(size)).tobytes()[:k]
+
+    def fill(self, buffer):
+        """
+        Fills a buffer with the output of `random_bytes`.
+
+        Args:
+            buffer: writable bytes-like object, such as a `bytearray`.
+        """
+        view = memoryview(buffer).cast("B")
+        view[:] = self.random_bytes(len(view))
+
+    def jump(self, steps):
+        """
+        Advances the generator as if `generate` had been called `steps`
+        times, in time proportional to the logarithm of `steps`.
+
+        The state sequence follows a linear recurrence over GF(2) whose
+        characteristic polynomial `P` has degree `nw - r`. Writing
+        x^steps mod P as a sum of powers x^j, the state after `steps` outputs
+        is the XOR of the states after each of those `j` outputs, which are
+        windows of `n` consecutive words of the sequence. The polynomial is
+        cached for each number of steps (see `jump_polynomial`).
+
+        Args:
+            steps: number of outputs to be skipped.
+        """
+        params = (self.w, self.n, self.m, self.r, self.a)
+        if params not in JUMPABLE:
+            raise ValueError("Jump-ahead is only defined for the presets.")
+        if steps and self.index == 0:
+            self.generate()
+            steps -= 1
+
+        degree = self.n * self.w - self.r
+        if steps < degree:
+            self.skip(steps)
+            return
+
+        # words from the last output onwards: the first one only matters for
+        # its upper bits, as in `twist`
+        sequence = self.mt[self.index - 1 :]
+        clone = self._copy()
+        while len(sequence) < degree + self.n:
+            clone.twist()
+            sequence.extend(clone.mt)
+
+        poly = jump_polynomial(params, steps)
+        offsets = [j for j in range(poly.bit_length()) if (poly >> j) & 1]
+        self.mt = _xor_windows(sequence, offsets, self.n, self.w)
+        self.index = 1
+
+    def skip(self, steps):
+        """
+        Advances the generator by discarding the next `steps` outputs.
+
+        Args:
+            steps: number of outputs to be skipped.
+        """
+        if self._dtype() is None:
+            for _ in range(steps):
+                self.generate()
+        else:
+            self._generate_array(steps)
+
+    def _copy(self):
+        """
+        Returns:
+            An independent generator with the same state.
+        """
+        other = self.__class__.__new__(self.__class__)
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+        other.mt = list(self.mt)
+        return other
+
+    def jumped(self, jumps=1):
+        """
+        Creates a generator whose stream starts 2^128 outputs (times
+        `jumps`) after the current state, which is left untouched.
+
+        Args:
+            jumps: number of jumps of 2^128 outputs.
+
+        Returns:
+            The new generator.
+        """
+        other = self._copy()
+        for _ in range(jumps):
+            other.jump(JUMP_SIZE)
+        return other
+
 
 def lowest_n_bits(num, n_bits):
     """
@@ -136,3 +558,266 @@ def lowest_n_bits(num, n_bits):
         The lowest n bits of `num`.
     """
     return num & (2 ** n_bits - 1)
+
+
+@lru_cache(maxsize=SEED_CACHE_SIZE)
+def seeded_state(seed, w, n, f):
+    """
+    Computes the state sequence set by `MT19937.seed_init`. The recurrence
+    cannot be vectorized, as each word depends on the previous one, so the
+    result is cached instead: generators created again with the same seed
+    and parameters, as well as every call to `init_by_array`, only copy it.
+
+    Args:
+        seed, w, n, f: as described in `MT19937`.
+
+    Returns:
+        Tuple of `n` integers.
+    """
+    mt, mask = [seed], (1 << w) - 1
+    for i in range(1, n):
+        prev = mt[-1]
+        mt.append((f * (prev ^ (prev >> (w - 2))) + i) & mask)
+    return tuple(mt)
+
+
+JUMP_SIZE = 1 << 128
+
+
+def characteristic_polynomial(params):
+    """
+    Polynomials over GF(2) are represented as integers, with bit `i` holding
+    the coefficient of x^i.
+
+    Args:
+        params: tuple `(w, n, m, r, a)`, one of `JUMPABLE`.
+
+    Returns:
+        The characteristic polynomial of the recurrence of a preset, as
+        precomputed in `jump_polynomials.py`.
+    """
+    return CHARACTERISTIC_POLYNOMIALS[params]
+
+
+def berlekamp_massey(params):
+    """
+    Finds the characteristic polynomial of the recurrence of a preset with
+    the Berlekamp-Massey algorithm, which recovers the shortest linear
+    recurrence of a sequence of bits from twice its length. Since this
+    polynomial is primitive, the most significant bit of the words is enough.
+    It takes a fraction of a second, so it is only used to check the
+    precomputed polynomials.
+
+    Args:
+        params: tuple `(w, n, m, r, a)`, one of `JUMPABLE`.
+
+    Returns:
+        The characteristic polynomial.
+    """
+    w, n, m, r, a = params
+    gen = MT19937(5489, w, n, m, r, a, 0, 0, 0, 0, 0, 0, 0, Preset.MT19937.f)
+    bits = []
+    while len(bits) < 2 * (n * w - r):
+        gen.twist()
+        bits.extend(word >> (w - 1) for word in gen.mt)
+
+    C, B, L, shift, window = 1, 1, 0, 1, 0
+    for k, bit in enumerate(bits):
+        window = (window << 1) | bit
+        if (C & window).bit_count() & 1 == 0:
+            shift += 1
+        elif 2 * L <= k:
+            C, B, L, shift = C ^ (B << shift), C, k + 1 - L, 1
+        else:
+            C ^= B << shift
+            shift += 1
+
+    return int(bin(C)[2:].zfill(L + 1)[::-1], 2)
+
+
+@lru_cache(maxsize=None)
+def _reduction_table(P):
+    """
+    Multiples of `P` indexed by the 8 bits they have above its degree, used
+    to reduce a polynomial modulo `P` one byte at a time.
+
+    Args:
+        P: polynomial over GF(2).
+
+    Returns:
+        List of 256 polynomials.
+    """
+    degree, table = P.bit_length() - 1, [0] * 256
+    for q in range(256):
+        product = 0
+        for i in range(8):
+            if (q >> i) & 1:
+                product ^= P << i
+        table[product >> degree] = product
+    return table
+
+
+_SPREAD = [int(bin(i)[2:], 4).to_bytes(2, "little") for i in range(256)]
+
+
+def _square_mod(A, P):
+    """
+    Squares a polynomial over GF(2), where it amounts to interleaving its
+    bits with zeros, and reduces the result modulo `P`.
+
+    Args:
+        A, P: polynomials over GF(2).
+
+    Returns:
+        A^2 mod P.
+    """
+    size = (A.bit_length() + 7) // 8
+    A = int.from_bytes(
+        b"".join(_SPREAD[byte] for byte in A.to_bytes(size, "little")),
+        "little",
+    )
+    degree, table = P.bit_length() - 1, _reduction_table(P)
+    while A.bit_length() > degree:
+        position = max(A.bit_length() - 8, degree)
+        A ^= table[(A >> position) & 0xFF] << (position - degree)
+    return A
+
+
+@lru_cache(maxsize=64)
+def jump_polynomial(params, steps):
+    """
+    Computes x^steps modulo the characteristic polynomial of a preset, which
+    is precomputed for `JUMP_SIZE` steps. The result is cached, so jumping
+    many generators by the same distance only computes it once.
+
+    Args:
+        params: tuple `(w, n, m, r, a)`, one of `JUMPABLE`.
+        steps:  number of outputs to be skipped.
+
+    Returns:
+        The jump polynomial.
+    """
+    if steps == JUMP_SIZE:
+        return JUMP_POLYNOMIALS[params]
+    return power_of_x(steps, characteristic_polynomial(params))
+
+
+def power_of_x(steps, P):
+    """
+    Computes x^steps modulo a polynomial over GF(2) by repeated squaring.
+
+    Args:
+        steps:  non-negative exponent.
+        P:      polynomial over GF(2).
+
+    Returns:
+        x^steps mod P.
+    """
+    degree, J = P.bit_length() - 1, 1
+    for bit in bin(steps)[2:]:
+        J = _square_mod(J, P)
+        if bit == "1":
+            J <<= 1
+            if J >> degree:
+                J ^= P
+    return J
+
+
+def check_polynomials(params):
+    """
+    Derives the polynomials of a preset again with `berlekamp_massey`, to
+    check those precomputed in `jump_polynomials.py`.
+
+    Args:
+        params: tuple `(w, n, m, r, a)`, one of `JUMPABLE`.
+
+    Returns:
+        Whether both the characteristic and the jump polynomial match.
+    """
+    P = berlekamp_massey(params)
+    return (
+        P == CHARACTERISTIC_POLYNOMIALS[params]
+        and power_of_x(JUMP_SIZE, P) == JUMP_POLYNOMIALS[params]
+    )
+
+
+def _xor_windows(sequence, offsets, n, w):
+    """
+    XORs together the windows of `n` words of a sequence starting at each
+    of the given offsets.
+
+    Args:
+        sequence:   list of words.
+        offsets:    starting indices of the windows.
+        n:          size of each window.
+        w:          number of bits of each word.
+
+    Returns:
+        List of `n` words.
+    """
+    if np is not None and w in (32, 64):
+        words = np.array(sequence, dtype=np.uint32 if w == 32 else np.uint64)
+        windows = np.lib.stride_tricks.sliding_window_view(words, n)
+        result = np.zeros(n, dtype=words.dtype)
+        for i in range(0, len(offsets), 1024):
+            chunk = windows[offsets[i : i + 1024]]
+            result ^= np.bitwise_xor.reduce(chunk, axis=0)
+        return result.tolist()
+
+    packed = int.from_bytes(
+        b"".join(word.to_bytes(w // 8, "little") for word in sequence),
+        "little",
+    )
+    result = 0
+    for offset in offsets:
+        result ^= packed >> (w * offset)
+    mask = (1 << w) - 1
+    return [(result >> (w * i)) & mask for i in range(n)]
+
+
+def _init_stream(queue, initializer, initargs):
+    """
+    Takes the generator of a worker process from the queue, then runs the
+    initializer given to `stream_pool`, if any.
+    """
+    global _STREAM  # pylint: disable=W0601
+    _STREAM = queue.get()
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def worker_stream():
+    """
+    Returns:
+        The generator owned by the current worker of a `stream_pool`.
+    """
+    return _STREAM
+
+
+def stream_pool(generator, workers, initializer=None, initargs=()):
+    """
+    Creates a process pool in which every worker owns a generator whose
+    stream starts 2^128 outputs after the previous one, so that streams of
+    different workers never overlap. Tasks retrieve it with `worker_stream`.
+
+    Args:
+        generator:      generator from which the first stream starts; it is
+                        left untouched.
+        workers:        number of worker processes.
+        initializer:    optional callable run by each worker once its
+                        generator is set, as in `ProcessPoolExecutor`.
+        initargs:       arguments given to `initializer`.
+
+    Returns:
+        A `ProcessPoolExecutor`.
+    """
+    # a copy, since the queue pickles its items later, in another thread
+    queue, stream = Queue(), generator.jumped(0)
+    for _ in range(workers):
+        queue.put(stream)
+        stream = stream.jumped()
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_stream,
+        initargs=(queue, initializer, initargs),
+    )
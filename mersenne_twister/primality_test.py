@@ -4,11 +4,35 @@
 
 """primality_test.py
 
-Simple implementations for the Fermat and Miller-Rabin primality tests.
+Simple implementations for the Fermat and Miller-Rabin primality tests, and
+a search for random primes of a given bit length. The search sieves a window
+of consecutive odd candidates against a table of small primes, so that only
+the candidates without small factors reach Miller-Rabin, which rejects most
+of the others with a full modular exponentiation each.
+
+`is_prime` does not depend on random bases: it uses a deterministic set of
+Miller-Rabin bases below 3.3 * 10^24, and the Baillie-PSW test above it, for
+which no counterexample is known. `is_prime_many` tests a batch of numbers,
+spreading the large ones across a process pool.
+
+`find_prime` runs the search of `random_prime` in several processes at once,
+each with its own stream of the Mersenne Twister, and stops all of them as
+soon as one finds a prime.
 """
 
 from __future__ import absolute_import
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import compress
+from math import gcd, isqrt, prod
+from multiprocessing import Event
+from os import cpu_count, urandom
 from random import randrange
+from time import perf_counter
+from mt19937 import JUMP_SIZE, MT19937, Preset, stream_pool, worker_stream
+
+SMALL_PRIME_COUNT = 2048
+PRIMES_PER_GROUP = 64
 
 
 def fermat(n, k):
@@ -84,3 +108,503 @@ def miller_rabin(n, k):
         s, d = s + 1, d >> 1
 
     return all(composite(randrange(2, n - 1), s, d, n) for _ in range(k))
+
+
+def small_primes(count):
+    """
+    Finds the first primes with the sieve of Eratosthenes, doubling its
+    limit until there are enough of them.
+
+    Args:
+        count: number of primes.
+
+    Returns:
+        List of the first `count` primes.
+    """
+    limit = 16
+    while True:
+        sieve = bytearray([1]) * limit
+        sieve[:2] = bytes(2)
+        for i in range(2, isqrt(limit) + 1):
+            if sieve[i]:
+                sieve[i * i :: i] = bytes(len(range(i * i, limit, i)))
+        primes = list(compress(range(limit), sieve))
+        if len(primes) >= count:
+            return primes[:count]
+        limit *= 2
+
+
+SMALL_PRIMES = small_primes(SMALL_PRIME_COUNT)
+SMALL_PRIME_SET = frozenset(SMALL_PRIMES)
+
+# the odd small primes, in groups whose products (primorials, up to the
+# first prime of the group) are used to reduce a large number only once per
+# group instead of once per prime
+PRIMORIAL_GROUPS = [
+    (group, prod(group))
+    for group in (
+        SMALL_PRIMES[i : i + PRIMES_PER_GROUP]
+        for i in range(1, SMALL_PRIME_COUNT, PRIMES_PER_GROUP)
+    )
+]
+
+
+def trial_division(n, groups=None):
+    """
+    Checks whether a number has a factor in `SMALL_PRIMES`, with a single
+    GCD per group of primes.
+
+    Args:
+        n:      number to test.
+        groups: number of groups of `PRIMORIAL_GROUPS` to be checked;
+                `None` checks all of them.
+
+    Returns:
+        True if `n` might be prime, False if it is certainly composite.
+    """
+    if n <= SMALL_PRIMES[-1]:
+        return n in SMALL_PRIME_SET
+    if n & 1 == 0:
+        return False
+    return all(
+        gcd(n, product) == 1 for _, product in PRIMORIAL_GROUPS[:groups]
+    )
+
+
+def residues(n):
+    """
+    Reduces a large number modulo every odd prime of `SMALL_PRIMES`, going
+    through the product of each group first.
+
+    Args:
+        n: number to be reduced.
+
+    Returns:
+        List of `n mod p`, in the same order as `SMALL_PRIMES[1:]`.
+    """
+    result = []
+    for group, product in PRIMORIAL_GROUPS:
+        r = n % product
+        result.extend(r % p for p in group)
+    return result
+
+
+def seeded_generator():
+    """
+    Returns:
+        A 64-bit Mersenne Twister seeded with 256 bits from the OS.
+    """
+    gen = MT19937(0, *Preset.MT19937_64)
+    key = urandom(32)
+    gen.init_by_array(
+        [int.from_bytes(key[i : i + 8], "little") for i in range(0, 32, 8)]
+    )
+    return gen
+
+
+def random_odd(bits, gen):
+    """
+    Draws an odd number with exactly `bits` bits, i.e. with both its top and
+    bottom bits set.
+
+    Args:
+        bits:   bit length of the number.
+        gen:    generator with a `random_bytes` method, such as `MT19937`.
+
+    Returns:
+        The random number.
+    """
+    size = (bits + 7) // 8
+    n = int.from_bytes(gen.random_bytes(size), "little") >> (8 * size - bits)
+    return n | (1 << (bits - 1)) | 1
+
+
+def sieved_candidates(bits, gen, window=None):
+    """
+    Yields odd numbers with exactly `bits` bits and no factor among
+    `SMALL_PRIMES`. Each window of `window` consecutive odd numbers, starting
+    at a random one, is sieved at once: for every small prime `p`, the first
+    multiple in the window is found from the residue of its start modulo `p`,
+    and every `p`-th candidate from there is crossed out.
+
+    Args:
+        bits:   bit length of the candidates, at least 16.
+        gen:    as described in `random_odd`.
+        window: number of odd numbers sieved at once; defaults to `2 * bits`,
+                a few times the expected distance between primes.
+
+    Yields:
+        The candidates that survive the sieve, in increasing order within
+        each window.
+    """
+    assert bits >= 16
+    window = window or 2 * bits
+    while True:
+        start = random_odd(bits, gen)
+        if (start + 2 * window) >> bits:
+            continue
+
+        flags = bytearray([1]) * window
+        for p, r in zip(SMALL_PRIMES[1:], residues(start)):
+            if p >= start:
+                break
+            # start + 2k = 0 (mod p) for k = -start / 2 (mod p)
+            k = (p - r) * ((p + 1) // 2) % p
+            flags[k::p] = bytes(len(range(k, window, p)))
+
+        for k in compress(range(window), flags):
+            yield start + 2 * k
+
+
+def random_prime(bits, rounds=10, gen=None, window=None):
+    """
+    Finds a random probable prime with exactly `bits` bits.
+
+    Args:
+        bits:   as described in `sieved_candidates`.
+        rounds: number of Miller-Rabin iterations for each candidate.
+        gen:    as described in `random_odd`; defaults to a fresh
+                `seeded_generator`.
+        window: as described in `sieved_candidates`.
+
+    Returns:
+        The probable prime.
+    """
+    gen = gen or seeded_generator()
+    for candidate in sieved_candidates(bits, gen, window):
+        if miller_rabin(candidate, rounds):
+            return candidate
+
+
+# the first primes are enough as Miller-Rabin bases to decide whether any
+# number below each limit is prime (Jaeschke, 1993; Sorenson and Webster,
+# 2015); each entry holds a limit and how many of them are needed
+DETERMINISTIC_BASES = [
+    (2047, 1),
+    (1_373_653, 2),
+    (25_326_001, 3),
+    (3_215_031_751, 4),
+    (2_152_302_898_747, 5),
+    (3_474_749_660_383, 6),
+    (341_550_071_728_321, 7),
+    (3_825_123_056_546_413_051, 9),
+    (318_665_857_834_031_151_167_461, 12),
+    (3_317_044_064_679_887_385_961_981, 13),
+]
+DETERMINISTIC_LIMIT = DETERMINISTIC_BASES[-1][0]
+
+# numbers with at least this many bits are sent to the process pool by
+# `is_prime_many`, while smaller ones are tested where they are found
+POOL_MIN_BITS = 256
+TASKS_PER_WORKER = 4
+
+# outcome of `find_prime`: the prime, its bit length, seconds until it was
+# found, candidates tested by all workers together and number of workers
+PrimeSearch = namedtuple(
+    "PrimeSearch", ["prime", "bits", "seconds", "tested", "workers"]
+)
+
+
+def strong_probable_prime(n, bases):
+    """
+    Miller-Rabin iterations with given bases.
+
+    Args:
+        n:      odd number greater than 3 to be tested.
+        bases:  iterable of bases, none of them a multiple of `n`.
+
+    Returns:
+        True if `n` is a strong probable prime to every base, False if it is
+        composite.
+    """
+
+    def witness(a):
+        """Checks whether `a` proves that `n` is composite."""
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            return False
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                return False
+        return True
+
+    s, d = 0, n - 1
+    while d & 1 == 0:
+        s, d = s + 1, d >> 1
+    return not any(witness(a) for a in bases)
+
+
+def jacobi(a, n):
+    """
+    Computes the Jacobi symbol (a/n) through quadratic reciprocity.
+
+    Args:
+        a: any integer.
+        n: positive odd integer.
+
+    Returns:
+        -1, 0 or 1.
+    """
+    a, result = a % n, 1
+    while a:
+        while a & 1 == 0:
+            a >>= 1
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def strong_lucas(n):
+    """
+    Strong Lucas probable prime test with the parameters chosen by
+    Selfridge: `D` is the first of 5, -7, 9, -11, ... with (D/n) = -1, and
+    `P = 1`, `Q = (1 - D) / 4`. Writing `n + 1 = (2^s)d` with `d` odd, `n`
+    passes if `U_d = 0` or `V_{(2^r)d} = 0 (mod n)` for some `0 <= r < s`.
+
+    Args:
+        n: odd number greater than 3 to be tested.
+
+    Returns:
+        True if `n` is a strong Lucas probable prime, False if it is
+        composite.
+    """
+
+    def halve(x):
+        """Division by 2 modulo the odd number `n`."""
+        return (x + n if x & 1 else x) >> 1
+
+    # no suitable `D` exists for perfect squares
+    if isqrt(n) ** 2 == n:
+        return False
+    D = 5
+    while True:
+        symbol = jacobi(D, n)
+        if symbol == -1:
+            break
+        if symbol == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    s, d = 0, n + 1
+    while d & 1 == 0:
+        s, d = s + 1, d >> 1
+
+    # U_k, V_k and Q^k, from the most significant bit of `d` downwards
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V, Qk = U * V % n, (V * V - 2 * Qk) % n, Qk * Qk % n
+        if bit == "1":
+            U, V = halve(P * U + V) % n, halve(D * U + P * V) % n
+            Qk = Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V, Qk = (V * V - 2 * Qk) % n, Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+
+def baillie_psw(n):
+    """
+    The Baillie-PSW primality test: trial division, a strong probable prime
+    test to base 2 and a strong Lucas test. The two tests are believed to
+    have no composite in common, and none is known.
+
+    Args:
+        n: number to test.
+
+    Returns:
+        True means "prime" (with no known exception), whereas False means
+        "composite".
+    """
+    if not trial_division(n):
+        return False
+    if n <= SMALL_PRIMES[-1]:
+        return True
+    return strong_probable_prime(n, [2]) and strong_lucas(n)
+
+
+def is_prime(n):
+    """
+    Deterministic Miller-Rabin test for numbers below `DETERMINISTIC_LIMIT`,
+    with as few bases as their size allows, and `baillie_psw` otherwise.
+
+    Args:
+        n: number to test.
+
+    Returns:
+        True means "prime" (proven for numbers below the limit), whereas
+        False means "composite".
+    """
+    if n >= DETERMINISTIC_LIMIT:
+        return baillie_psw(n)
+    # a single group of small primes is enough before such cheap tests
+    if not trial_division(n, 1):
+        return False
+    if n <= SMALL_PRIMES[-1]:
+        return True
+    count = next(count for limit, count in DETERMINISTIC_BASES if n < limit)
+    return strong_probable_prime(n, SMALL_PRIMES[:count])
+
+
+def _probable_prime_after_sieve(n):
+    """
+    Same result as `is_prime`, for a number larger than every prime of
+    `SMALL_PRIMES` and already known to have no factor among them, so that
+    trial division is skipped.
+
+    Args:
+        n: number to test.
+
+    Returns:
+        As described in `is_prime`.
+    """
+    if n >= DETERMINISTIC_LIMIT:
+        return strong_probable_prime(n, [2]) and strong_lucas(n)
+    count = next(count for limit, count in DETERMINISTIC_BASES if n < limit)
+    return strong_probable_prime(n, SMALL_PRIMES[:count])
+
+
+def _is_prime_chunk(numbers):
+    """
+    Applies `_probable_prime_after_sieve` to a list of numbers inside a
+    worker process.
+    """
+    return [_probable_prime_after_sieve(n) for n in numbers]
+
+
+def is_prime_many(numbers, workers=None):
+    """
+    Applies `is_prime` to many numbers. Every number first goes through
+    trial division in the current process, which rejects most composites
+    before anything is sent to another process; the remaining numbers with
+    at least `POOL_MIN_BITS` bits are split in chunks across a process pool.
+    Either way, the numbers that survive are not divided again.
+
+    Args:
+        numbers:    iterable of numbers to test.
+        workers:    number of processes; `None` uses every CPU, whereas 1
+                    tests everything in the current process.
+
+    Returns:
+        List with the result of `is_prime` for each number, in order.
+    """
+    numbers = list(numbers)
+    results = [trial_division(n) for n in numbers]
+    large = []
+    for i, n in enumerate(numbers):
+        if results[i] and n > SMALL_PRIMES[-1]:
+            if n.bit_length() >= POOL_MIN_BITS:
+                large.append(i)
+            else:
+                results[i] = _probable_prime_after_sieve(n)
+
+    workers = min(workers or cpu_count() or 1, len(large))
+    if workers <= 1:
+        for i in large:
+            results[i] = _probable_prime_after_sieve(numbers[i])
+        return results
+
+    size = -(-len(large) // (workers * TASKS_PER_WORKER))
+    chunks = [large[i : i + size] for i in range(0, len(large), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = [[numbers[i] for i in chunk] for chunk in chunks]
+        for chunk, found in zip(chunks, executor.map(_is_prime_chunk, tasks)):
+            for i, result in zip(chunk, found):
+                results[i] = result
+    return results
+
+
+# event shared by the workers of `find_prime`, within each of them
+_FOUND = None
+
+
+def _init_search(found):
+    """Keeps the event shared by the workers of `find_prime`."""
+    global _FOUND  # pylint: disable=W0603
+    _FOUND = found
+
+
+def _run_search(search, bits):
+    """Runs a search inside a worker of `find_prime`."""
+    return search(bits, worker_stream(), _FOUND)
+
+
+def search_prime(bits, gen, found=None):
+    """
+    Tests sieved candidates with `is_prime` until one is prime, or until
+    another worker finds one.
+
+    Args:
+        bits:   as described in `sieved_candidates`.
+        gen:    as described in `random_odd`.
+        found:  optional event, checked before each candidate and set once a
+                prime is found.
+
+    Returns:
+        The prime, or `None` if the search was cancelled, and the number of
+        candidates tested.
+    """
+    tested = 0
+    for candidate in sieved_candidates(bits, gen):
+        if found is not None and found.is_set():
+            return None, tested
+        tested += 1
+        if is_prime(candidate):
+            if found is not None:
+                found.set()
+            return candidate, tested
+    return None, tested
+
+
+def find_prime(bits, workers=None, gen=None, search=search_prime):
+    """
+    Searches for a random prime with exactly `bits` bits in several
+    processes, each testing its own stream of candidates (see
+    `stream_pool`). The first worker to find a prime sets an event shared by
+    all of them, so the others stop after their current candidate.
+
+    Args:
+        bits:       as described in `sieved_candidates`.
+        workers:    number of processes; `None` uses every CPU, whereas 1
+                    searches in the current process.
+        gen:        `MT19937` from which the streams start, which is moved
+                    past all of them; defaults to a fresh `seeded_generator`.
+        search:     top-level function with the same arguments and results
+                    as `search_prime`, for searches of other kinds of primes.
+
+    Returns:
+        A `PrimeSearch` tuple.
+    """
+    start = perf_counter()
+    workers = workers or cpu_count() or 1
+    gen = gen or seeded_generator()
+    if workers == 1:
+        prime, tested = search(bits, gen)
+        return PrimeSearch(prime, bits, perf_counter() - start, tested, 1)
+
+    found = Event()
+    with stream_pool(gen, workers, _init_search, (found,)) as executor:
+        # moves past every stream handed out, as the search in the current
+        # process would, so that later calls with `gen` draw new candidates
+        for _ in range(workers):
+            gen.jump(JUMP_SIZE)
+        tasks = [
+            executor.submit(_run_search, search, bits) for _ in range(workers)
+        ]
+        wait(tasks, return_when=FIRST_COMPLETED)
+        seconds = perf_counter() - start
+        found.set()
+        results = [task.result() for task in tasks]
+
+    prime = next(prime for prime, _ in results if prime is not None)
+    tested = sum(count for _, count in results)
+    return PrimeSearch(prime, bits, seconds, tested, workers)
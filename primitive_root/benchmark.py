@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""benchmark.py
+
+Timing measurements for the totient and primitive root computations within
+this folder.
+"""
+
+from __future__ import absolute_import
+from itertools import islice
+from random import randrange
+from time import perf_counter
+from factorization import factorize
+from primality_test import random_prime
+from primitive_root import (
+    euler_phi,
+    gcd,
+    iter_prim_roots,
+    prim_roots,
+    prime_factors,
+)
+
+
+def naive_phi(n):
+    """Counts the coprimes of `n` one by one."""
+    return sum(gcd(i, n) == 1 for i in range(n))
+
+
+def bench_totient(sizes=(10**4, 10**5, 10**6)):
+    """Compares counting coprimes with computing φ(n) from a factorization."""
+    for n in sizes:
+        start = perf_counter()
+        naive_phi(n)
+        before = perf_counter() - start
+        factorize.cache_clear()
+        start = perf_counter()
+        euler_phi(n)
+        after = perf_counter() - start
+        print(
+            "n = {:>8}\tcounting: {:>8.3f} s\tfactoring: {:>5.0f} us".format(
+                n, before, after * 1e6
+            )
+        )
+
+
+def bench_prim_roots(sizes=(64, 96, 128), count=21):
+    """Measures the time to find a primitive root modulo a random prime."""
+    for bits in sizes:
+        times = []
+        for _ in range(count):
+            p = random_prime(bits)
+            start = perf_counter()
+            prim_roots(p)
+            times.append(perf_counter() - start)
+        times.sort()
+        print(
+            "{} bits\tmedian: {:.1f} ms\tfastest: {:.1f} ms\t"
+            "slowest: {:.1f} ms".format(
+                bits, times[count // 2] * 1e3, times[0] * 1e3, times[-1] * 1e3
+            )
+        )
+
+
+def sampled_roots(n):
+    """Draws random numbers until every primitive root modulo `n` is found."""
+    phi = euler_phi(n)
+    factors, limit, roots = prime_factors(phi), euler_phi(phi), set()
+    while len(roots) != limit:
+        a = randrange(1, n)
+        if all(pow(a, phi // f, n) != 1 for f in factors):
+            roots.add(a)
+    return sorted(roots)
+
+
+def bench_all_roots(sizes=(10007, 100003, 1000003)):
+    """
+    Compares collecting every primitive root by random sampling with
+    enumerating the powers of the smallest one, and shows how soon the
+    first roots are available.
+    """
+    for n in sizes:
+        start = perf_counter()
+        sampled_roots(n)
+        before = perf_counter() - start
+        start = perf_counter()
+        prim_roots(n, singular=False)
+        after = perf_counter() - start
+        start = perf_counter()
+        list(islice(iter_prim_roots(n), 10))
+        first = perf_counter() - start
+        print(
+            "n = {:>7}\tsampling: {:>6.2f} s\tpowers: {:>5.2f} s\t"
+            "speedup: {:>4.1f}x\tfirst 10 roots: {:.0f} us".format(
+                n, before, after, before / after, first * 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    bench_totient()
+    bench_prim_roots()
+    bench_all_roots()
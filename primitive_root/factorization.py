@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103,C0413
+
+"""factorization.py
+
+Integer factorization for the totient and primitive root computations of
+`primitive_root.py`. Factors in the small-prime table of
+`../mersenne_twister/primality_test.py` are found by trial division, with a
+single GCD per group of primes to skip the groups without any factor;
+whatever remains is split with Pollard's rho method, in Brent's variant
+[1], until every part passes `is_prime`. Factorizations are kept in a
+bounded cache, since the same numbers (such as `p - 1` for a fixed `p`)
+tend to be factored again and again.
+
+The cost of rho grows with the square root of the second largest prime
+factor, so numbers up to 128 bits usually take milliseconds, but a product
+of two primes of 60 bits or more would take hours.
+
+[1] https://doi.org/10.1007/BF01933190
+"""
+
+from __future__ import absolute_import
+from collections import Counter
+from functools import lru_cache
+from math import gcd
+from os.path import abspath, dirname, join
+from random import randrange
+import sys
+
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "mersenne_twister"))
+from primality_test import PRIMORIAL_GROUPS, is_prime
+
+FACTOR_CACHE_SIZE = 1024
+RHO_BATCH = 128
+
+
+def pollard_brent(n, steps=None):
+    """
+    Finds a non-trivial factor of a composite number with Pollard's rho
+    method, iterating `x -> x^2 + c mod n` and detecting cycles modulo a
+    factor with Brent's algorithm. Differences are multiplied together in
+    batches of `RHO_BATCH`, so that a single GCD is taken per batch.
+
+    Args:
+        n:      composite number.
+        steps:  maximum number of iterations, over every choice of `c`;
+                `None` searches until a factor is found.
+
+    Returns:
+        A factor `d` of `n`, with `1 < d < n`, or `None` if none was found
+        within `steps` iterations.
+    """
+    if n % 2 == 0:
+        return 2
+    done = 0
+    while True:
+        y, c = randrange(1, n), randrange(1, n - 1)
+        d, r, product = 1, 1, 1
+        while d == 1:
+            if steps is not None and done >= steps:
+                return None
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and d == 1:
+                saved = y
+                for _ in range(min(RHO_BATCH, r - k)):
+                    y = (y * y + c) % n
+                    product = product * (x - y) % n
+                d = gcd(product, n)
+                k += RHO_BATCH
+            done += 2 * r
+            r *= 2
+        if d == n:
+            # the batch overshot; redo it one step at a time
+            d = 1
+            while d == 1:
+                saved = (saved * saved + c) % n
+                d = gcd(x - saved, n)
+        if d != n:
+            return d
+
+
+def partial_factorize(n, steps=None):
+    """
+    Factors a number as far as `pollard_brent` gets within `steps`
+    iterations for each composite part. Raises `ValueError` if `n` is not
+    positive.
+
+    Args:
+        n:      positive integer.
+        steps:  as described in `pollard_brent`.
+
+    Returns:
+        Tuple of `(prime, exponent)` pairs, sorted by prime, and the product
+        of the composite parts that could not be split (1 if none), which
+        together make up `n`.
+    """
+    if n < 1:
+        raise ValueError("Only positive integers can be factored.")
+    factors, cofactor = Counter(), 1
+    if n % 2 == 0:
+        factors[2] = (n & -n).bit_length() - 1
+        n >>= factors[2]
+    for group, product in PRIMORIAL_GROUPS:
+        if group[0] ** 2 > n:
+            break
+        if gcd(n, product) == 1:
+            continue
+        for p in group:
+            while n % p == 0:
+                n //= p
+                factors[p] += 1
+
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        if is_prime(m):
+            factors[m] += 1
+            continue
+        d = pollard_brent(m, steps)
+        if d is None:
+            cofactor *= m
+        else:
+            pending += [d, m // d]
+    return tuple(sorted(factors.items())), cofactor
+
+
+@lru_cache(maxsize=FACTOR_CACHE_SIZE)
+def factorize(n):
+    """
+    Args:
+        n: positive integer.
+
+    Returns:
+        Tuple of `(prime, exponent)` pairs, sorted by prime, whose product
+        is `n`; empty for 1.
+    """
+    return partial_factorize(n)[0]
@@ -6,10 +6,15 @@
 
 Helper functions used to find primitive roots modulo n, also known as
 generators of the multiplicative group of integers modulo n.
+
+Once the smallest primitive root `g` is found, every other one is `g^k` for
+some `k` coprime to φ(n), so all of them are enumerated lazily with one
+multiplication each, in constant memory.
 """
 
 from __future__ import absolute_import
-from random import randrange
+from math import gcd as _gcd
+from factorization import factorize
 
 
 def gcd(a, b):
@@ -31,7 +36,9 @@ def gcd(a, b):
 def euler_phi(n):
     """
     Euler's totient function (φ(n)); the number of integers in [1, n]
-    such that GCD(n, k) = 1, or the number of coprimes of `n`.
+    such that GCD(n, k) = 1, or the number of coprimes of `n`. It is
+    computed from the factorization of `n`, as the product of
+    `p^(e - 1) * (p - 1)` over its prime powers `p^e`.
 
     Args:
         n: integer that limits the range of coprime counting.
@@ -39,12 +46,15 @@ def euler_phi(n):
     Returns:
         The number of coprimes of `n`.
     """
-    return sum(gcd(i, n) == 1 for i in range(n))
+    phi = 1
+    for p, e in factorize(n):
+        phi *= p ** (e - 1) * (p - 1)
+    return phi
 
 
 def prime_factors(n):
     """
-    Calculates all the prime factors of `n` until its square root is reached.
+    Finds the prime factors of `n` with `factorization.factorize`.
 
     Args:
         n: the number to be factorized.
@@ -52,18 +62,93 @@ def prime_factors(n):
     Returns:
         The sorted list of unique prime factors of `n`.
     """
-    factors = set()
-    i = 2
+    return [p for p, _ in factorize(n)]
+
+
+def root_exponents(n):
+    """
+    Args:
+        n: integer with primitive roots (1, 2, 4, p^k or 2p^k for an odd
+           prime p).
 
-    while i ** 2 <= n:
-        if n % i == 0:
-            n = n // i
-            factors.add(i)
-        else:
-            i += 1
-    factors.add(n)
+    Returns:
+        φ(n), and the exponents φ(n)/q for each prime `q` dividing φ(n),
+        which are all that is needed to test a candidate root.
+    """
+    phi = euler_phi(n)
+    return phi, [phi // q for q in prime_factors(phi)]
 
-    return sorted(factors)
+
+def _is_root(a, n, exponents):
+    """
+    Args:
+        a:          candidate root.
+        n:          the modulus.
+        exponents:  as returned by `root_exponents`.
+
+    Returns:
+        True if `a` is a primitive root modulo `n`.
+    """
+    return _gcd(a, n) == 1 and all(pow(a, e, n) != 1 for e in exponents)
+
+
+def is_primitive_root_many(candidates, n):
+    """
+    Tests many candidates against the same modulus, factoring φ(n) once.
+
+    Args:
+        candidates: iterable of integers.
+        n:          as described in `root_exponents`.
+
+    Returns:
+        List of booleans, True for each candidate that is a primitive root.
+    """
+    _, exponents = root_exponents(n)
+    return [_is_root(a, n, exponents) for a in candidates]
+
+
+def smallest_prim_root(n):
+    """
+    Args:
+        n: as described in `root_exponents`.
+
+    Returns:
+        The smallest primitive root modulo `n`.
+    """
+    _, exponents = root_exponents(n)
+    for a in range(1, n):
+        if _is_root(a, n, exponents):
+            return a
+    raise ValueError("{} has no primitive roots.".format(n))
+
+
+def iter_prim_roots(n, ordered=False):
+    """
+    Lazily enumerates the primitive roots of an integer `n`.
+
+    Args:
+        n:          as described in `root_exponents`.
+        ordered:    whether to yield the roots in increasing order, by
+                    testing every number below `n` in turn; otherwise they
+                    are the powers `g^k` of the smallest root `g`, for
+                    increasing `k` coprime to φ(n), and cost a single
+                    multiplication each.
+
+    Yields:
+        Every primitive root modulo `n`, exactly once.
+    """
+    phi, exponents = root_exponents(n)
+    if ordered:
+        for a in range(1, n):
+            if _is_root(a, n, exponents):
+                yield a
+        return
+
+    g, power = smallest_prim_root(n), 1
+    for k in range(1, phi + 1):
+        power = power * g % n
+        if _gcd(k, phi) == 1:
+            yield power
 
 
 def prim_roots(n, singular=True):
@@ -72,19 +157,12 @@ def prim_roots(n, singular=True):
 
     Args:
         n: prime integer to be operated.
-        singular: a boolean value that nullifies the while and outputs
-                  only the first primitive root found.
+        singular: a boolean value that outputs only the smallest primitive
+                  root instead of all of them.
 
     Returns:
-        One or all of the primitive roots of a number.
+        One or all of the primitive roots of a number, sorted.
     """
-    p = euler_phi(n)
-    factors = prime_factors(p)
-    limit, p_roots = 1 if singular else euler_phi(p), set()
-
-    while len(p_roots) != limit:
-        a = randrange(1, n)
-        if all(pow(a, p // f, n) != 1 for f in factors):
-            p_roots.add(a)
-
-    return sorted(p_roots)
+    if singular:
+        return [smallest_prim_root(n)]
+    return sorted(iter_prim_roots(n))
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103,C0413
+
+"""benchmark.py
+
+Throughput measurements for the RSA implementation within this folder.
+"""
+
+from __future__ import absolute_import
+from os.path import abspath, dirname, join
+from os import cpu_count
+from random import randrange
+from time import perf_counter
+import sys
+
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "mersenne_twister"))
+from primality_test import find_prime
+from rsa import RSA
+
+
+def rate(function, items, repeat=3):
+    """
+    Measures how fast a function processes a list of items.
+
+    Args:
+        function:   callable receiving each item as its only argument.
+        items:      list of inputs.
+        repeat:     number of runs, of which the fastest one is kept.
+
+    Returns:
+        Processed items per second.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, perf_counter() - start)
+    return len(items) / best
+
+
+def make_key(bits, blinding=False):
+    """
+    Args:
+        bits:       size of the modulus.
+        blinding:   as described in `RSA`.
+
+    Returns:
+        A new `RSA` object.
+    """
+    half = bits // 2
+    return RSA(
+        find_prime(half, 1).prime, find_prime(bits - half, 1).prime, blinding
+    )
+
+
+def bench_crt(sizes=(1024, 2048, 3072), count=20):
+    """
+    Compares decryption with the full exponent modulo `n` with the CRT path,
+    with and without blinding.
+    """
+    for bits in sizes:
+        key = make_key(bits)
+        blinded = RSA(key.p, key.q, blinding=True)
+        messages = [key.encrypt(randrange(key.n)) for _ in range(count)]
+        before = rate(lambda c: pow(c, key.d, key.n), messages)
+        after = rate(key.decrypt, messages)
+        with_blinding = rate(blinded.decrypt, messages)
+        print(
+            "RSA-{}\tpow(c, d, n): {:.0f} op/s\tCRT: {:.0f} op/s ({:.1f}x)"
+            "\tCRT with blinding: {:.0f} op/s ({:.1f}x)".format(
+                bits,
+                before,
+                after,
+                after / before,
+                with_blinding,
+                with_blinding / before,
+            )
+        )
+
+
+def bench_blocks(bits=2048, size=1024):
+    """
+    Compares encrypting a text one character at a time with encrypting its
+    bytes in OAEP blocks.
+    """
+    key = make_key(bits)
+    text = "".join(chr(randrange(32, 127)) for _ in range(size))
+    data = text.encode()
+    k = (key.n.bit_length() + 7) // 8
+
+    start = perf_counter()
+    per_char = key.encrypt(text)
+    assert key.decrypt(per_char) == text
+    before = perf_counter() - start
+    start = perf_counter()
+    blocks = key.encrypt(data)
+    assert key.decrypt(blocks) == data
+    after = perf_counter() - start
+
+    print(
+        "RSA-{}, {} B\tper character: {} exps, {} B, {:.2f} s\t"
+        "OAEP blocks: {} exps, {} B, {:.2f} s".format(
+            bits,
+            size,
+            2 * len(per_char),
+            k * len(per_char),
+            before,
+            2 * len(blocks) // k,
+            len(blocks),
+            after,
+        )
+    )
+
+
+def bench_many(bits=2048, count=200):
+    """
+    Compares decrypting one message at a time with `decrypt_many` across
+    different numbers of processes.
+    """
+    key = make_key(bits)
+    messages = [key.encrypt(randrange(key.n)) for _ in range(count)]
+    before = rate(key.decrypt, messages, 1)
+    print("RSA-{}\tdecrypt: {:.0f} op/s".format(bits, before))
+    for workers in sorted({1, 2, cpu_count() or 1}):
+        after = rate(
+            lambda m, w=workers: key.decrypt_many(m, w), [messages], 1
+        )
+        print(
+            "{} worker(s)\tdecrypt_many: {:.0f} op/s ({:.1f}x)".format(
+                workers, after * count, after * count / before
+            )
+        )
+
+
+if __name__ == "__main__":
+    bench_crt()
+    bench_blocks()
+    bench_many()
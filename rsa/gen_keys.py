@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-# pylint: disable=C0103
+# pylint: disable=C0103,C0413
 
 """gen_keys.py
 
@@ -9,40 +9,44 @@ Simple generator for RSA keys, that is, prime numbers that are large enough.
 
 from __future__ import absolute_import
 from datetime import datetime
-from random import getrandbits, randrange
+from os.path import abspath, dirname, join
+import sys
+
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "mersenne_twister"))
+from oaep import HASH_SIZE
+from primality_test import find_prime
 from rsa import RSA
 
+nbits = [2 ** i for i in range(6, 13)]
+
 
-def fermat(n, k):
+def check_round_trip(key):
     """
-    The simplest probabilistic test to check whether a number is prime
-    or not; it verifies the compositeness of the number through modular
-    exponentiation.
+    Encrypts and decrypts a string, an integer and bytes with a key. Bytes
+    need a modulus large enough for OAEP, and must be rejected otherwise.
 
     Args:
-        n: number to test.
-        k: number of times that `n` will be tested for primality.
-
-    Returns:
-        True means "probably prime", whereas False means "composite".
-        Numbers known as Carmichael numbers are examples of false
-        positives to this test.
+        key: RSA object.
     """
-    if n <= 3:
-        return True
-    if n & 1 == 0:
-        return False
-
-    return all(pow(randrange(2, n - 1), n - 1, n) == 1 for _ in range(k))
-
-
-nbits = [2 ** i for i in range(6, 13)]
-start = datetime.now()
-
-for i in nbits:
-    while True:
-        p, q = getrandbits(i), getrandbits(i)
-        if fermat(p, 100) and fermat(q, 100):
-            end = datetime.now()
-            print("Time: {}\tBits: {}\n{}\n".format(end - start, i, RSA(p, q)))
-            break
+    assert key.decrypt(key.encrypt("hello world")) == "hello world"
+    assert key.decrypt(key.encrypt(42)) == 42
+    message = b"hello world" * 20
+    try:
+        assert key.decrypt(key.encrypt(message)) == message
+    except ValueError:
+        assert key.n.bit_length() <= 8 * (2 * HASH_SIZE + 2)
+
+
+def main():
+    """Prints a key pair for each bit length, as they are generated."""
+    start = datetime.now()
+    for i in nbits:
+        p, q = find_prime(i).prime, find_prime(i).prime
+        end = datetime.now()
+        key = RSA(p, q)
+        check_round_trip(key)
+        print("Time: {}\tBits: {}\n{}\n".format(end - start, i, key))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+
+"""oaep.py
+
+Block encryption of byte strings with RSA, padded with OAEP as specified by
+PKCS #1 v2.2 [1] with SHA-256 and MGF1. The plaintext is split in blocks of
+the largest size that fits the modulus (`k - 66` bytes for a modulus of `k`
+bytes), and each block becomes a ciphertext block of exactly `k` bytes, so
+a ciphertext is a plain concatenation of blocks that can be split again
+without any framing. Inputs are consumed and produced incrementally, from
+any iterable of byte strings or from file-like objects.
+
+The functions receive the key as an object with the attributes `n` and `e`
+and, for decryption, a `private` method, such as `RSA` from `rsa.py`.
+
+[1] https://doi.org/10.17487/RFC8017
+"""
+
+from __future__ import absolute_import
+from hashlib import sha256
+from os import urandom
+
+HASH_SIZE = sha256().digest_size
+CHUNK = 1 << 16
+
+
+def mgf1(seed, length):
+    """
+    Mask generation function based on SHA-256.
+
+    Args:
+        seed:   bytes from which the mask is generated.
+        length: length of the mask in bytes.
+
+    Returns:
+        The mask.
+    """
+    mask = b"".join(
+        sha256(seed + i.to_bytes(4, "big")).digest()
+        for i in range(-(-length // HASH_SIZE))
+    )
+    return mask[:length]
+
+
+def xor_bytes(a, b):
+    """
+    Args:
+        a, b: byte strings with the same length.
+
+    Returns:
+        Their bitwise XOR.
+    """
+    size = len(a)
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(
+        size, "big"
+    )
+
+
+def oaep_encode(message, k, label=b""):
+    """
+    Pads a message into an encoded block (EME-OAEP encoding).
+
+    Args:
+        message:    bytes, at most `k - 2 * HASH_SIZE - 2` of them.
+        k:          length of the modulus in bytes.
+        label:      optional label associated with the message.
+
+    Returns:
+        The encoded block, with `k` bytes and a leading zero byte.
+    """
+    padding = k - len(message) - 2 * HASH_SIZE - 2
+    if padding < 0:
+        raise ValueError("Message too long.")
+    block = sha256(label).digest() + bytes(padding) + b"\x01" + message
+    seed = urandom(HASH_SIZE)
+    masked_block = xor_bytes(block, mgf1(seed, len(block)))
+    masked_seed = xor_bytes(seed, mgf1(masked_block, HASH_SIZE))
+    return b"\x00" + masked_seed + masked_block
+
+
+def oaep_decode(encoded, k, label=b""):
+    """
+    Recovers a message from an encoded block (EME-OAEP decoding).
+
+    Args:
+        encoded:    bytes returned by `oaep_encode`.
+        k:          length of the modulus in bytes.
+        label:      label given to `oaep_encode`.
+
+    Returns:
+        The message.
+    """
+    masked_seed = encoded[1 : HASH_SIZE + 1]
+    masked_block = encoded[HASH_SIZE + 1 :]
+    seed = xor_bytes(masked_seed, mgf1(masked_block, HASH_SIZE))
+    block = xor_bytes(masked_block, mgf1(seed, k - HASH_SIZE - 1))
+
+    separator = block.find(b"\x01", HASH_SIZE)
+    valid = (
+        len(encoded) == k
+        and encoded[0] == 0
+        and block[:HASH_SIZE] == sha256(label).digest()
+        and separator >= 0
+        and not any(block[HASH_SIZE:separator])
+    )
+    if not valid:
+        raise ValueError("Decryption error.")
+    return block[separator + 1 :]
+
+
+def block_sizes(key):
+    """
+    Args:
+        key: RSA key.
+
+    Returns:
+        Size of each plaintext block, and of each ciphertext block.
+    """
+    k = (key.n.bit_length() + 7) // 8
+    if k < 2 * HASH_SIZE + 3:
+        raise ValueError("Modulus too small for OAEP")
+    return k - 2 * HASH_SIZE - 2, k
+
+
+def rechunk(chunks, size):
+    """
+    Regroups a stream of byte strings into blocks of a fixed size.
+
+    Args:
+        chunks: iterable of bytes-like objects, of any length.
+        size:   length of each block.
+
+    Yields:
+        Blocks of exactly `size` bytes, except for the last one, which may
+        be shorter (but not empty).
+    """
+    pending = bytearray()
+    for chunk in chunks:
+        pending += chunk
+        whole = len(pending) - len(pending) % size
+        for i in range(0, whole, size):
+            yield bytes(pending[i : i + size])
+        del pending[:whole]
+    if pending:
+        yield bytes(pending)
+
+
+def encrypt_blocks(key, chunks, label=b""):
+    """
+    Encrypts a stream of plaintext, one exponentiation per block.
+
+    Args:
+        key:    RSA key.
+        chunks: iterable of bytes-like objects forming the plaintext.
+        label:  as described in `oaep_encode`.
+
+    Yields:
+        Ciphertext blocks, each with the length of the modulus in bytes.
+    """
+    size, k = block_sizes(key)
+    for block in rechunk(chunks, size):
+        m = int.from_bytes(oaep_encode(block, k, label), "big")
+        yield pow(m, key.e, key.n).to_bytes(k, "big")
+
+
+def decrypt_blocks(key, chunks, label=b""):
+    """
+    Decrypts a stream of ciphertext written by `encrypt_blocks`.
+
+    Args:
+        key:    RSA key with its private part.
+        chunks: iterable of bytes-like objects forming the ciphertext, split
+                at any point.
+        label:  as described in `oaep_encode`.
+
+    Yields:
+        Plaintext blocks.
+    """
+    _, k = block_sizes(key)
+    for block in rechunk(chunks, k):
+        c = int.from_bytes(block, "big")
+        if len(block) != k or c >= key.n:
+            raise ValueError("Decryption error.")
+        yield oaep_decode(key.private(c).to_bytes(k, "big"), k, label)
+
+
+def read_chunks(stream, size=CHUNK):
+    """
+    Args:
+        stream: binary file-like object.
+        size:   length of each read.
+
+    Returns:
+        An iterator over the contents of the stream, `size` bytes at a time.
+    """
+    return iter(lambda: stream.read(size), b"")
+
+
+def encrypt_file(key, source, sink, label=b""):
+    """
+    Encrypts the contents of a binary file-like object into another one.
+
+    Args:
+        key:    RSA key.
+        source: readable binary stream with the plaintext.
+        sink:   writable binary stream for the ciphertext.
+        label:  as described in `oaep_encode`.
+
+    Returns:
+        Number of bytes written.
+    """
+    written = 0
+    for block in encrypt_blocks(key, read_chunks(source), label):
+        written += sink.write(block)
+    return written
+
+
+def decrypt_file(key, source, sink, label=b""):
+    """
+    Decrypts the contents of a binary file-like object written by
+    `encrypt_file` into another one.
+
+    Args:
+        key:    RSA key with its private part.
+        source: readable binary stream with the ciphertext.
+        sink:   writable binary stream for the plaintext.
+        label:  as described in `oaep_encode`.
+
+    Returns:
+        Number of bytes written.
+    """
+    written = 0
+    for block in decrypt_blocks(key, read_chunks(source), label):
+        written += sink.write(block)
+    return written
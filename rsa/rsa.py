@@ -5,8 +5,40 @@
 """rsa.py
 
 Simple class implementation for the RSA public-key cryptosystem.
+
+Private-key operations (decryption and signing) use the Chinese remainder
+theorem: the exponentiation is done modulo `p` and `q` separately, with
+exponents reduced modulo `p - 1` and `q - 1`, and the two halves are joined
+with Garner's formula. Both exponentiations have half the size of the
+modulus, which makes them three to four times faster in total.
+
+Byte strings are encrypted in blocks as large as the modulus allows, padded
+with OAEP; see `oaep.py`.
+
+Batches of messages under the same key are spread across a process pool by
+`encrypt_many`, `decrypt_many` and `sign_many`. The key is sent to each
+worker once, when it starts, and messages are sent in chunks, so that the
+cost of pickling is paid per chunk rather than per message.
 """
 
+from __future__ import absolute_import
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from itertools import islice
+from os import cpu_count
+from secrets import randbelow
+from oaep import decrypt_blocks, encrypt_blocks
+
+# public part of an RSA key, usable wherever only `n` and `e` are needed
+RSAPublicKey = namedtuple("RSAPublicKey", ["n", "e"])
+
+TASKS_PER_WORKER = 4
+DEFAULT_CHUNK = 32
+
+# key used by the tasks of the current worker process, see `RSA.pool`
+_WORKER_KEY = None
+
 
 class RSA:
     """
@@ -21,12 +53,16 @@ class RSA:
     A simple explanation for RSA: http://math.stackexchange.com/a/20193
     """
 
-    def __init__(self, p, q):
+    def __init__(self, p, q, blinding=False):
         """
         Initializes the RSA object with the following attributes:
 
             p, q:  two randomly generated primes with roughly the same size.
                    Should be kept private.
+            blinding: whether private-key operations should be blinded, i.e.
+                      applied to `c * r^e` for a random `r` and multiplied by
+                      `r^(-1)` afterwards, so that their timing does not
+                      depend on the input.
 
         The other attributes are explained below:
 
@@ -40,6 +76,9 @@ class RSA:
                    however it can be any reasonably large coprime to `n`.
             d:     the decryption exponent. It is the modular multiplicative
                    inverse of `e` modulo `phi_n`, Should be kept private.
+            dp, dq, qinv: `d mod (p - 1)`, `d mod (q - 1)` and `q^(-1) mod p`,
+                          used by the private-key operations. Should be kept
+                          private.
         """
         self.p = p
         self.q = q
@@ -47,6 +86,47 @@ class RSA:
         self.phi_n = (self.p - 1) * (self.q - 1)
         self.e = 65537
         self.d = inv_mod(self.e, self.phi_n)
+        self.dp = self.d % (self.p - 1)
+        self.dq = self.d % (self.q - 1)
+        self.qinv = inv_mod(self.q, self.p)
+        self.blinding = blinding
+        self._blinding_pair = None
+
+    @classmethod
+    def from_components(cls, p, q, d, dp, dq, qinv, e=65537, blinding=False):
+        """
+        Creates an RSA object from all of its private parameters, e.g. when
+        loading a stored key, without computing any inverse.
+
+        Args:
+            p, q, d, dp, dq, qinv, e, blinding: as described in `__init__`.
+
+        Returns:
+            The new RSA object.
+        """
+        key = cls.__new__(cls)
+        key.p, key.q, key.n = p, q, p * q
+        key.phi_n = (p - 1) * (q - 1)
+        key.e, key.d, key.dp, key.dq, key.qinv = e, d, dp, dq, qinv
+        key.blinding, key._blinding_pair = blinding, None
+        return key
+
+    def __getstate__(self):
+        """
+        Pickles the key without its blinding pair, so that every process
+        that receives it (e.g. the workers of `pool`) draws its own `r`
+        instead of following the same sequence of blinding factors.
+        """
+        state = dict(self.__dict__)
+        state["_blinding_pair"] = None
+        return state
+
+    def public_key(self):
+        """
+        Returns:
+            An `RSAPublicKey` tuple with `n` and `e`.
+        """
+        return RSAPublicKey(self.n, self.e)
 
     def __str__(self):
         """Pretty-prints the attributes from the RSA object."""
@@ -60,12 +140,16 @@ class RSA:
 
         Args:
             message: a string, that will be decoded to a list of ASCII ordinals
-                     and those will be individually encoded; or an integer
-                     smaller than `n'.
+                     and those will be individually encoded; an integer
+                     smaller than `n'; or bytes, which are encrypted in
+                     OAEP-padded blocks by `oaep.encrypt_blocks`.
 
         Returns:
-            m^e (mod n), where `m` is the message encoded to an integer.
+            m^e (mod n), where `m` is the message encoded to an integer; for
+            bytes, the concatenation of the ciphertext blocks.
         """
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            return b"".join(encrypt_blocks(self, [message]))
         if isinstance(message, str):
             return [pow(ord(i), self.e, self.n) for i in message]
         if isinstance(message, int):
@@ -78,17 +162,229 @@ class RSA:
         Decrypt a message encoded with RSA.
 
         Args:
-            message: a list of ASCII ordinals or an integer.
+            message: a list of ASCII ordinals, an integer, or bytes returned
+                     by `encrypt`.
 
         Returns:
             c^d (mod n), where `c` is the cipher text.
         """
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            return b"".join(decrypt_blocks(self, [message]))
         if isinstance(message, list):
-            return "".join(chr(pow(i, self.d, self.n)) for i in message)
+            return "".join(chr(self.private(i)) for i in message)
         if isinstance(message, int):
-            return pow(message, self.d, self.n)
+            return self.private(message)
         return None
 
+    def private(self, c):
+        """
+        Applies the private key to an integer, through the Chinese remainder
+        theorem.
+
+        Args:
+            c: an integer smaller than `n`.
+
+        Returns:
+            c^d (mod n).
+        """
+        if self.blinding:
+            blind, unblind = self._next_blinding_pair()
+            return self._private_crt(c * blind % self.n) * unblind % self.n
+        return self._private_crt(c)
+
+    def _private_crt(self, c):
+        """
+        Computes c^d (mod n) from c^dp (mod p) and c^dq (mod q), which are
+        recombined by Garner's formula.
+
+        Args:
+            c: an integer smaller than `n`.
+
+        Returns:
+            c^d (mod n).
+        """
+        m_p = pow(c, self.dp, self.p)
+        m_q = pow(c, self.dq, self.q)
+        h = self.qinv * (m_p - m_q) % self.p
+        return m_q + h * self.q
+
+    def _next_blinding_pair(self):
+        """
+        Returns `r^e` and `r^(-1)` modulo `n`. A random `r` is drawn for the
+        first operation; each following one squares both values, which is
+        much cheaper than drawing and inverting a new `r`.
+
+        Returns:
+            The blinding factor and its unblinding counterpart.
+        """
+        if self._blinding_pair is None:
+            r = 2 + randbelow(self.n - 3)
+            self._blinding_pair = (pow(r, self.e, self.n), inv_mod(r, self.n))
+        else:
+            blind, unblind = self._blinding_pair
+            self._blinding_pair = (
+                blind * blind % self.n,
+                unblind * unblind % self.n,
+            )
+        return self._blinding_pair
+
+    def sign(self, message):
+        """
+        Signs a message with the private key.
+
+        Args:
+            message: bytes, which are hashed with SHA-256 first, or an integer
+                     smaller than `n`.
+
+        Returns:
+            m^d (mod n), where `m` is the message (or its hash) as an integer.
+        """
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            message = int.from_bytes(sha256(message).digest(), "big")
+        return self.private(message)
+
+    def verify(self, message, signature):
+        """
+        Checks a signature made by `sign`.
+
+        Args:
+            message:    the signed bytes or integer.
+            signature:  the signature.
+
+        Returns:
+            True if the signature is valid for the message.
+        """
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            message = int.from_bytes(sha256(message).digest(), "big")
+        return pow(signature, self.e, self.n) == message % self.n
+
+    def pool(self, workers=None):
+        """
+        Creates a process pool whose workers hold a copy of this key, which
+        is pickled once per worker. It can be given to the `*_many` methods
+        instead of a number of workers, to avoid starting new processes for
+        every batch.
+
+        Args:
+            workers: number of processes; `None` uses every CPU.
+
+        Returns:
+            A `ProcessPoolExecutor`.
+        """
+        return ProcessPoolExecutor(
+            max_workers=workers or cpu_count(),
+            initializer=_init_worker,
+            initargs=(self,),
+        )
+
+    def _map(self, operation, messages, workers, chunk_size, stream):
+        """
+        Applies a method of the key to every message, in chunks spread
+        across a process pool. At most `TASKS_PER_WORKER` chunks per worker
+        are in flight at any time, so messages are read from the iterable
+        as the results are consumed.
+
+        Args:
+            operation:  name of the method.
+            messages:   iterable of messages.
+            workers:    number of processes, or a pool returned by `pool`,
+                        which is left running; `None` uses every CPU, whereas
+                        1 processes everything in the current process.
+            chunk_size: number of messages sent to a worker at once; by
+                        default, a list of messages is split so that every
+                        worker gets `TASKS_PER_WORKER` chunks.
+            stream:     whether an iterator should be returned instead of a
+                        list.
+
+        Returns:
+            The results, in the same order as the messages.
+        """
+        executor = None
+        if isinstance(workers, ProcessPoolExecutor):
+            executor, workers = workers, None
+        workers = workers or cpu_count() or 1
+        if chunk_size is None and hasattr(messages, "__len__"):
+            chunk_size = -(-len(messages) // (workers * TASKS_PER_WORKER))
+        chunk_size = max(1, chunk_size or DEFAULT_CHUNK)
+
+        if workers == 1 and executor is None:
+            results = map(getattr(self, operation), messages)
+        else:
+            results = self._map_chunks(
+                operation, iter(messages), workers, chunk_size, executor
+            )
+        return results if stream else list(results)
+
+    def _map_chunks(self, operation, messages, workers, chunk_size, executor):
+        """
+        Generator behind `_map` for process pools.
+
+        Args:
+            operation, workers, chunk_size: as described in `_map`.
+            messages:   iterator over the messages.
+            executor:   pool returned by `pool`, or `None` to create one.
+
+        Yields:
+            The results, in the same order as the messages.
+        """
+        owned = executor is None
+        executor = executor or self.pool(workers)
+        try:
+            pending = deque()
+            while True:
+                chunk = list(islice(messages, chunk_size))
+                if chunk:
+                    pending.append(
+                        executor.submit(_apply_chunk, self.n, operation, chunk)
+                    )
+                if not pending:
+                    return
+                if not chunk or len(pending) >= TASKS_PER_WORKER * workers:
+                    yield from pending.popleft().result()
+        finally:
+            if owned:
+                executor.shutdown()
+
+    def encrypt_many(
+        self, messages, workers=None, chunk_size=None, stream=False
+    ):
+        """Applies `encrypt` to many messages, see `_map`."""
+        return self._map("encrypt", messages, workers, chunk_size, stream)
+
+    def decrypt_many(
+        self, messages, workers=None, chunk_size=None, stream=False
+    ):
+        """Applies `decrypt` to many messages, see `_map`."""
+        return self._map("decrypt", messages, workers, chunk_size, stream)
+
+    def sign_many(self, messages, workers=None, chunk_size=None, stream=False):
+        """Applies `sign` to many messages, see `_map`."""
+        return self._map("sign", messages, workers, chunk_size, stream)
+
+
+def _init_worker(key):
+    """Keeps the key sent to a worker process by `RSA.pool`."""
+    global _WORKER_KEY  # pylint: disable=W0603
+    _WORKER_KEY = key
+
+
+def _apply_chunk(n, operation, messages):
+    """
+    Applies a method of the key of the current worker to a chunk of
+    messages.
+
+    Args:
+        n:          modulus of the key the messages are meant for.
+        operation:  name of the method.
+        messages:   list of messages.
+
+    Returns:
+        List of results.
+    """
+    if _WORKER_KEY is None or _WORKER_KEY.n != n:
+        raise ValueError("The pool was created for another key.")
+    return [getattr(_WORKER_KEY, operation)(m) for m in messages]
+
 
 def extended_gcd(a, b):
     """